@@ -7,6 +7,13 @@ This module provides local scrapers for searching jobs on various platforms:
 - Job details extraction and storage
 """
 
-from .linkedin_scraper import LinkedInScraper
-
 __all__ = ["JobSearchManager", "LinkedInScraper"]
+
+
+def __getattr__(name):
+    # Import the LinkedIn scraper (and Playwright with it) only when it is used
+    if name == "LinkedInScraper":
+        from .linkedin_scraper import LinkedInScraper
+
+        return LinkedInScraper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
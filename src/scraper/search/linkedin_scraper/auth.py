@@ -3,14 +3,14 @@ Authentication and CAPTCHA handling for LinkedIn using Playwright.
 """
 
 import asyncio
-import random
 import os
 import logging
 from datetime import datetime
 
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import Page, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 
-from .utils import async_random_sleep, save_screenshot
+from .config import SESSION_STATE_PATH
+from .utils import SLEEP_RNG, async_random_sleep, save_screenshot
 from .extractors.selectors import LOGIN_FORM_SELECTORS, LOGGED_IN_INDICATORS, JOB_LOADING_INDICATORS
 
 logger = logging.getLogger("linkedin_scraper")
@@ -31,10 +31,19 @@ class AuthManager:
         self.timeout = timeout
         self._login_attempted = False
         self._login_successful = False
+        # Pooled tabs may ask at the same time; only one of them logs in
+        self._login_lock = asyncio.Lock()
+        # Bumped by every established login, so a tab can tell whether someone
+        # else already logged in again since it started navigating
+        self.login_generation = 0
 
     async def ensure_login(self, username: str, password: str) -> bool:
         """
         Ensure user is logged in (always required for LinkedIn scraping).
+
+        The outcome is remembered, so only the first call (or the first after
+        invalidate()) touches the page. A session restored from
+        SESSION_STATE_PATH is reused when it is still logged in.
         
         Args:
             username: LinkedIn username
@@ -43,22 +52,101 @@ class AuthManager:
         Returns:
             True if logged in successfully, False if login failed
         """
-        if not self._login_attempted:
-            logger.info("🔐 Attempting LinkedIn login (required for job scraping)...")
-            self._login_successful = await self.login(username, password)
-            self._login_attempted = True
+        async with self._login_lock:
+            return await self._ensure_login_locked(username, password)
 
-            if self._login_successful:
-                logger.info("✅ Successfully logged in to LinkedIn")
-            else:
-                logger.error("❌ Login failed! Cannot proceed without LinkedIn authentication.")
-                raise RuntimeError(
-                    "LinkedIn login is required for job scraping but failed. "
-                    "Please check your credentials in the .env file."
-                )
+    async def relogin(self, username: str, password: str, generation: int) -> bool:
+        """
+        Log in again after a tab was redirected to the login or checkpoint page.
+
+        Tabs redirected at the same time all ask, but only the first one logs in:
+        if the login generation moved past the one the tab started navigating
+        with, another tab already logged in again and its session is reused.
+        The login runs on this manager's page, which the page pool never lends
+        out.
+
+        Args:
+            username: LinkedIn username
+            password: LinkedIn password
+            generation: login_generation read before the tab started navigating
+
+        Returns:
+            True if logged in successfully, False if login failed
+        """
+        async with self._login_lock:
+            if self.login_generation == generation:
+                self.invalidate()
+            return await self._ensure_login_locked(username, password)
+
+    async def _ensure_login_locked(self, username: str, password: str) -> bool:
+        """Body of ensure_login; the caller holds _login_lock."""
+        if self._login_attempted:
+            return self._login_successful
+
+        if await self._restored_session_valid():
+            logger.info("✅ Reusing saved LinkedIn session")
+            self._login_successful = True
+            self._login_attempted = True
+            self.login_generation += 1
+            return True
+
+        logger.info("🔐 Attempting LinkedIn login (required for job scraping)...")
+        self._login_successful = await self.login(username, password)
+        self._login_attempted = True
+
+        if self._login_successful:
+            logger.info("✅ Successfully logged in to LinkedIn")
+            self.login_generation += 1
+            await self._save_session()
+        else:
+            logger.error("❌ Login failed! Cannot proceed without LinkedIn authentication.")
+            raise RuntimeError(
+                "LinkedIn login is required for job scraping but failed. "
+                "Please check your credentials in the .env file."
+            )
 
         return self._login_successful
 
+    def invalidate(self) -> None:
+        """Forget the login state so the next ensure_login checks it again."""
+        self._login_attempted = False
+        self._login_successful = False
+
+    async def _restored_session_valid(self) -> bool:
+        """
+        Check whether a session restored from SESSION_STATE_PATH is still logged in.
+
+        Returns:
+            True if the feed shows the signed-in navigation, False otherwise
+        """
+        if not (SESSION_STATE_PATH and os.path.exists(SESSION_STATE_PATH)):
+            return False
+        try:
+            await self.page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded")
+            await self.page.wait_for_selector(", ".join(LOGGED_IN_INDICATORS), timeout=5000)
+            return True
+        except PlaywrightTimeoutError:
+            logger.info("Saved session has expired, logging in again")
+            return False
+        except PlaywrightError as e:
+            # A failed feed navigation must not prevent the login form fallback
+            logger.info(f"Could not check the saved session ({e}), logging in again")
+            return False
+
+    async def _save_session(self) -> None:
+        """Save the logged-in session to SESSION_STATE_PATH, if configured."""
+        if not SESSION_STATE_PATH:
+            return
+        try:
+            # The file grants access to the account, so it is created readable
+            # by the owner only; chmod also tightens a file left by older runs
+            os.close(os.open(SESSION_STATE_PATH, os.O_CREAT | os.O_WRONLY, 0o600))
+            await self.page.context.storage_state(path=SESSION_STATE_PATH)
+            os.chmod(SESSION_STATE_PATH, 0o600)
+            logger.info(f"Saved session to {SESSION_STATE_PATH}")
+        except Exception as e:
+            logger.warning(f"Could not save session to {SESSION_STATE_PATH}: {e}")
+
     async def login(self, username: str, password: str) -> bool:
         """
         Log in to LinkedIn using credentials.
@@ -89,13 +177,13 @@ class AuthManager:
             # Type like a human - character by character
             for char in username:
                 await username_field.type(char)
-                await asyncio.sleep(random.uniform(0.05, 0.2))
+                await asyncio.sleep(SLEEP_RNG.uniform(0.05, 0.2))
 
             # Clear and type password
             await password_field.fill("")  # Clear the field
             for char in password:
                 await password_field.type(char)
-                await asyncio.sleep(random.uniform(0.05, 0.2))            # Click the login button
+                await asyncio.sleep(SLEEP_RNG.uniform(0.05, 0.2))            # Click the login button
             login_button = await self.page.query_selector(LOGIN_FORM_SELECTORS["submit"])
             await login_button.click()
 
@@ -4,9 +4,11 @@ Browser setup, navigation, retries, and scrolling functionality using Playwright
 
 import asyncio
 import logging
+import os
 import random
+import re
 import sys
-from typing import Optional, List
+from typing import Callable, Optional, List
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
@@ -18,20 +20,61 @@ from .config import (
     SUPPORTED_BROWSERS,
     MAX_RETRIES,
     MAX_SCROLL_ATTEMPTS,
+    SCROLL_PAUSE_MS,
+    SCROLL_STABLE_ITERATIONS,
     NAVIGATION_MIN_SLEEP,
     NAVIGATION_MAX_SLEEP,
     DEFAULT_TIMEOUT,
+    NAVIGATION_TIMEOUT,
+    SESSION_STATE_PATH,
     BROWSER_ARGS,
     ANONYMIZATION_CONFIG,
     USER_AGENTS_POOL,
     TIMEZONE_OPTIONS,
-    LANGUAGE_OPTIONS
+    LANGUAGE_OPTIONS,
+    BLOCK_RESOURCES,
+    BLOCKED_URL_PATTERNS,
+    BLOCKED_RESOURCE_TYPES,
+    BLOCK_STYLESHEETS,
+    PAGE_POOL_MIN_SIZE,
+    PAGE_POOL_MAX_SIZE
 )
-from .utils import async_random_sleep
+from .utils import async_random_sleep, async_retry, is_retryable_response
 from .extractors.selectors import JOB_LIST_CONTAINER_SELECTORS, JOB_CARD_SELECTORS
 
 logger = logging.getLogger("linkedin_scraper")
 
+# Result count heading, e.g. "1,234 results" or "1.234 results"
+RESULTS_COUNT_RE = re.compile(r"(\d[\d,.\s]*)\s+results", re.IGNORECASE)
+# Thousands separators stripped from that count
+NON_DIGIT_RE = re.compile(r"\D")
+
+# Scrolls the job list until its card count stops growing, entirely in-page.
+# Each round brings the last card into view (the page itself when none are
+# rendered yet), lets lazy loading run for pauseMs, then recounts. Stops once
+# the count is unchanged for stableIters rounds or reaches target.
+SCROLL_UNTIL_STABLE_JS = """async (container, { cardSelector, maxIters, pauseMs, stableIters, target }) => {
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    let count = container.querySelectorAll(cardSelector).length;
+    let stable = 0;
+    let iterations = 0;
+    while (iterations < maxIters && stable < stableIters && count < target) {
+        const cards = container.querySelectorAll(cardSelector);
+        if (cards.length) {
+            cards[cards.length - 1].scrollIntoView({ block: "end" });
+        } else {
+            container.scrollTop = container.scrollHeight;
+            window.scrollTo(0, document.body.scrollHeight / 2);
+        }
+        await sleep(pauseMs);
+        iterations += 1;
+        const newCount = container.querySelectorAll(cardSelector).length;
+        stable = newCount === count ? stable + 1 : 0;
+        count = newCount;
+    }
+    return { count: count, iterations: iterations };
+}"""
+
 
 class BrowserManager:
     """Manages browser setup, navigation, and scrolling operations using Playwright."""
@@ -98,6 +141,9 @@ class BrowserManager:
         """Set up the Chromium browser with anonymization and proxy support."""
         # Prepare launch args
         launch_args = BROWSER_ARGS.copy()
+        if BLOCK_RESOURCES:
+            # Skip image decoding even for requests the CDP patterns miss
+            launch_args.append("--blink-settings=imagesEnabled=false")
         
         # Add proxy support if specified
         launch_options = {
@@ -146,7 +192,8 @@ class BrowserManager:
         else:
             context_options["user_agent"] = CHROME_USER_AGENT
         
-        self.context = await self.browser_instance.new_context(**context_options)
+        self.context = await self.browser_instance.new_context(**context_options, **self._stored_session())
+        self._set_default_timeouts()
         
         # Enhanced anonymization scripts
         if self.anonymize:
@@ -159,6 +206,85 @@ class BrowserManager:
                 });            """)
         
         self.page = await self.context.new_page()
+        
+        if BLOCK_RESOURCES:
+            await self._block_unneeded_resources(self.page)
+
+    def _stored_session(self) -> dict:
+        """
+        Context options restoring the saved login session, if there is one.
+
+        Returns:
+            {"storage_state": path} when SESSION_STATE_PATH exists, else {}
+        """
+        if SESSION_STATE_PATH and os.path.exists(SESSION_STATE_PATH):
+            logger.info(f"Restoring saved session from {SESSION_STATE_PATH}")
+            return {"storage_state": SESSION_STATE_PATH}
+        return {}
+
+    def _set_default_timeouts(self) -> None:
+        """
+        Apply the action and navigation timeouts to every page of the context.
+
+        Actions wait up to the manager's timeout; navigations are capped at
+        NAVIGATION_TIMEOUT since a LinkedIn page that has not committed by then
+        is not going to.
+        """
+        self.context.set_default_timeout(self.timeout)
+        self.context.set_default_navigation_timeout(min(self.timeout, NAVIGATION_TIMEOUT))
+
+    async def new_page(self) -> Page:
+        """
+        Open an additional tab in the current browser context.
+        
+        The tab shares the session cookies and gets the same resource blocking
+        as the main page.
+        
+        Returns:
+            The new Page
+        """
+        page = await self.context.new_page()
+        if BLOCK_RESOURCES and self.browser == "chromium":
+            await self._block_unneeded_resources(page)
+        return page
+
+    async def _block_unneeded_resources(self, page: Page) -> None:
+        """
+        Block images, fonts and tracking requests for a Chromium page via CDP.
+        
+        Args:
+            page: Page whose network requests should be filtered
+        """
+        try:
+            cdp_session = await self.context.new_cdp_session(page)
+            await cdp_session.send("Network.enable")
+            await cdp_session.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            logger.info(f"Blocking {len(BLOCKED_URL_PATTERNS)} resource URL patterns")
+        except Exception as e:
+            logger.warning(f"Could not enable resource blocking: {e}")
+
+    async def _route_unneeded_resources(self) -> None:
+        """
+        Abort image, media and font requests for every page of the context.
+        
+        Used for Firefox and WebKit, which cannot block by URL pattern via CDP.
+        Stylesheets are only blocked when BLOCK_STYLESHEETS is set.
+        """
+        blocked_types = set(BLOCKED_RESOURCE_TYPES)
+        if BLOCK_STYLESHEETS:
+            blocked_types.add("stylesheet")
+
+        async def handle_route(route):
+            if route.request.resource_type in blocked_types:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        try:
+            await self.context.route("**/*", handle_route)
+            logger.info(f"Blocking resource types: {', '.join(sorted(blocked_types))}")
+        except Exception as e:
+            logger.warning(f"Could not enable resource blocking: {e}")
 
     async def _setup_firefox_browser(self) -> None:
         """Set up the Firefox browser with anonymization and proxy support."""
@@ -212,7 +338,11 @@ class BrowserManager:
         else:
             context_options["user_agent"] = FIREFOX_USER_AGENT
         
-        self.context = await self.browser_instance.new_context(**context_options)
+        self.context = await self.browser_instance.new_context(**context_options, **self._stored_session())
+        self._set_default_timeouts()
+        
+        if BLOCK_RESOURCES:
+            await self._route_unneeded_resources()
         
         # Enhanced anonymization scripts
         if self.anonymize:
@@ -274,7 +404,11 @@ class BrowserManager:
         else:
             context_options["user_agent"] = WEBKIT_USER_AGENT
         
-        self.context = await self.browser_instance.new_context(**context_options)
+        self.context = await self.browser_instance.new_context(**context_options, **self._stored_session())
+        self._set_default_timeouts()
+        
+        if BLOCK_RESOURCES:
+            await self._route_unneeded_resources()
         
         # Enhanced anonymization scripts
         if self.anonymize:
@@ -291,7 +425,10 @@ class BrowserManager:
 
     async def navigate_to(self, url: str, min_wait: float = NAVIGATION_MIN_SLEEP, max_wait: float = NAVIGATION_MAX_SLEEP) -> None:
         """
-        Navigate to a URL and wait for page load.
+        Navigate to a URL and wait for its DOM to be parsed.
+
+        LinkedIn keeps long-polling requests open, so the full load event is
+        not awaited; callers wait for the elements they read instead.
 
         Args:
             url: URL to navigate to
@@ -299,7 +436,9 @@ class BrowserManager:
             max_wait: Maximum wait time in seconds
         """
         logger.info(f"Navigating to: {url}")
-        await self.page.goto(url, timeout=self.timeout)
+        await async_retry(
+            lambda: self.page.goto(url, wait_until="domcontentloaded"), retry_if=is_retryable_response
+        )
         await async_random_sleep(min_wait, max_wait)
 
     async def handle_rate_limiting(self) -> bool:
@@ -376,10 +515,9 @@ class BrowserManager:
             )
             if total_jobs_element:
                 results_text = await total_jobs_element.text_content()
-                if results_text and "results" in results_text:
-                    total_expected = int(
-                        "".join(filter(str.isdigit, results_text.split("results")[0]))
-                    )
+                match = RESULTS_COUNT_RE.search(results_text or "")
+                if match:
+                    total_expected = int(NON_DIGIT_RE.sub("", match[1]))
                     logger.info(
                         f"Found {total_expected} total jobs according to LinkedIn"
                     )
@@ -429,70 +567,29 @@ class BrowserManager:
             job_list_container: The container element to scroll
             total_expected: Expected total number of jobs
         """
-        scroll_attempts = 0
-        last_job_count = 0
-        stagnant_count = 0
+        job_card_selector = "li[data-occludable-job-id], li.jobs-search-results__list-item, li.scaffold-layout__list-item"
+        try:
+            result = await job_list_container.evaluate(
+                SCROLL_UNTIL_STABLE_JS,
+                {
+                    "cardSelector": job_card_selector,
+                    "maxIters": MAX_SCROLL_ATTEMPTS,
+                    "pauseMs": SCROLL_PAUSE_MS,
+                    "stableIters": SCROLL_STABLE_ITERATIONS,
+                    "target": min(total_expected, 100) if total_expected > 0 else 100,
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Error scrolling job list container: {e}")
+            return
 
-        while scroll_attempts < MAX_SCROLL_ATTEMPTS:
+        count = result["count"]
+        if total_expected > 0 and count >= total_expected:
+            logger.info(f"Found all expected jobs: {count}/{total_expected}")
+        else:
             logger.info(
-                f"Scrolling job list container (attempt {scroll_attempts + 1}/{MAX_SCROLL_ATTEMPTS})"
+                f"Job count settled at {count} job card elements after {result['iterations']} scrolls"
             )
-            
-            # Find all currently loaded job cards
-            job_card_selector = "li[data-occludable-job-id], li.jobs-search-results__list-item, li.scaffold-layout__list-item"
-            job_cards = await job_list_container.query_selector_all(job_card_selector)
-            loaded_count = len(job_cards)
-
-            logger.info(f"Currently have {loaded_count} job card elements (loaded + placeholders)")
-
-            # If no cards found yet, try direct page scroll
-            if loaded_count == 0:
-                await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight / 2);")
-                await async_random_sleep(1.0, 2.0)
-                job_cards = await job_list_container.query_selector_all(job_card_selector)
-                loaded_count = len(job_cards)
-                logger.info(f"After page scroll, found {loaded_count} job card elements")
-
-            # If we've found cards, scroll to the last one to load more
-            if loaded_count > 0:
-                last_card = job_cards[-1]
-                try:
-                    await last_card.scroll_into_view_if_needed()
-                    logger.info(f"Scrolled to job card {loaded_count}")
-                except Exception as e:
-                    logger.warning(f"Error scrolling to last job card: {e}")
-                    try:
-                        await job_list_container.evaluate("el => el.scrollTop = el.scrollHeight")
-                        logger.info("Scrolled job list container directly")
-                    except Exception as container_scroll_error:
-                        logger.warning(f"Error scrolling container: {container_scroll_error}")
-                        await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
-
-            # Wait for new content to load
-            await async_random_sleep(2.0, 3.0)
-            
-            # Count job cards again
-            job_cards = await job_list_container.query_selector_all(job_card_selector)
-            new_count = len(job_cards)
-            logger.info(f"After scrolling, now have {new_count} job card elements")
-
-            # Check if we should stop scrolling
-            if (total_expected > 0 and new_count >= total_expected) or new_count >= 100:
-                logger.info(f"Found all expected jobs: {new_count}/{total_expected}")
-                break
-
-            if new_count == last_job_count:
-                stagnant_count += 1
-                if stagnant_count >= 3:
-                    logger.info(
-                        f"Job count hasn't increased for 3 attempts, stopping at {new_count} jobs"
-                    )
-                    break
-            else:
-                stagnant_count = 0
-
-            last_job_count = new_count
-            scroll_attempts += 1
 
     async def get_job_cards(self, job_list_container):
         """
@@ -612,3 +709,105 @@ class BrowserManager:
         """
         
         await self.context.add_init_script(anonymization_script)
+
+
+class PagePool:
+    """
+    Bounded pool of tabs in the logged-in browser context, reused across jobs.
+
+    Only dedicated tabs are pooled: the manager's main page is used for login,
+    filters and link collection, so it is never handed out or closed. Tabs are
+    opened on demand up to max_size and handed out through an asyncio.Queue
+    free list; they stay open between calls until close() so later batches
+    skip the tab setup. Tabs that crashed or were closed are dropped and their
+    slot is refilled with a new tab.
+    """
+
+    def __init__(self, browser_manager: BrowserManager, min_size: int = PAGE_POOL_MIN_SIZE,
+                 max_size: int = PAGE_POOL_MAX_SIZE,
+                 on_discard: Optional[Callable[[Page], None]] = None):
+        """
+        Initialize the page pool.
+
+        Args:
+            browser_manager: Browser manager whose context the tabs are opened in
+            min_size: Number of tabs opened up front on first use
+            max_size: Maximum number of tabs the pool holds
+            on_discard: Called with each closed tab the pool drops, e.g. to
+                forget per-tab state
+        """
+        self.browser_manager = browser_manager
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.on_discard = on_discard
+        # Free tabs; None wakes a waiter to open a tab in a discarded one's slot
+        self._free: asyncio.Queue = asyncio.Queue()
+        self._opened: List[Page] = []
+        self._size = 0
+
+    async def _open(self) -> Page:
+        """Add a tab to the pool and return it."""
+        # Reserve the slot before awaiting so concurrent callers cannot overshoot
+        self._size += 1
+        try:
+            page = await self.browser_manager.new_page()
+        except Exception:
+            self._size -= 1
+            raise
+        self._opened.append(page)
+        return page
+
+    def _discard(self, page: Page) -> None:
+        """Drop a closed tab from the pool, freeing its slot."""
+        logger.warning("Pooled tab was closed, replacing it")
+        if page in self._opened:
+            self._opened.remove(page)
+        self._size -= 1
+        if self.on_discard:
+            self.on_discard(page)
+
+    async def acquire(self) -> Page:
+        """
+        Take a free tab, opening a new one while the pool is below max_size.
+
+        Returns:
+            A Page that must be handed back with release()
+        """
+        if self._size == 0:
+            for _ in range(self.min_size - 1):
+                self._free.put_nowait(await self._open())
+            return await self._open()
+        while True:
+            if self._free.empty() and self._size < self.max_size:
+                return await self._open()
+            page = await self._free.get()
+            if page is None:
+                continue
+            if not page.is_closed():
+                return page
+            self._discard(page)
+
+    def release(self, page: Page) -> None:
+        """
+        Return a tab to the free list, or drop it if it was closed.
+
+        Args:
+            page: Page obtained from acquire()
+        """
+        if page.is_closed():
+            self._discard(page)
+            # Wake a waiting acquire() so it opens a replacement
+            self._free.put_nowait(None)
+        else:
+            self._free.put_nowait(page)
+
+    async def close(self) -> None:
+        """Close the tabs opened by the pool and reset it."""
+        for page in self._opened:
+            try:
+                await page.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled tab: {e}")
+        self._opened = []
+        self._free = asyncio.Queue()
+        self._size = 0
@@ -6,9 +6,15 @@ import argparse
 import asyncio
 import json
 import os
+import re
 import sys
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     from dotenv import load_dotenv
@@ -19,11 +25,16 @@ except ImportError:
 # Handle both direct execution and module import
 try:
     from .scraper import LinkedInScraper, LinkedInScraperSync
+    from .config import MAX_CONCURRENT_DETAIL_PAGES
 except ImportError:
     # Direct execution - add current directory to path
     current_dir = os.path.dirname(os.path.abspath(__file__))
     sys.path.insert(0, current_dir)
     from scraper import LinkedInScraper, LinkedInScraperSync
+    from config import MAX_CONCURRENT_DETAIL_PAGES
+
+# Anything but letters, digits, spaces, hyphens and underscores is dropped from filenames
+UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w \-]")
 
 
 def parse_experience_levels(experience_str: str) -> List[str]:
@@ -33,6 +44,56 @@ def parse_experience_levels(experience_str: str) -> List[str]:
     return [level.strip() for level in experience_str.split(',') if level.strip()]
 
 
+def write_json(path: str, data) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def to_json_line(data) -> str:
+    """Serialize data as a single JSON line, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False) + "\n"
+
+
+def get_stream_filename(output_file: str) -> str:
+    """Return the JSONL file that job details are streamed to next to output_file."""
+    return f"{os.path.splitext(output_file)[0]}.jsonl"
+
+
+def make_job_streamer(stream, collected: Dict[str, dict]):
+    """
+    Return an on_result callback that appends each finished job to stream as one
+    JSON line and keeps it in collected by URL, so jobs finished before an error
+    are not lost.
+    """
+    def write_job(job_url: str, job_details: dict) -> None:
+        collected[job_url] = job_details
+        stream.write(to_json_line(job_details))
+        stream.flush()
+    return write_job
+
+
+def report_job_details(job_links: List[str], collected: Dict[str, dict], detailed_jobs: List[dict]) -> None:
+    """Print the outcome for each job and collect the extracted details in order."""
+    for i, job_url in enumerate(job_links, 1):
+        print(f"⏳ Job {i}/{len(job_links)}: {job_url}")
+        job_details = collected.get(job_url)
+        if job_details is None:
+            print(f"   ❌ No details extracted for {job_url}")
+            continue
+        detailed_jobs.append(job_details)
+        if job_details.get("error"):
+            print(f"   ❌ Error getting details for {job_url}: {job_details['error']}")
+        else:
+            print(f"   ✅ {job_details.get('title', 'Unknown')} at {job_details.get('company', 'Unknown')}")
+
+
 async def async_main():
     """Async main CLI function."""
     parser = argparse.ArgumentParser(
@@ -93,6 +154,13 @@ Examples:
     parser.add_argument('--proxy', help='Proxy server (e.g., http://proxy:port or socks5://proxy:port)')
     parser.add_argument('--no-anonymize', action='store_true', help='Disable anonymization features (user agent randomization, WebGL blocking, etc.)')
     
+    # Optional job detail sections
+    parser.add_argument('--include-company-info', action='store_true', help='Extract the company info section for each job')
+    parser.add_argument('--no-hiring-team', action='store_true', help='Skip hiring team extraction')
+    parser.add_argument('--no-related-jobs', action='store_true', help='Skip related jobs extraction')
+    parser.add_argument('--concurrency', type=int, default=MAX_CONCURRENT_DETAIL_PAGES,
+                        help=f'Number of job pages to extract at the same time (default: {MAX_CONCURRENT_DETAIL_PAGES})')
+    
     args = parser.parse_args()
     
     # Validate arguments
@@ -125,7 +193,10 @@ async def async_scrape(args, timeout_ms: int):
         timeout=timeout_ms,
         browser=args.browser,
         proxy=args.proxy,
-        anonymize=not args.no_anonymize
+        anonymize=not args.no_anonymize,
+        include_company_info=args.include_company_info,
+        include_hiring_team=not args.no_hiring_team,
+        include_related_jobs=not args.no_related_jobs
     ) as scraper:
         
         if args.job_url:
@@ -142,8 +213,7 @@ async def async_scrape(args, timeout_ms: int):
             
             os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(job_details, f, indent=2, ensure_ascii=False)
+            write_json(output_file, job_details)
             
             print(f"💾 Job details saved to: {output_file}")
             
@@ -192,8 +262,7 @@ async def async_scrape(args, timeout_ms: int):
                 
                 output_file = get_output_filename(args, "links")
                 
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
+                write_json(output_file, results)
                 
                 print(f"💾 Job links saved to: {output_file}")
                 
@@ -201,16 +270,21 @@ async def async_scrape(args, timeout_ms: int):
                 # Get detailed information for each job
                 detailed_jobs = []
                 
-                print(f"📋 Extracting detailed information...")
-                for i, job_url in enumerate(job_links, 1):
-                    print(f"⏳ Getting details for job {i}/{len(job_links)}: {job_url}")
+                output_file = get_output_filename(args, "details")
+                stream_file = get_stream_filename(output_file)
+                
+                print(f"📋 Extracting detailed information ({args.concurrency} at a time)...")
+                collected = {}
+                with open(stream_file, 'w', encoding='utf-8') as stream:
                     try:
-                        job_details = await scraper.get_job_details(job_url)
-                        detailed_jobs.append(job_details)
-                        print(f"   ✅ {job_details.get('title', 'Unknown')} at {job_details.get('company', 'Unknown')}")
+                        await scraper.get_jobs_details(
+                            job_links, args.concurrency, on_result=make_job_streamer(stream, collected)
+                        )
                     except Exception as e:
-                        print(f"   ❌ Error getting details for {job_url}: {e}")
-                        continue
+                        print(f"   ❌ Error getting job details: {e}")
+                        print(f"   Keeping the {len(collected)} jobs extracted before the error")
+                print(f"📝 Jobs streamed to: {stream_file}")
+                report_job_details(job_links, collected, detailed_jobs)
                 
                 # Output results
                 results = {
@@ -233,10 +307,7 @@ async def async_scrape(args, timeout_ms: int):
                     "scraper_version": "playwright"
                 }
                 
-                output_file = get_output_filename(args, "details")
-                
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
+                write_json(output_file, results)
                 
                 print(f"💾 Job details saved to: {output_file}")
                 print(f"🎉 Successfully scraped {len(detailed_jobs)} jobs")
@@ -254,7 +325,10 @@ async def sync_scrape(args, timeout_ms: int):
         timeout=timeout_ms,
         browser=args.browser,
         proxy=args.proxy,
-        anonymize=not args.no_anonymize
+        anonymize=not args.no_anonymize,
+        include_company_info=args.include_company_info,
+        include_hiring_team=not args.no_hiring_team,
+        include_related_jobs=not args.no_related_jobs
     )
     
     try:
@@ -272,8 +346,7 @@ async def sync_scrape(args, timeout_ms: int):
             
             os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(job_details, f, indent=2, ensure_ascii=False)
+            write_json(output_file, job_details)
             
             print(f"💾 Job details saved to: {output_file}")
             
@@ -322,8 +395,7 @@ async def sync_scrape(args, timeout_ms: int):
                 
                 output_file = get_output_filename(args, "links")
                 
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
+                write_json(output_file, results)
                 
                 print(f"💾 Job links saved to: {output_file}")
                 
@@ -331,16 +403,21 @@ async def sync_scrape(args, timeout_ms: int):
                 # Get detailed information for each job
                 detailed_jobs = []
                 
-                print(f"📋 Extracting detailed information...")
-                for i, job_url in enumerate(job_links, 1):
-                    print(f"⏳ Getting details for job {i}/{len(job_links)}: {job_url}")
+                output_file = get_output_filename(args, "details")
+                stream_file = get_stream_filename(output_file)
+                
+                print(f"📋 Extracting detailed information ({args.concurrency} at a time)...")
+                collected = {}
+                with open(stream_file, 'w', encoding='utf-8') as stream:
                     try:
-                        job_details = scraper.get_job_details(job_url)
-                        detailed_jobs.append(job_details)
-                        print(f"   ✅ {job_details.get('title', 'Unknown')} at {job_details.get('company', 'Unknown')}")
+                        scraper.get_jobs_details(
+                            job_links, args.concurrency, on_result=make_job_streamer(stream, collected)
+                        )
                     except Exception as e:
-                        print(f"   ❌ Error getting details for {job_url}: {e}")
-                        continue
+                        print(f"   ❌ Error getting job details: {e}")
+                        print(f"   Keeping the {len(collected)} jobs extracted before the error")
+                print(f"📝 Jobs streamed to: {stream_file}")
+                report_job_details(job_links, collected, detailed_jobs)
                 
                 # Output results
                 results = {
@@ -363,10 +440,7 @@ async def sync_scrape(args, timeout_ms: int):
                     "scraper_version": "playwright-sync"
                 }
                 
-                output_file = get_output_filename(args, "details")
-                
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
+                write_json(output_file, results)
                 
                 print(f"💾 Job details saved to: {output_file}")
                 print(f"🎉 Successfully scraped {len(detailed_jobs)} jobs")
@@ -381,8 +455,8 @@ def get_output_filename(args, file_type: str) -> str:
         return args.output
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_keywords = "".join(c for c in args.keywords if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    safe_location = "".join(c for c in args.location if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    safe_keywords = UNSAFE_FILENAME_CHARS_RE.sub("", args.keywords).rstrip()
+    safe_location = UNSAFE_FILENAME_CHARS_RE.sub("", args.location).rstrip()
     
     # Create output directory
     output_dir = "output/linkedin"
@@ -469,6 +543,13 @@ Examples:
     parser.add_argument('--proxy', help='Proxy server (e.g., http://proxy:port or socks5://proxy:port)')
     parser.add_argument('--no-anonymize', action='store_true', help='Disable anonymization features (user agent randomization, WebGL blocking, etc.)')
     
+    # Optional job detail sections
+    parser.add_argument('--include-company-info', action='store_true', help='Extract the company info section for each job')
+    parser.add_argument('--no-hiring-team', action='store_true', help='Skip hiring team extraction')
+    parser.add_argument('--no-related-jobs', action='store_true', help='Skip related jobs extraction')
+    parser.add_argument('--concurrency', type=int, default=MAX_CONCURRENT_DETAIL_PAGES,
+                        help=f'Number of job pages to extract at the same time (default: {MAX_CONCURRENT_DETAIL_PAGES})')
+    
     args = parser.parse_args()
     args.sync = True  # Force sync mode
     
@@ -2,20 +2,119 @@
 Configuration constants for LinkedIn scraper using Playwright.
 """
 
+import os
+import logging
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer from the environment, warning and using default if it is not one."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logging.getLogger("linkedin_scraper").warning(
+            f"Ignoring {name}={value!r}: not an integer, using {default}"
+        )
+        return default
+
 # Timeout and retry constants
 DEFAULT_TIMEOUT = 20000  # Playwright uses milliseconds
+# Upper bound for a page navigation; LinkedIn answers well within this or not at all
+NAVIGATION_TIMEOUT = 15000
 MAX_RETRIES = 5
 MAX_SCROLL_ATTEMPTS = 20
 
+# Job list scrolling: pause for lazy loading after each scroll (milliseconds)
+# and the number of unchanged card counts that ends the scrolling
+SCROLL_PAUSE_MS = 400
+SCROLL_STABLE_ITERATIONS = 2
+
+# Exponential backoff for transient failures: attempts, first delay and delay cap (seconds)
+RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+# Number of jobs whose scraped details are kept in memory, so a job met again
+# in the same session (overlapping searches, related jobs) is not reloaded
+JOB_DETAILS_CACHE_SIZE = 512
+
+# Number of hosts whose resolved filter selectors are remembered across FilterManagers
+SELECTOR_CACHE_HOSTS = 100
+
+# How long to wait for an apply click to open a tab or redirect (milliseconds)
+APPLY_REDIRECT_TIMEOUT = 5000
+
+# Longest wait for a page to become ready after a click (milliseconds)
+PAGE_READY_TIMEOUT = 5000
+
+# Longest wait for a job page to grow after scrolling to its bottom; lazy
+# sections (hiring team, related jobs) that take longer are not waited for
+LAZY_CONTENT_TIMEOUT = 1500
+
+# Seconds a pagination reading stays valid for the same results URL
+PAGINATION_CACHE_TTL = 2.0
+
+# Number of tabs used to extract job details concurrently
+MAX_CONCURRENT_DETAIL_PAGES = 4
+
+# Bounds of the pool of reusable detail tabs (opened next to the main page);
+# tabs stay open between calls until the scraper is closed
+PAGE_POOL_MIN_SIZE = _env_int("LINKEDIN_PAGE_POOL_MIN_SIZE", 1)
+PAGE_POOL_MAX_SIZE = _env_int("LINKEDIN_PAGE_POOL_MAX_SIZE", MAX_CONCURRENT_DETAIL_PAGES)
+
+# JPEG quality for debug screenshots (much cheaper to encode than PNG)
+SCREENSHOT_QUALITY = 60
+
+# Adaptive pacing of navigations (next page, filter apply): seconds aimed for
+# between consecutive navigations, EWMA weight of the newest latency sample
+# and the +/- jitter fraction applied to each wait
+THROTTLE_TARGET_DELAY = 4.0
+THROTTLE_SMOOTHING = 0.3
+THROTTLE_JITTER = 0.2
+
 # Sleep ranges for human-like behavior
 DEFAULT_MIN_SLEEP = 2.0
 DEFAULT_MAX_SLEEP = 5.0
 NAVIGATION_MIN_SLEEP = 3.0
 NAVIGATION_MAX_SLEEP = 5.0
+# Pause after a page reports ready (next page, filter apply)
+READY_MIN_SLEEP = 0.3
+READY_MAX_SLEEP = 0.8
+
+# File the logged-in session (cookies, local storage) is saved to and restored
+# from, so later runs skip the login form. Empty disables it; the file grants
+# access to the LinkedIn account, so keep it private.
+SESSION_STATE_PATH = os.getenv("LINKEDIN_SESSION_STATE", "")
 
 # Browser configuration
 SUPPORTED_BROWSERS = ["chromium", "firefox", "webkit"]
 
+# Requests matching these patterns are blocked (Chromium only, via CDP) since
+# images, fonts and trackers are not needed for text extraction
+BLOCK_RESOURCES = True
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.woff*",
+    "*.mp4",
+    "*media.licdn.com*",
+    "*doubleclick*",
+    "*google-analytics*",
+    "*linkedin.com/li/track*",
+]
+
+# Firefox and WebKit have no CDP, so requests of these resource types are
+# aborted through context routing instead. Stylesheets stay loaded unless
+# BLOCK_STYLESHEETS is set, as visibility checks rely on computed styles
+BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+BLOCK_STYLESHEETS = False
+
 # Chrome options
 CHROME_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
 
@@ -44,6 +143,12 @@ DATE_POSTED_MAPPING = {
     "past_24_hours": "r86400",
 }
 
+# Sort order mapping (sortBy search parameter)
+SORT_BY_MAPPING = {
+    "relevance": "R",
+    "recent": "DD",
+}
+
 # Experience level display text mapping
 EXPERIENCE_DISPLAY_TEXT = {
     "internship": "Internship",
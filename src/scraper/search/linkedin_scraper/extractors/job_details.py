@@ -3,6 +3,7 @@ Extract job metadata from LinkedIn job detail pages using Playwright.
 """
 
 import re
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -18,12 +19,201 @@ from .selectors import (
     TERTIARY_DESCRIPTION_SELECTORS, TEXT_SPAN_SELECTORS,    HIRING_TEAM_SECTION_SELECTORS, HIRING_MEMBER_SELECTORS, HIRING_NAME_SELECTORS,
     HIRING_TITLE_SELECTORS, HIRING_CONNECTION_SELECTORS, HIRING_PROFILE_LINK_SELECTORS,RELATED_JOBS_SECTION_SELECTORS, RELATED_JOB_CARD_SELECTORS,
     RELATED_JOB_TITLE_SELECTORS, RELATED_JOB_COMPANY_SELECTORS,
-    RELATED_JOB_LOCATION_SELECTORS, RELATED_JOB_DATE_SELECTORS, RELATED_JOB_INSIGHT_SELECTORS
+    RELATED_JOB_LOCATION_SELECTORS, RELATED_JOB_DATE_SELECTORS, RELATED_JOB_INSIGHT_SELECTORS,
+    ADDITIONAL_APPLY_BUTTON_SELECTORS
 )
-from ..utils import async_random_sleep, extract_text_by_selectors
+from ..config import APPLY_REDIRECT_TIMEOUT
+from ..utils import extract_text_by_selectors, fast_text_lookup
 
 logger = logging.getLogger("linkedin_scraper")
 
+# Fields read from each related job card, with the selectors to try for each.
+# Insight selectors have no priority order, so they are probed as one union
+# selector: a single query per card, first visible match in document order.
+RELATED_JOB_FIELD_SELECTORS = {
+    "title": RELATED_JOB_TITLE_SELECTORS,
+    "company": RELATED_JOB_COMPANY_SELECTORS,
+    "location": RELATED_JOB_LOCATION_SELECTORS,
+    "date": RELATED_JOB_DATE_SELECTORS,
+    "insights": [", ".join(RELATED_JOB_INSIGHT_SELECTORS)],
+}
+
+# Company size bullet, e.g. "51-200 employees"
+COMPANY_SIZE_RE = re.compile(r"\d+.*employees?")
+
+# DOM helpers shared by the section scrapers below: the first visible match of a
+# selector list, and the first visible non-empty text of each field in an element
+SECTION_HELPERS_JS = """
+    const visible = (el) => el.getClientRects().length > 0;
+    const queryAll = (root, selector) => {
+        try {
+            return Array.from(root.querySelectorAll(selector));
+        } catch (e) {
+            return [];
+        }
+    };
+    const firstVisible = (root, selectors) => {
+        for (const selector of selectors) {
+            const match = queryAll(root, selector).find(visible);
+            if (match) return match;
+        }
+        return null;
+    };
+    const readFields = (root, fieldSelectors) => {
+        const info = {};
+        for (const [field, selectors] of Object.entries(fieldSelectors)) {
+            search: for (const selector of selectors) {
+                for (const m of queryAll(root, selector)) {
+                    if (!visible(m)) continue;
+                    const text = (m.textContent || "").trim();
+                    if (text) {
+                        info[field] = text;
+                        break search;
+                    }
+                }
+            }
+        }
+        return info;
+    };
+"""
+
+# Reads every visible related job card of the first visible section in one call.
+# Cards matched by several card selectors are returned once, keyed on title and company.
+RELATED_JOBS_JS = (
+    "([sectionSelectors, cardSelectors, fieldSelectors]) => {"
+    + SECTION_HELPERS_JS
+    + """
+    const section = firstVisible(document, sectionSelectors);
+    if (!section) return [];
+    const cards = [];
+    const seen = new Set();
+    for (const cardSelector of cardSelectors) {
+        for (const card of queryAll(section, cardSelector)) {
+            if (!visible(card)) continue;
+            const info = readFields(card, fieldSelectors);
+            const key = JSON.stringify([info.title, info.company]);
+            if (Object.keys(info).length && !seen.has(key)) {
+                seen.add(key);
+                cards.push(info);
+            }
+        }
+    }
+    return cards;
+}"""
+)
+
+# Reads the visible hiring team members of the first visible section in one call.
+# Member layouts are alternatives, so the first one yielding members wins;
+# members are returned once per name.
+HIRING_TEAM_JS = (
+    "([sectionSelectors, memberSelectors, fieldSelectors, linkSelector]) => {"
+    + SECTION_HELPERS_JS
+    + """
+    const section = firstVisible(document, sectionSelectors);
+    if (!section) return [];
+    const team = [];
+    const seen = new Set();
+    for (const memberSelector of memberSelectors) {
+        for (const member of queryAll(section, memberSelector)) {
+            if (!visible(member)) continue;
+            const info = readFields(member, fieldSelectors);
+            const link = queryAll(member, linkSelector)[0];
+            const href = link && link.getAttribute("href");
+            if (href) info.linkedin_url = href;
+            if (info.name && !seen.has(info.name)) {
+                seen.add(info.name);
+                team.push(info);
+            }
+        }
+        if (team.length) break;
+    }
+    return team;
+}"""
+)
+
+# Scrolls an element to the centre of the viewport and clicks it in one round-trip
+SCROLL_AND_CLICK_JS = """(el) => {
+    el.scrollIntoView({ block: "center" });
+    el.click();
+}"""
+
+# A clicked "See more" button is done once it is expanded, removed or hidden
+SEE_MORE_EXPANDED_JS = """(el) => !el.isConnected
+    || el.getAttribute("aria-expanded") === "true"
+    || !el.getClientRects().length"""
+
+# Apply URLs embedded in the page's JSON payloads
+APPLY_URL_RE = re.compile(r'"(?:applyUrl|externalApplyUrl|companyApplyUrl)":"([^"]*)"', re.IGNORECASE)
+
+# Posted-date detection: text with a time keyword that is not an applicant/click count
+DATE_INDICATOR_RE = re.compile(r"ago|hour|day|week|month|year", re.IGNORECASE)
+DATE_EXCLUDE_RE = re.compile(r"clicked|applied|people", re.IGNORECASE)
+
+# Collects the trimmed span and .tvm__text texts of a tertiary container in one call,
+# dropping empty strings and the "·" separators between metadata items
+TERTIARY_TEXTS_JS = """(container) => {
+    const texts = (selector) => Array.from(container.querySelectorAll(selector))
+        .map((el) => (el.textContent || "").trim())
+        .filter((t) => t && t !== "·");
+    return { spans: texts("span"), tvm: texts(".tvm__text") };
+}"""
+
+# Visible, whitespace-normalised texts of every element matching any of the selectors
+VISIBLE_TEXTS_JS = """(selectors) => {
+    const texts = [];
+    for (const selector of selectors) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        for (const el of elements) {
+            if (!el.getClientRects().length) continue;
+            const text = (el.innerText || el.textContent || "").trim().replace(/\\s+/g, " ");
+            if (text) texts.push(text);
+        }
+    }
+    return texts;
+}"""
+
+# Work type preferences: visible <strong> texts, falling back to the container's buttons
+PREFERENCE_TEXTS_JS = """(container) => {
+    const visibleTexts = (selector) => Array.from(container.querySelectorAll(selector))
+        .filter((el) => el.getClientRects().length)
+        .map((el) => (el.textContent || "").trim())
+        .filter((t) => t);
+    const strong = visibleTexts(".tvm__text--low-emphasis strong");
+    return { strong: strong, buttons: strong.length ? [] : visibleTexts("button") };
+}"""
+
+# Classifies apply buttons in-page so the whole scan costs a single round-trip.
+# Top-card specific selectors are tried before the generic button selectors.
+APPLY_BUTTON_INFO_JS = """(selectors) => {
+    for (const selector of selectors) {
+        let buttons;
+        try {
+            buttons = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        for (const b of buttons) {
+            if (!b.offsetParent) continue;
+            const text = (b.innerText || "").trim();
+            const aria = b.getAttribute("aria-label") || "";
+            if (/Apply/.test(text) || /Apply/.test(aria)) {
+                return {
+                    text: text,
+                    aria_label: aria,
+                    href: b.href || "",
+                    easy_apply: /Easy Apply/.test(text) || /Easy Apply/.test(aria),
+                };
+            }
+        }
+    }
+    return null;
+}"""
+
 
 class JobDetailsExtractor:
     """Extracts detailed job information from LinkedIn job pages using Playwright."""
@@ -80,55 +270,35 @@ class JobDetailsExtractor:
             Complete job description text
         """
         try:
-            # Click "See more" button if present
+            # Click "See more" button if present; it returns once the
+            # description has expanded, so no further wait is needed
             see_more_clicked = await self.click_see_more_button()
 
-            if see_more_clicked:
-                logger.info("Description expanded, waiting for content to load")
-                await async_random_sleep(1.5, 2.5)
-
             description_text = "No description available"
 
             # First try to get the complete article element
             for selector in ARTICLE_SELECTORS:
-                try:
-                    article_element = await self.page.query_selector(selector)
-                    if article_element and await article_element.is_visible():
-                        text_content = await article_element.text_content()
-                        if text_content and text_content.strip():
-                            description_text = text_content.strip()
-                            logger.info(f"Successfully extracted full job description ({len(text_content)} characters)")
-                            break
-                except Exception as e:
-                    logger.debug(f"Could not extract article with selector {selector}: {e}")
-                    continue
+                text_content = await fast_text_lookup(self.page, selector)
+                if text_content and text_content.strip():
+                    description_text = text_content.strip()
+                    logger.info(f"Successfully extracted full job description ({len(text_content)} characters)")
+                    break
 
             # Try specific job details selector
             if description_text == "No description available" or len(description_text) < 100:
-                try:
-                    job_details_element = await self.page.query_selector("#job-details")
-                    if job_details_element and await job_details_element.is_visible():
-                        text_content = await job_details_element.text_content()
-                        if text_content and text_content.strip() and len(text_content.strip()) > len(description_text):
-                            description_text = text_content.strip()
-                            logger.info(f"Successfully extracted #job-details text ({len(text_content)} characters)")
-                except Exception as e:
-                    logger.debug(f"Could not extract #job-details element: {e}")
+                text_content = await fast_text_lookup(self.page, "#job-details")
+                if text_content and text_content.strip() and len(text_content.strip()) > len(description_text):
+                    description_text = text_content.strip()
+                    logger.info(f"Successfully extracted #job-details text ({len(text_content)} characters)")
 
             # If we couldn't get the article, try other selectors for just the content
             if description_text == "No description available":
                 for selector in DESCRIPTION_CONTENT_SELECTORS:
-                    try:
-                        content_element = await self.page.query_selector(selector)
-                        if content_element and await content_element.is_visible():
-                            text_content = await content_element.text_content()
-                            if text_content and text_content.strip():
-                                description_text = text_content.strip()
-                                logger.info(f"Extracted job description using selector {selector} ({len(text_content)} characters)")
-                                break
-                    except Exception as e:
-                        logger.debug(f"Error extracting content with selector {selector}: {e}")
-                        continue
+                    text_content = await fast_text_lookup(self.page, selector)
+                    if text_content and text_content.strip():
+                        description_text = text_content.strip()
+                        logger.info(f"Extracted job description using selector {selector} ({len(text_content)} characters)")
+                        break
 
             # Log the result
             if see_more_clicked:
@@ -164,23 +334,17 @@ class JobDetailsExtractor:
                             button_text = button_text.lower()
                             if "see more" in button_text or "show more" in button_text:
                                 logger.info("Found 'See more' button, clicking to expand description")
-                                # Scroll the button into view
-                                await see_more_button.scroll_into_view_if_needed()
-                                await async_random_sleep(1.0, 1.5)
+                                await see_more_button.evaluate(SCROLL_AND_CLICK_JS)
 
-                                # Click the button
+                                # Resume as soon as the description has expanded
                                 try:
-                                    await see_more_button.click()
-                                    logger.info("Successfully clicked 'See more' button")
-                                    await async_random_sleep(2.0, 3.0)
-                                    return True
-                                except Exception as e:
-                                    # If direct click fails, try JavaScript click
-                                    logger.debug(f"Direct click failed, trying JavaScript click: {e}")
-                                    await see_more_button.evaluate("el => el.click()")
-                                    logger.info("Successfully clicked 'See more' button using JavaScript")
-                                    await async_random_sleep(2.0, 3.0)
-                                    return True
+                                    await self.page.wait_for_function(
+                                        SEE_MORE_EXPANDED_JS, arg=see_more_button, polling=100, timeout=5000
+                                    )
+                                except PlaywrightTimeoutError:
+                                    logger.debug("'See more' button did not report expansion in time")
+                                logger.info("Successfully clicked 'See more' button")
+                                return True
             except Exception as e:
                 logger.debug(f"Could not click 'See more' button with selector {selector}: {e}")
                 continue
@@ -203,35 +367,28 @@ class JobDetailsExtractor:
                 try:
                     tertiary_container = await self.page.query_selector(selector)
                     if tertiary_container and await tertiary_container.is_visible():
-                        text_spans = await tertiary_container.query_selector_all("span")
-                        for span in text_spans:
-                            span_text = await span.text_content()
-                            if span_text and span_text.strip():
-                                span_text = span_text.strip()
-                                
-                                # Detect different types of metadata
-                                if any(keyword in span_text.lower() for keyword in ["full-time", "part-time", "contract", "temporary", "internship"]):
-                                    metadata["employment_type"] = span_text
-                                elif any(keyword in span_text.lower() for keyword in ["entry", "senior", "director", "executive", "associate", "mid"]):
-                                    metadata["experience_level"] = span_text
-                                elif any(keyword in span_text.lower() for keyword in ["remote", "hybrid", "on-site"]):
-                                    metadata["work_type"] = span_text
-                                elif re.search(r'\d+.*employees?', span_text.lower()):
-                                    metadata["company_size"] = span_text
-                                elif any(keyword in span_text.lower() for keyword in ["industry", "sector"]):
-                                    metadata["industry"] = span_text
+                        texts = await tertiary_container.evaluate(TERTIARY_TEXTS_JS)
+                        for span_text in texts["spans"]:
+                            # Detect different types of metadata
+                            lowered = span_text.lower()
+                            if any(keyword in lowered for keyword in ["full-time", "part-time", "contract", "temporary", "internship"]):
+                                metadata["employment_type"] = span_text
+                            elif any(keyword in lowered for keyword in ["entry", "senior", "director", "executive", "associate", "mid"]):
+                                metadata["experience_level"] = span_text
+                            elif any(keyword in lowered for keyword in ["remote", "hybrid", "on-site"]):
+                                metadata["work_type"] = span_text
+                            elif COMPANY_SIZE_RE.search(lowered):
+                                metadata["company_size"] = span_text
+                            elif any(keyword in lowered for keyword in ["industry", "sector"]):
+                                metadata["industry"] = span_text
 
                         # Also look for specific class-based elements
-                        text_elements = await tertiary_container.query_selector_all(".tvm__text")
-                        for element in text_elements:
-                            element_text = await element.text_content()
-                            if element_text and element_text.strip():
-                                element_text = element_text.strip()
-                                if element_text not in metadata.values():
-                                    if "employment_type" not in metadata and any(keyword in element_text.lower() for keyword in ["full-time", "part-time", "contract"]):
-                                        metadata["employment_type"] = element_text
-                                    elif "experience_level" not in metadata and any(keyword in element_text.lower() for keyword in ["entry", "senior", "director"]):
-                                        metadata["experience_level"] = element_text
+                        for element_text in texts["tvm"]:
+                            if element_text not in metadata.values():
+                                if "employment_type" not in metadata and any(keyword in element_text.lower() for keyword in ["full-time", "part-time", "contract"]):
+                                    metadata["employment_type"] = element_text
+                                elif "experience_level" not in metadata and any(keyword in element_text.lower() for keyword in ["entry", "senior", "director"]):
+                                    metadata["experience_level"] = element_text
 
                         break
                 except Exception as e:
@@ -248,6 +405,25 @@ class JobDetailsExtractor:
 
         return metadata
 
+    async def extract_apply_button_info(self) -> Optional[Dict[str, Any]]:
+        """
+        Locate the first visible apply button and read its text, aria-label and href.
+
+        The scan runs entirely in the browser with one evaluate call instead of
+        reading every candidate button's attributes through Playwright.
+
+        Returns:
+            Dictionary with text, aria_label, href and easy_apply keys, or None if not found
+        """
+        try:
+            return await self.page.evaluate(
+                APPLY_BUTTON_INFO_JS,
+                ADDITIONAL_APPLY_BUTTON_SELECTORS + APPLY_BUTTON_SELECTORS,
+            )
+        except Exception as e:
+            logger.debug(f"Error extracting apply button info: {e}")
+            return None
+
     async def extract_external_apply_url(self, apply_button: ElementHandle) -> str:
         """
         Extract external application URL from apply button.
@@ -266,36 +442,56 @@ class JobDetailsExtractor:
                 logger.debug(f"Found direct href: {href}")
                 return href
 
-            # Method 2: Click-based extraction (main strategy from Selenium version)
+            # Method 2: Extract from page source, which usually embeds the apply URL
+            try:
+                page_content = await self.page.content()
+
+                for match in APPLY_URL_RE.finditer(page_content):
+                    url = match.group(1)
+                    if url.startswith("http") and "linkedin.com" not in url:
+                        clean_url = url.replace("\\u0026", "&").replace("\\/", "/")
+                        logger.debug(f"Found external URL from page source: {clean_url}")
+                        return clean_url
+
+            except Exception as page_extract_error:
+                logger.debug(f"Page source extraction failed: {page_extract_error}")
+
+            # Method 3: Click-based extraction, only when the non-destructive methods miss
             logger.debug("Attempting click-based extraction...")
             current_url = self.page.url
             
-            # Get current pages/contexts
-            current_pages = self.page.context.pages
-            current_page_count = len(current_pages)
-            
             try:
                 logger.debug(f"Current URL before click: {current_url}")
-                logger.debug(f"Current pages before click: {current_page_count}")
 
-                # Click the apply button
-                await apply_button.click(timeout=5000)
-                await async_random_sleep(3.0, 4.0)  # Give time for redirect
-                
-                new_url = self.page.url
-                new_pages = self.page.context.pages
-                new_page_count = len(new_pages)
-                
-                logger.debug(f"URL after click: {new_url}")
-                logger.debug(f"Pages after click: {new_page_count}")
+                # Listen for a new tab and a same-page navigation before clicking so
+                # whichever happens first resumes the extraction immediately
+                popup_task = asyncio.ensure_future(
+                    self.page.context.wait_for_event("page", timeout=APPLY_REDIRECT_TIMEOUT)
+                )
+                redirect_task = asyncio.ensure_future(
+                    self.page.wait_for_url(lambda url: url != current_url, timeout=APPLY_REDIRECT_TIMEOUT)
+                )
+                try:
+                    await apply_button.click(timeout=5000)
+                    done, _ = await asyncio.wait(
+                        {popup_task, redirect_task}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    for task in (popup_task, redirect_task):
+                        if not task.done():
+                            task.cancel()
+                        elif not task.cancelled():
+                            task.exception()  # Mark timeouts as retrieved
 
                 # Check for new pages/tabs
-                if new_page_count > current_page_count:
+                if popup_task in done and not popup_task.exception():
                     logger.debug("New page/tab detected!")
-                    # Get the new page (last one in the list)
-                    new_page = new_pages[-1]
-                    await async_random_sleep(1.0, 2.0)  # Wait for page to load
-                    
+                    new_page = popup_task.result()
+                    try:
+                        await new_page.wait_for_load_state("domcontentloaded", timeout=APPLY_REDIRECT_TIMEOUT)
+                    except PlaywrightTimeoutError:
+                        pass
+
                     tab_url = new_page.url
                     logger.debug(f"New tab URL: {tab_url}")
 
@@ -308,18 +504,16 @@ class JobDetailsExtractor:
                         await new_page.close()
 
                 # Check for same-page redirect
-                elif new_url != current_url:
+                elif redirect_task in done and not redirect_task.exception():
+                    new_url = self.page.url
                     logger.debug(f"Same-page redirect detected: {new_url}")
+                    # Navigate back to original job page
+                    await self.page.goto(current_url, wait_until='domcontentloaded')
                     if not new_url.startswith("https://www.linkedin.com") and new_url.startswith("http"):
                         logger.debug(f"✅ SUCCESS (redirect): {new_url}")
-                        # Navigate back to original job page
-                        await self.page.goto(current_url, wait_until='domcontentloaded')
-                        await async_random_sleep(1.0, 2.0)
                         return new_url
                     else:
                         logger.debug("Redirected but still on LinkedIn")
-                        await self.page.goto(current_url, wait_until='domcontentloaded')
-                        await async_random_sleep(1.0, 2.0)
                 else:
                     logger.debug("No redirect detected")
 
@@ -329,36 +523,9 @@ class JobDetailsExtractor:
                 try:
                     if self.page.url != current_url:
                         await self.page.goto(current_url, wait_until='domcontentloaded')
-                        await async_random_sleep(1.0, 2.0)
                 except Exception:
                     pass
 
-            # Method 3: Extract from page source as fallback
-            try:
-                page_content = await self.page.content()
-                import re
-
-                patterns = [
-                    rf'"applyUrl":"([^"]*)"',
-                    rf'"externalApplyUrl":"([^"]*)"',
-                    rf'"companyApplyUrl":"([^"]*)"',
-                ]
-
-                for pattern in patterns:
-                    matches = re.findall(pattern, page_content, re.IGNORECASE)
-                    for match in matches:
-                        if (
-                            match
-                            and match.startswith("http")
-                            and "linkedin.com" not in match
-                        ):
-                            clean_url = match.replace("\\u0026", "&").replace("\\/", "/")
-                            logger.debug(f"Found external URL from page source: {clean_url}")
-                            return clean_url
-
-            except Exception as page_extract_error:
-                logger.debug(f"Page source extraction failed: {page_extract_error}")
-
             logger.debug("No external apply URL found using any method")
             return ""
 
@@ -374,16 +541,9 @@ class JobDetailsExtractor:
             Company information text
         """
         try:
-            for selector in COMPANY_INFO_SELECTORS:
-                try:
-                    company_element = await self.page.query_selector(selector)
-                    if company_element and await company_element.is_visible():
-                        company_text = await company_element.text_content()
-                        if company_text and company_text.strip():
-                            return company_text.strip()
-                except Exception as e:
-                    logger.debug(f"Error extracting company info with selector {selector}: {e}")
-                    continue
+            company_text = await extract_text_by_selectors(self.page, COMPANY_INFO_SELECTORS, "company info")
+            if company_text:
+                return company_text
 
             return "No company information available"
 
@@ -398,79 +558,25 @@ class JobDetailsExtractor:
         Returns:
             List of dictionaries containing hiring team member information
         """
-        hiring_team = []
-
         try:
-            for section_selector in HIRING_TEAM_SECTION_SELECTORS:
-                try:
-                    hiring_section = await self.page.query_selector(section_selector)
-                    if not hiring_section or not await hiring_section.is_visible():
-                        continue
-
-                    # Look for individual team members
-                    for member_selector in HIRING_MEMBER_SELECTORS:
-                        try:
-                            members = await hiring_section.query_selector_all(member_selector)
-                            for member in members:
-                                if await member.is_visible():
-                                    member_info = {}
-
-                                    # Extract name
-                                    name = await extract_text_by_selectors(member, HIRING_NAME_SELECTORS, "hiring member name")
-                                    if name:
-                                        member_info["name"] = name
-
-                                    # Extract title
-                                    title = await extract_text_by_selectors(member, HIRING_TITLE_SELECTORS, "hiring member title")
-                                    if title:
-                                        member_info["title"] = title                                    # Extract LinkedIn profile URL
-                                    try:
-                                        profile_link = await member.query_selector(HIRING_PROFILE_LINK_SELECTORS[0])
-                                        if profile_link:
-                                            href = await profile_link.get_attribute("href")
-                                            if href:
-                                                member_info["linkedin_url"] = href
-                                    except Exception:
-                                        pass
-
-                                    # Extract connection degree
-                                    try:
-                                        connection_elem = await member.query_selector(HIRING_CONNECTION_SELECTORS[0])
-                                        if connection_elem and await connection_elem.is_visible():
-                                            connection_text = await connection_elem.text_content()
-                                            if connection_text and connection_text.strip():
-                                                member_info["connection_degree"] = connection_text.strip()
-                                    except Exception:
-                                        pass
-
-                                    # Only add if we have at least a name
-                                    if member_info.get("name"):
-                                        hiring_team.append(member_info)
-
-                        except Exception as e:
-                            logger.debug(f"Error extracting hiring team member with selector {member_selector}: {e}")
-                            continue
-
-                    if hiring_team:
-                        break
-
-                except Exception as e:
-                    logger.debug(f"Error extracting hiring team section with selector {section_selector}: {e}")
-                    continue
+            # Members come back as complete dicts with their profile URL
+            return await self.page.evaluate(
+                HIRING_TEAM_JS,
+                [
+                    HIRING_TEAM_SECTION_SELECTORS,
+                    HIRING_MEMBER_SELECTORS,
+                    {
+                        "name": HIRING_NAME_SELECTORS,
+                        "title": HIRING_TITLE_SELECTORS,
+                        "connection_degree": HIRING_CONNECTION_SELECTORS[:1],
+                    },
+                    HIRING_PROFILE_LINK_SELECTORS[0],
+                ],
+            )
 
         except Exception as e:
             logger.error(f"Error extracting hiring team: {e}")
-
-        # Remove duplicates based on name (same as original Selenium version)
-        seen_names = set()
-        unique_hiring_team = []
-        for member in hiring_team:
-            name = member.get("name", "")
-            if name and name not in seen_names:
-                seen_names.add(name)
-                unique_hiring_team.append(member)
-
-        return unique_hiring_team
+            return []
 
     async def extract_related_jobs(self) -> List[Dict[str, str]]:
         """
@@ -482,58 +588,11 @@ class JobDetailsExtractor:
         related_jobs = []
 
         try:
-            for section_selector in RELATED_JOBS_SECTION_SELECTORS:
-                try:
-                    related_section = await self.page.query_selector(section_selector)
-                    if not related_section or not await related_section.is_visible():
-                        continue
-
-                    # Look for individual job cards
-                    for card_selector in RELATED_JOB_CARD_SELECTORS:
-                        try:
-                            job_cards = await related_section.query_selector_all(card_selector)
-                            for card in job_cards:
-                                if await card.is_visible():
-                                    job_info = {}
-
-                                    # Extract title
-                                    title = await extract_text_by_selectors(card, RELATED_JOB_TITLE_SELECTORS, "related job title")
-                                    if title:
-                                        job_info["title"] = title
-
-                                    # Extract company
-                                    company = await extract_text_by_selectors(card, RELATED_JOB_COMPANY_SELECTORS, "related job company")
-                                    if company:
-                                        job_info["company"] = company
-
-                                    # Extract location
-                                    location = await extract_text_by_selectors(card, RELATED_JOB_LOCATION_SELECTORS, "related job location")
-                                    if location:
-                                        job_info["location"] = location
-
-                                    # Extract date
-                                    date = await extract_text_by_selectors(card, RELATED_JOB_DATE_SELECTORS, "related job date")
-                                    if date:
-                                        job_info["date"] = date
-
-                                    # Extract insights
-                                    insights = await extract_text_by_selectors(card, RELATED_JOB_INSIGHT_SELECTORS, "related job insights")
-                                    if insights:
-                                        job_info["insights"] = insights
-
-                                    if job_info:
-                                        related_jobs.append(job_info)
-
-                        except Exception as e:
-                            logger.debug(f"Error extracting related job card with selector {card_selector}: {e}")
-                            continue
-
-                    if related_jobs:
-                        break
-
-                except Exception as e:
-                    logger.debug(f"Error extracting related jobs section with selector {section_selector}: {e}")
-                    continue
+            # The cards come back as complete, deduplicated dicts
+            related_jobs.extend(await self.page.evaluate(
+                RELATED_JOBS_JS,
+                [RELATED_JOBS_SECTION_SELECTORS, RELATED_JOB_CARD_SELECTORS, RELATED_JOB_FIELD_SELECTORS],
+            ))
 
         except Exception as e:
             logger.error(f"Error extracting related jobs: {e}")
@@ -623,7 +682,7 @@ class JobDetailsExtractor:
                         if text and text.strip():
                             posted_date = text.strip()
                             # Validate it looks like a date (contains time keywords)
-                            if any(keyword in posted_date.lower() for keyword in ["ago", "hour", "day", "week", "month", "year"]):
+                            if DATE_INDICATOR_RE.search(posted_date):
                                 logger.debug(f"Extracted posted date from 3rd span: {posted_date}")
                                 return posted_date
                 
@@ -634,7 +693,7 @@ class JobDetailsExtractor:
                         if text and text.strip():
                             text = text.strip()
                             # Check if this looks like a posted date
-                            if any(keyword in text.lower() for keyword in ["ago", "hour", "day", "week", "month", "year"]) and not any(keyword in text.lower() for keyword in ["clicked", "applied", "people"]):
+                            if DATE_INDICATOR_RE.search(text) and not DATE_EXCLUDE_RE.search(text):
                                 logger.debug(f"Found posted date in span: {text}")
                                 return text
                 
@@ -647,7 +706,7 @@ class JobDetailsExtractor:
                             text = await span.text_content()
                             if text and text.strip():
                                 text = text.strip()
-                                if any(keyword in text.lower() for keyword in ["ago", "hour", "day", "week", "month", "year"]) and not any(keyword in text.lower() for keyword in ["clicked", "applied", "people"]):
+                                if DATE_INDICATOR_RE.search(text) and not DATE_EXCLUDE_RE.search(text):
                                     logger.debug(f"Found posted date in nested span (element {i}): {text}")
                                     return text
                                     
@@ -664,7 +723,7 @@ class JobDetailsExtractor:
                         text = await span.text_content()
                         if text and text.strip():
                             text = text.strip()
-                            if any(keyword in text.lower() for keyword in ["ago", "hour", "day", "week", "month", "year"]):
+                            if DATE_INDICATOR_RE.search(text):
                                 logger.debug(f"Found posted date in subtitle grouping: {text}")
                                 return text
         except Exception as e:
@@ -685,49 +744,38 @@ class JobDetailsExtractor:
             List of job insights including work type preferences
         """
         insight_texts = []
+        seen = set()
         
         # First, try to extract work type preferences from job-details-fit-level-preferences
         try:
             preferences_container = await self.page.query_selector(".job-details-fit-level-preferences")
             if preferences_container:
-                # Look for strong tags within tvm__text--low-emphasis spans
-                strong_elements = await preferences_container.query_selector_all(".tvm__text--low-emphasis strong")
-                for strong in strong_elements:
-                    if await strong.is_visible():
-                        text = await strong.text_content()
-                        if text and text.strip():
-                            cleaned_text = text.strip()
-                            if cleaned_text not in insight_texts:
-                                insight_texts.append(cleaned_text)
-                                logger.debug(f"Extracted work type preference: {cleaned_text}")
+                # Strong tags within tvm__text--low-emphasis spans, with the
+                # container's buttons as fallback, read in a single round-trip
+                preferences = await preferences_container.evaluate(PREFERENCE_TEXTS_JS)
+                for cleaned_text in preferences["strong"]:
+                    if cleaned_text not in seen:
+                        seen.add(cleaned_text)
+                        insight_texts.append(cleaned_text)
+                        logger.debug(f"Extracted work type preference: {cleaned_text}")
                 
-                # Also try buttons in preferences container as fallback
-                if not insight_texts:
-                    buttons = await preferences_container.query_selector_all("button")
-                    for button in buttons:
-                        if await button.is_visible():
-                            text = await button.text_content()
-                            if text and text.strip():
-                                cleaned_text = text.strip()
-                                if cleaned_text not in insight_texts:
-                                    insight_texts.append(cleaned_text)
+                for cleaned_text in preferences["buttons"]:
+                    if cleaned_text not in seen:
+                        seen.add(cleaned_text)
+                        insight_texts.append(cleaned_text)
         except Exception as e:
             logger.debug(f"Error extracting work type preferences: {e}")
         
-        # Then try other job insights selectors
-        for selector in JOB_INSIGHTS_SELECTORS[2:]:  # Skip the first two as they're handled above
-            try:
-                insights = await self.page.query_selector_all(selector)
-                for insight in insights:
-                    if await insight.is_visible():
-                        insight_text = await insight.text_content()
-                        if insight_text and insight_text.strip():
-                            cleaned_text = insight_text.strip()
-                            if cleaned_text not in insight_texts:
-                                insight_texts.append(cleaned_text)
-            except Exception as e:
-                logger.debug(f"Error extracting job insights with selector {selector}: {e}")
-                continue
+        # Then try other job insights selectors, read in a single round-trip
+        try:
+            # Skip the first two selectors as they're handled above
+            texts = await self.page.evaluate(VISIBLE_TEXTS_JS, JOB_INSIGHTS_SELECTORS[2:])
+            for cleaned_text in texts:
+                if cleaned_text not in seen:
+                    seen.add(cleaned_text)
+                    insight_texts.append(cleaned_text)
+        except Exception as e:
+            logger.debug(f"Error extracting job insights: {e}")
         
         if insight_texts:
             logger.debug(f"Extracted job insights: {insight_texts}")
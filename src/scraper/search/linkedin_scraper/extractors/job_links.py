@@ -2,152 +2,212 @@
 Extract job URLs from LinkedIn search results pages using Playwright.
 """
 
+import re
+import time
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
-from playwright.async_api import Page, ElementHandle
+from playwright.async_api import Page, ElementHandle, Error as PlaywrightError
 
 from .selectors import JOB_LINK_SELECTORS, PAGINATION_STATE_SELECTORS, NEXT_BUTTON_SELECTORS, PAGE_BUTTON_SELECTORS
-from ..utils import async_random_sleep
+from ..config import PAGINATION_CACHE_TTL, PAGE_READY_TIMEOUT
+from ..utils import JOB_ID_URL_RE, AdaptiveThrottle, async_retry, fast_text_lookup, wait_for_page_ready
 
 logger = logging.getLogger("linkedin_scraper")
 
+# All job link selectors as one union selector, so each card is queried once
+JOB_LINK_SELECTOR = ", ".join(JOB_LINK_SELECTORS)
+
+# Job ID and first /jobs/view/ link of every card in one round-trip. The first
+# job view anchor is taken directly; the link selectors, then any anchor in the
+# card, are only scanned when a card has none. Cards yielding neither a link nor
+# an ID also report whether they are empty placeholders, plus their class and
+# link count when debug details are requested.
+JOB_CARD_LINKS_JS = """([cards, linkSelector, debug]) => cards.map((card) => {
+    let jobId = card.getAttribute("data-occludable-job-id");
+    if (!jobId) {
+        const container = card.querySelector("[data-job-id]");
+        jobId = container ? container.getAttribute("data-job-id") : null;
+    }
+    let link = card.querySelector('a[href*="/jobs/view/"]');
+    if (!link) {
+        let links = [];
+        try {
+            links = Array.from(card.querySelectorAll(linkSelector));
+        } catch (e) {}
+        if (!links.length) links = Array.from(card.querySelectorAll("a"));
+        link = links.find((a) => (a.getAttribute("href") || "").includes("/jobs/view/"));
+    }
+    const info = { job_id: jobId, href: link ? link.getAttribute("href") : null };
+    if (!link && !jobId) {
+        info.placeholder = card.innerHTML.trim().length < 50;
+        if (debug) {
+            info.cls = card.getAttribute("class") || "";
+            info.links = card.querySelectorAll("a").length;
+        }
+    }
+    return info;
+})"""
+
+# Pagination state text, e.g. "Page 1 of 30" or "Page 2 of 40 · 1,000 results"
+PAGE_STATE_RE = re.compile(r"Page\s+(?P<current>\d+)\s+of\s+(?P<total>\d+)", re.IGNORECASE)
+
+# Class, href, disabled and displayed state of an element in a single round-trip
+ELEMENT_STATE_JS = """(el) => ({
+    cls: el.getAttribute("class") || "",
+    href: el.getAttribute("href"),
+    disabled: el.disabled === true || el.getAttribute("aria-disabled") === "true",
+    displayed: el.getClientRects().length > 0,
+})"""
+
+# Numbers of the visible page buttons, from the first selector that yields any
+PAGE_NUMBERS_JS = """(selectors) => {
+    for (const selector of selectors) {
+        let buttons;
+        try {
+            buttons = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        const numbers = [];
+        for (const button of buttons) {
+            if (!button.getClientRects().length) continue;
+            const text = (button.textContent || "").trim();
+            if (/^\\d+$/.test(text)) numbers.push(parseInt(text, 10));
+        }
+        if (numbers.length) return numbers;
+    }
+    return [];
+}"""
+
+# Resolves true as soon as the pagination state text differs from the previous
+# reading, using a MutationObserver rather than polling; false on timeout
+PAGE_STATE_CHANGED_JS = """([selectors, previous, timeout]) => new Promise((resolve) => {
+    const readState = () => {
+        for (const selector of selectors) {
+            const el = document.querySelector(selector);
+            if (el) return (el.textContent || "").trim();
+        }
+        return "";
+    };
+    const isChanged = () => {
+        const state = readState();
+        return state !== "" && state !== previous;
+    };
+    if (isChanged()) return resolve(true);
+    const observer = new MutationObserver(() => {
+        if (isChanged()) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(false);
+    }, timeout);
+    observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+})"""
+
 
 class JobLinksExtractor:
     """Extracts job links from LinkedIn search results using Playwright."""
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, throttle: Optional[AdaptiveThrottle] = None):
         """
         Initialize job links extractor.
         
         Args:
             page: Playwright Page instance
+            throttle: Throttle pacing navigations, shared with other components
         """
         self.page = page
+        self.throttle = throttle or AdaptiveThrottle()
+        self._last_pagination_info = None
+        self._last_pagination_url = None
+        self._last_pagination_time = 0.0
+        self._last_next_selector = None
 
-    async def extract_job_links_from_cards(self, job_cards: List[ElementHandle], current_page: int) -> set:
+    async def _element_state(self, element: ElementHandle) -> Dict[str, Any]:
+        """
+        Read the class, href, disabled and displayed state of an element at once.
+
+        Args:
+            element: ElementHandle to inspect
+
+        Returns:
+            Dictionary with cls, href, disabled and displayed keys
+        """
+        return await element.evaluate(ELEMENT_STATE_JS)
+
+    def _next_button_selectors(self) -> List[str]:
+        """
+        Return the Next button selectors, trying the last one that matched first.
+
+        Returns:
+            List of CSS selectors
+        """
+        if self._last_next_selector is None:
+            return NEXT_BUTTON_SELECTORS
+        return [self._last_next_selector] + [
+            selector for selector in NEXT_BUTTON_SELECTORS if selector != self._last_next_selector
+        ]
+
+    async def extract_job_links_from_cards(self, job_cards: List[ElementHandle], current_page: int) -> List[str]:
         """
         Extract job links from a list of job card elements.
 
+        All cards are read in a single round-trip; cards whose link has not been
+        rendered yet fall back to a URL built from their job ID.
+
         Args:
             job_cards: List of job card ElementHandles
             current_page: Current page number for logging
 
         Returns:
-            Set of job URLs
+            List of job URLs, one per job ID, in the order LinkedIn ranked them
         """
-        job_links = set()
+        # Keyed by job ID (or the URL when it has none) so the same job reached
+        # through differently shaped URLs is only kept once
+        job_links: Dict[str, str] = {}
         logger.info(f"Processing {len(job_cards)} job cards on page {current_page}")
+        if not job_cards:
+            return []
 
-        processed = 0
-        for card in job_cards:
-            processed += 1
-            if processed % 5 == 0:
-                logger.info(f"Processed {processed}/{len(job_cards)} job cards")
-
-            try:
-                # Make sure the card is in view to load its details
-                try:
-                    await card.scroll_into_view_if_needed()
-                    await async_random_sleep(0.5, 1.0)
-                except Exception as e:
-                    logger.debug(f"Error scrolling to job card {processed}: {e}")
-
-                # Check if this card has data-occludable-job-id attribute
-                job_id = None
-                try:
-                    job_id = await card.get_attribute("data-occludable-job-id")
-                    if job_id:
-                        logger.debug(f"Found card with job ID: {job_id}")
-                    else:
-                        logger.debug(f"Card {processed} has no data-occludable-job-id attribute")
-                except Exception as e:
-                    logger.debug(f"Error getting job ID from card {processed}: {e}")
-
-                # Check if card has data-job-id attribute (alternative format)
-                if not job_id:
-                    try:
-                        job_container = await card.query_selector("[data-job-id]")
-                        if job_container:
-                            job_id = await job_container.get_attribute("data-job-id")
-                            if job_id:
-                                logger.debug(f"Found card with job-id: {job_id}")
-                    except:
-                        pass
-
-                # Try to find the job link inside this card
-                link_elements = []
-                try:
-                    # Try each selector in the list
-                    for selector in JOB_LINK_SELECTORS:
-                        elements = await card.query_selector_all(selector)
-                        link_elements.extend(elements)
-
-                    # If we can't find with specific selectors, get all links
-                    if not link_elements:
-                        link_elements = await card.query_selector_all("a")
-                except Exception as e:
-                    logger.debug(f"Error finding links in card {processed}: {e}")
-
-                # Process all found links to get a job URL
-                url = None
-                logger.debug(f"Card {processed}: Found {len(link_elements)} link elements")
-                for i, link_element in enumerate(link_elements):
-                    try:
-                        href = await link_element.get_attribute("href")
-                        logger.debug(f"  Link {i}: {href}")
-                        if href and "/jobs/view/" in href:
-                            url = href.split("?")[0]  # Remove query parameters
-                            # Convert relative URLs to absolute URLs
-                            if url.startswith("/"):
-                                url = f"https://www.linkedin.com{url}"
-                            logger.debug(f"Found job URL: {url}")
-                            break
-                    except Exception as e:
-                        logger.debug(f"  Error processing link {i}: {e}")
-                        continue
-
-                # If we found a URL, add it to our collection
-                if url:
-                    job_links.add(url)
-                    logger.debug(f"Added job URL to collection: {url}")
-                # If we have a job ID but no URL, construct one
-                elif job_id:
-                    constructed_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
-                    logger.debug(f"Constructed job URL from ID: {constructed_url}")
-                    job_links.add(constructed_url)
-                else:
-                    # Check if this is an empty placeholder card
-                    try:
-                        card_html = await card.inner_html()
-                        if len(card_html.strip()) < 50:
-                            logger.debug(f"Card {processed} appears to be a placeholder (short content)")
-                        else:
-                            logger.warning(
-                                f"Could not extract job link from card {processed} (has content but no extractable URL)"
-                            )
-                            # Log some of the card's structure for debugging
-                            try:
-                                card_class = await card.get_attribute("class") or "no-class"
-                                logger.debug(f"  Card class: {card_class}")
-                                all_links = await card.query_selector_all("a")
-                                logger.debug(f"  Total links in card: {len(all_links)}")
-                                for j, link in enumerate(all_links[:3]):
-                                    try:
-                                        href = await link.get_attribute("href") or "no-href"
-                                        logger.debug(f"    Link {j}: {href}")
-                                    except:
-                                        pass
-                            except Exception as debug_e:
-                                logger.debug(f"  Error debugging card {processed}: {debug_e}")
-                    except Exception as e:
-                        logger.debug(f"Error checking card HTML content: {e}")
-
-            except Exception as e:
-                logger.debug(f"Error processing job card {processed}/{len(job_cards)}: {e}")
-                continue
-
-        return job_links
+        try:
+            cards = await self.page.evaluate(
+                JOB_CARD_LINKS_JS, [job_cards, JOB_LINK_SELECTOR, logger.isEnabledFor(logging.DEBUG)]
+            )
+        except PlaywrightError as e:
+            logger.warning(f"Error reading job cards on page {current_page}: {e}")
+            return []
+
+        for processed, card in enumerate(cards, 1):
+            href = card["href"]
+            job_id = card["job_id"]
+            if href:
+                url = href.split("?")[0]  # Remove query parameters
+                # Convert relative URLs to absolute URLs
+                if url.startswith("/"):
+                    url = f"https://www.linkedin.com{url}"
+                match = JOB_ID_URL_RE.search(url)
+                job_links.setdefault(job_id or (match[1] if match else url), url)
+                logger.debug(f"Added job URL to collection: {url}")
+            # If we have a job ID but no URL, construct one
+            elif job_id:
+                constructed_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
+                logger.debug(f"Constructed job URL from ID: {constructed_url}")
+                job_links.setdefault(job_id, constructed_url)
+            elif card["placeholder"]:
+                logger.debug(f"Card {processed} appears to be a placeholder (short content)")
+            else:
+                logger.warning(
+                    f"Could not extract job link from card {processed} (has content but no extractable URL)"
+                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"  Card class: {card['cls'] or 'no-class'}, total links in card: {card['links']}")
+
+        return list(job_links.values())
 
     async def get_pagination_info(self) -> Dict[str, Any]:
         """
@@ -156,6 +216,14 @@ class JobLinksExtractor:
         Returns:
             Dictionary containing current page, total pages, and next page availability
         """
+        # Reuse a reading taken moments ago on the same results page
+        if (
+            self._last_pagination_info is not None
+            and self._last_pagination_url == self.page.url
+            and time.monotonic() - self._last_pagination_time < PAGINATION_CACHE_TTL
+        ):
+            return dict(self._last_pagination_info)
+
         pagination_info = {
             "current_page": 1,
             "total_pages": 1,
@@ -167,56 +235,45 @@ class JobLinksExtractor:
             # Extract pagination state text (e.g., "Page 1 of 30")
             for selector in PAGINATION_STATE_SELECTORS:
                 try:
-                    page_state_element = await self.page.query_selector(selector)
-                    if page_state_element and await page_state_element.is_visible():
-                        page_state = await page_state_element.text_content()
-                        if page_state:
-                            page_state = page_state.strip()
-                            pagination_info["page_state"] = page_state
-
-                            # Parse "Page X of Y" format
-                            if "Page" in page_state and "of" in page_state:
-                                parts = page_state.split()
-                                try:
-                                    current_page = int(parts[1])
-                                    total_pages = int(parts[3])
-                                    pagination_info["current_page"] = current_page
-                                    pagination_info["total_pages"] = total_pages
-                                    logger.debug(f"Extracted pagination: Page {current_page} of {total_pages}")
-                                except (IndexError, ValueError) as e:
-                                    logger.debug(f"Could not parse pagination numbers: {e}")
-                            break
+                    page_state = await fast_text_lookup(self.page, selector)
+                    if page_state:
+                        page_state = page_state.strip()
+                        pagination_info["page_state"] = page_state
+
+                        # Parse "Page X of Y" format
+                        match = PAGE_STATE_RE.search(page_state)
+                        if match:
+                            current_page = int(match["current"])
+                            total_pages = int(match["total"])
+                            pagination_info["current_page"] = current_page
+                            pagination_info["total_pages"] = total_pages
+                            logger.debug(f"Extracted pagination: Page {current_page} of {total_pages}")
+                        else:
+                            logger.debug(f"Could not parse pagination state: {page_state}")
+                        break
                 except Exception:
                     continue
 
             # Check if "Next" button is available and enabled
-            for selector in NEXT_BUTTON_SELECTORS:
+            for selector in self._next_button_selectors():
                 try:
                     next_button = await self.page.query_selector(selector)
-                    if next_button and await next_button.is_visible() and await next_button.is_enabled():
-                        class_attr = await next_button.get_attribute("class") or ""
-                        if "disabled" not in class_attr:
+                    if next_button:
+                        state = await self._element_state(next_button)
+                        if state["displayed"] and not state["disabled"] and "disabled" not in state["cls"]:
                             pagination_info["has_next"] = True
+                            self._last_next_selector = selector
                             logger.debug("Next button is available and enabled")
                             break
                 except Exception:
                     continue
 
-            # Get list of available page numbers
+            # Get list of available page numbers in one round-trip
             page_buttons = []
-            for selector in PAGE_BUTTON_SELECTORS:
-                try:
-                    buttons = await self.page.query_selector_all(selector)
-                    for button in buttons:
-                        if await button.is_visible():
-                            button_text = await button.text_content()
-                            if button_text and button_text.strip().isdigit():
-                                page_buttons.append(int(button_text.strip()))
-                    if page_buttons:
-                        break
-                except Exception as e:
-                    logger.debug(f"Could not extract page buttons: {e}")
-                    continue
+            try:
+                page_buttons = await self.page.evaluate(PAGE_NUMBERS_JS, PAGE_BUTTON_SELECTORS)
+            except PlaywrightError as e:
+                logger.debug(f"Could not extract page buttons: {e}")
 
             if page_buttons:
                 pagination_info["available_pages"] = sorted(page_buttons)
@@ -225,6 +282,10 @@ class JobLinksExtractor:
         except Exception as e:
             logger.debug(f"Error extracting pagination info: {e}")
 
+        self._last_pagination_info = dict(pagination_info)
+        self._last_pagination_url = self.page.url
+        self._last_pagination_time = time.monotonic()
+
         return pagination_info
 
     async def go_to_next_page(self) -> bool:
@@ -236,21 +297,34 @@ class JobLinksExtractor:
         """
         try:
             next_clicked = False
-            for selector in NEXT_BUTTON_SELECTORS:
+            for selector in self._next_button_selectors():
                 try:
                     next_buttons = await self.page.query_selector_all(selector)
                     for next_button in next_buttons:
-                        if await next_button.is_visible() and await next_button.is_enabled():
-                            class_attr = await next_button.get_attribute("class") or ""
-                            if "disabled" not in class_attr:
+                        state = await self._element_state(next_button)
+                        if state["displayed"] and not state["disabled"]:
+                            if "disabled" not in state["cls"]:
                                 # Scroll to make the button visible
                                 await next_button.scroll_into_view_if_needed()
-                                await async_random_sleep(1.0, 2.0)
+                                await self.throttle.wait()
 
-                                await next_button.click()
+                                previous_state = (await self.get_pagination_info())["page_state"]
+                                started = time.monotonic()
+                                await async_retry(next_button.click)
                                 logger.info("Clicked next page button")
                                 next_clicked = True
-                                await async_random_sleep(3.0, 5.0)
+                                self._last_next_selector = selector
+                                self._last_pagination_info = None
+
+                                # Results are swapped in place without a navigation, so wait
+                                # for the page state text to change rather than a load event
+                                changed = await self.page.evaluate(
+                                    PAGE_STATE_CHANGED_JS,
+                                    [PAGINATION_STATE_SELECTORS, previous_state, PAGE_READY_TIMEOUT],
+                                )
+                                if not changed:
+                                    await wait_for_page_ready(self.page)
+                                self.throttle.record(time.monotonic() - started)
 
                                 # Verify we're on the next page
                                 new_pagination_info = await self.get_pagination_info()
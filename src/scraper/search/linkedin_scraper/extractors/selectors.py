@@ -342,6 +342,55 @@ JOB_LOADING_INDICATORS = [
 EXPERIENCE_FILTER_SELECTOR = '.search-reusables__filter-trigger-and-dropdown[data-basic-filter-parameter-name="experience"] button'
 TIME_POSTED_FILTER_SELECTOR = '.search-reusables__filter-trigger-and-dropdown[data-basic-filter-parameter-name="timePostedRange"] button'
 
+# Filter bar buttons that open each filter dropdown
+EXPERIENCE_FILTER_BUTTON_SELECTORS = [
+    'button[id="searchFilter_experience"]',
+    'button[aria-label*="Experience level filter"]',
+    EXPERIENCE_FILTER_SELECTOR,
+]
+
+DATE_POSTED_FILTER_BUTTON_SELECTORS = [
+    'button[id="searchFilter_timePostedRange"]',
+    'button[aria-label*="Date posted filter"]',
+    TIME_POSTED_FILTER_SELECTOR,
+]
+
+# Opened filter dropdown
+FILTER_DROPDOWN_SELECTORS = [
+    ".artdeco-hoverable-content--visible .reusable-search-filters-trigger-dropdown__container",
+    "fieldset.reusable-search-filters-trigger-dropdown__container",
+    ".artdeco-hoverable-content--visible fieldset",
+]
+
+# Buttons inside an opened filter dropdown or modal, in order of preference
+APPLY_FILTER_BUTTON_SELECTORS = [
+    'button.artdeco-button--primary[aria-label*="Apply current filter"]',
+    'button.artdeco-button--primary[aria-label*="Show"]',
+    ".reusable-search-filters-buttons button.artdeco-button--primary",
+    'button[class*="artdeco-button--primary"][aria-label*="Show"]',
+    'button[class*="artdeco-button--primary"]',
+    'button[type="submit"]',
+]
+
+CANCEL_FILTER_BUTTON_SELECTORS = [
+    'button[aria-label*="Cancel Experience level filter"]',
+    'button[aria-label*="Cancel Date posted filter"]',
+    'button[aria-label*="Cancel"]',
+    ".reusable-search-filters-buttons button.artdeco-button--tertiary",
+    'button[class*="artdeco-button--tertiary"]',
+]
+
+# "All filters" button and the modal it opens, which holds every filter at once
+ALL_FILTERS_BUTTON_SELECTORS = [
+    'button[aria-label*="Show all filters"]',
+    "button.search-reusables__all-filters-pill-button",
+]
+
+ALL_FILTERS_MODAL_SELECTORS = [
+    ".artdeco-modal[role='dialog']",
+    "[role='dialog'][aria-labelledby*='filter']",
+]
+
 # Additional date posted selectors
 ADDITIONAL_POSTED_DATE_SELECTORS = [
     ".jobs-details-top-card__posted-date",
@@ -394,3 +443,68 @@ ADDITIONAL_COMPANY_WEBSITE_SELECTORS = [
     ".jobs-company__content a[href*='http']",
     ".jobs-company-information a[href*='http']",
 ]
+
+# Top card selectors used by the direct job details extraction
+TOP_CARD_TITLE_SELECTORS = [
+    ".job-details-jobs-unified-top-card__job-title h1",
+    ".jobs-unified-top-card__job-title h1",
+    "h1.t-24",
+    "main h1",
+]
+
+# Top card company link selectors
+TOP_CARD_COMPANY_SELECTORS = [
+    ".job-details-jobs-unified-top-card__company-name a",
+    ".jobs-unified-top-card__company-name a",
+    'a.ember-view[href*="/company/"]',
+]
+
+# Top card description selectors
+TOP_CARD_DESCRIPTION_SELECTORS = [
+    ".jobs-description__content",
+    ".jobs-box__html-content",
+    "article.jobs-description",
+    ".job-details-jobs-unified-top-card__job-description",
+    'div[class*="description"] article',
+]
+
+# Top card location selectors
+TOP_CARD_LOCATION_SELECTORS = [
+    ".job-details-jobs-unified-top-card__bullet",
+    ".jobs-unified-top-card__bullet",
+    "span.jobs-unified-top-card__workplace-type",
+]
+
+# Top card posted date selectors
+TOP_CARD_DATE_SELECTORS = [
+    "span.jobs-unified-top-card__posted-date",
+    'span[class*="posted"]',
+]
+
+# Similar jobs list card selectors
+SIMILAR_JOB_TITLE_SELECTORS = [
+    ".artdeco-entity-lockup__title strong",
+    ".job-card-job-posting-card-wrapper__title strong",
+    ".artdeco-entity-lockup__title",
+    ".job-card-job-posting-card-wrapper__title",
+]
+
+# Similar jobs list company selectors
+SIMILAR_JOB_COMPANY_SELECTORS = [
+    ".artdeco-entity-lockup__subtitle",
+    ".job-card-job-posting-card-wrapper__subtitle",
+]
+
+# Similar jobs list location selectors
+SIMILAR_JOB_LOCATION_SELECTORS = [
+    ".artdeco-entity-lockup__caption",
+    ".job-card-job-posting-card-wrapper__caption",
+]
+
+# "Show more" buttons expanded before extracting job details. Plain CSS, as
+# they are matched in the page; buttons are also matched by the texts below
+SHOW_MORE_BUTTON_SELECTORS = [
+    'button[aria-label*="Show more"]',
+    "button.jobs-description__footer-button",
+]
+SHOW_MORE_BUTTON_TEXTS = ["Show more", "See more"]
@@ -2,31 +2,253 @@
 Search filters and query helpers for LinkedIn job search using Playwright.
 """
 
+import asyncio
+import time
 import logging
-from typing import List, Optional
-
-from playwright.async_api import Page, ElementHandle, TimeoutError as PlaywrightTimeoutError
-
-from .config import EXPERIENCE_LEVEL_MAPPING, DATE_POSTED_MAPPING, EXPERIENCE_DISPLAY_TEXT, DATE_DISPLAY_TEXT
-from .utils import async_random_sleep
-from .extractors.selectors import EXPERIENCE_FILTER_SELECTOR, TIME_POSTED_FILTER_SELECTOR
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from playwright.async_api import Page, ElementHandle, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+from .config import (
+    EXPERIENCE_LEVEL_MAPPING, DATE_POSTED_MAPPING, EXPERIENCE_DISPLAY_TEXT, DATE_DISPLAY_TEXT, SELECTOR_CACHE_HOSTS
+)
+from .utils import AdaptiveThrottle, async_retry, wait_for_element, wait_for_page_ready
+from .extractors.selectors import (
+    EXPERIENCE_FILTER_BUTTON_SELECTORS, DATE_POSTED_FILTER_BUTTON_SELECTORS, FILTER_DROPDOWN_SELECTORS,
+    ALL_FILTERS_BUTTON_SELECTORS, ALL_FILTERS_MODAL_SELECTORS, APPLY_FILTER_BUTTON_SELECTORS,
+    CANCEL_FILTER_BUTTON_SELECTORS
+)
 
 logger = logging.getLogger("linkedin_scraper")
 
+# Input names LinkedIn has used for each filter's options
+EXPERIENCE_NAME_PATTERNS = ("experience-level-filter-value", "experience", "experienceLevel")
+DATE_NAME_PATTERNS = ("timePostedRange", "date-posted-filter-value", "datePosted", "timePosted")
+
+
+def unique_texts(*texts: Optional[str]) -> tuple:
+    """Drop empty texts and those differing only in case, as text= matching ignores case."""
+    unique = {}
+    for text in texts:
+        if text:
+            unique.setdefault(text.casefold(), text)
+    return tuple(unique.values())
+
+
+@lru_cache(maxsize=64)
+def experience_display_variants(level: str) -> tuple:
+    """Label texts to try when matching an experience level option by text."""
+    return unique_texts(EXPERIENCE_DISPLAY_TEXT.get(level.lower()), level.title())
+
+
+@lru_cache(maxsize=64)
+def date_display_variants(date_posted: str) -> tuple:
+    """Label texts to try when matching a date posted option by text."""
+    return unique_texts(DATE_DISPLAY_TEXT.get(date_posted.lower()), date_posted.replace("_", " ").title())
+
+
+@lru_cache(maxsize=64)
+def resolve_experience_levels(experience_levels: tuple) -> Tuple[tuple, tuple]:
+    """
+    Map experience levels to LinkedIn option values once per distinct combination.
+
+    Args:
+        experience_levels: Experience levels as given by the caller
+
+    Returns:
+        ((level, value) pairs without duplicate values, levels that map to no option)
+    """
+    resolved, invalid, seen = [], [], set()
+    for level in experience_levels:
+        value = EXPERIENCE_LEVEL_MAPPING.get(level.lower())
+        if value is None:
+            invalid.append(level)
+        elif value not in seen:
+            seen.add(value)
+            resolved.append((level, value))
+    return tuple(resolved), tuple(invalid)
+
+
+# Selects the options with the given input ids inside a filter dropdown in one
+# call, clicking the label (or the input) of each visible, unchecked option.
+# Returns the ids that were found; the rest go through the slower fallbacks.
+SELECT_OPTIONS_JS = """(container, ids) => ids.filter((id) => {
+    const input = container.querySelector(`[id="${id}"]`);
+    if (!input || !input.getClientRects().length) return false;
+    if (!input.checked) {
+        const label = container.querySelector(`label[for="${id}"]`);
+        (label || input).click();
+    }
+    return true;
+})"""
+
+# True once every given option input in the dropdown reports checked
+OPTIONS_CHECKED_JS = """([container, ids]) => ids.every((id) => {
+    const input = container.querySelector(`[id="${id}"]`);
+    return !input || input.checked;
+})"""
+
+# Finds a checkbox or radio option by exact id, then by name/value pattern,
+# then by partial value or id, and ticks it through its label when unchecked.
+# Returns whether a visible option was found.
+SELECT_OPTION_JS = """(root, { id, value, patterns, type }) => {
+    const visible = (el) => !!el && el.getClientRects().length > 0;
+    const byId = root.querySelector(`[id="${id}"]`);
+    const option = (visible(byId) && byId)
+        || patterns.map((name) => root.querySelector(`input[name="${name}"][value="${value}"]`)).find(visible)
+        || [...root.querySelectorAll(`input[type="${type}"][value*="${value}"], input[type="${type}"][id*="${value}"]`)].find(visible);
+    if (!option) return false;
+    if (!option.checked) {
+        const label = option.id && root.querySelector(`label[for="${option.id}"]`);
+        (label || option).click();
+    }
+    return true;
+}"""
+
+# Returns the first visible, enabled button matching the selectors (in order)
+# whose text matches the optional case-insensitive pattern, or null
+FIND_BUTTON_JS = """(root, { selectors, text }) => {
+    const pattern = text ? new RegExp(text, "i") : null;
+    for (const selector of selectors) {
+        for (const button of root.querySelectorAll(selector)) {
+            if (!button.getClientRects().length || button.disabled) continue;
+            if (!pattern || pattern.test(button.textContent || "")) return button;
+        }
+    }
+    return null;
+}"""
+
+# Opens a filter dropdown, ticks the given option ids and clicks its apply
+# button in one call. Gives up (without applying) as soon as the dropdown or any
+# option is missing, leaving the rest to the step-by-step path. "clicked" says
+# whether the dropdown trigger was clicked and may need closing.
+APPLY_FILTER_JS = """async ({ buttonSelectors, dropdownSelectors, optionIds, applySelectors, timeout }) => {
+    const sleep = () => new Promise((resolve) => setTimeout(resolve, 50));
+    const visible = (el) => !!el && el.getClientRects().length > 0;
+    const first = (selectors) => selectors.map((selector) => document.querySelector(selector)).find(visible);
+    const until = async (predicate) => {
+        const deadline = Date.now() + timeout;
+        let value = predicate();
+        while (!value && Date.now() < deadline) {
+            await sleep();
+            value = predicate();
+        }
+        return value;
+    };
+
+    const trigger = first(buttonSelectors);
+    if (!trigger) return { clicked: false, applied: false };
+    trigger.click();
+
+    const container = await until(() => {
+        const el = first(dropdownSelectors);
+        return el && el.querySelector("input[type='checkbox'], input[type='radio']") ? el : null;
+    });
+    if (!container) return { clicked: true, applied: false };
+
+    const inputs = optionIds.map((id) => container.querySelector(`[id="${id}"]`));
+    if (!inputs.every(visible)) return { clicked: true, applied: false };
+    for (const input of inputs) {
+        if (!input.checked) (container.querySelector(`label[for="${input.id}"]`) || input).click();
+    }
+    if (!(await until(() => inputs.every((input) => input.checked)))) {
+        return { clicked: true, applied: false };
+    }
+
+    for (const selector of applySelectors) {
+        for (const button of container.querySelectorAll(selector)) {
+            if (visible(button) && !button.disabled && /show|apply|done|submit/i.test(button.textContent || "")) {
+                button.click();
+                return { clicked: true, applied: true };
+            }
+        }
+    }
+    return { clicked: true, applied: false };
+}"""
+
+# Returns the first of the given selectors that the element matches, or null
+MATCHING_SELECTOR_JS = """(el, selectors) => selectors.find((selector) => {
+    try {
+        return el.matches(selector);
+    } catch (e) {
+        return false;
+    }
+}) || null"""
+
 
 class FilterManager:
     """Manages LinkedIn search filters using Playwright."""
+
+    # Selector variant (or dropdown close strategy) that worked last time for
+    # each lookup, per host. The markup does not change within a session, so it
+    # is tried first; shared by all instances and bounded to recent hosts
+    _resolved_selectors_by_host: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
     
-    def __init__(self, page: Page, timeout: int = 20000):
+    def __init__(self, page: Page, timeout: int = 20000, throttle: Optional[AdaptiveThrottle] = None):
         """
         Initialize filter manager.
         
         Args:
             page: Playwright Page instance
             timeout: Timeout for filter operations in milliseconds
+            throttle: Throttle pacing navigations, shared with other components
         """
         self.page = page
         self.timeout = timeout
+        self.throttle = throttle or AdaptiveThrottle()
+        # Filter bar buttons found on the current results URL; applying a
+        # filter changes the URL, which invalidates them
+        self._filter_buttons: Dict[str, ElementHandle] = {}
+        self._filter_buttons_url: Optional[str] = None
+
+    def build_filter_params(
+        self,
+        experience_levels: Optional[List[str]] = None,
+        date_posted: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Map filter options to LinkedIn search URL query parameters.
+
+        Args:
+            experience_levels: List of experience levels to filter by
+            date_posted: Date posted filter option
+
+        Returns:
+            Query parameters, e.g. {"f_E": "2,3", "f_TPR": "r604800"}
+        """
+        params = {}
+
+        if experience_levels:
+            levels, invalid = resolve_experience_levels(tuple(experience_levels))
+            for level in invalid:
+                logger.warning(f"Invalid experience level: {level}")
+            if levels:
+                params["f_E"] = ",".join(value for _, value in levels)
+
+        if date_posted and date_posted.lower() != "any_time":
+            value = DATE_POSTED_MAPPING.get(date_posted.lower())
+            if value:
+                params["f_TPR"] = value
+            else:
+                logger.warning(f"Invalid date posted option: {date_posted}")
+
+        return params
+
+    def url_filters_applied(self, params: Dict[str, str]) -> bool:
+        """
+        Check that the loaded results page kept the given filter query parameters.
+
+        Args:
+            params: Query parameters from build_filter_params
+
+        Returns:
+            bool: True if every parameter is present in the current URL
+        """
+        query = parse_qs(urlparse(self.page.url).query)
+        return all(query.get(name, [""])[0] == value for name, value in params.items())
 
     async def apply_search_filters(
         self,
@@ -43,20 +265,92 @@ class FilterManager:
         Returns:
             bool: True if all filters were applied successfully, False otherwise
         """
+        # Both filters live in the "All filters" modal, where they are applied
+        # with a single results reload instead of one per dropdown
+        if experience_levels and date_posted and date_posted.lower() != "any_time":
+            if await self._apply_filters_in_modal(experience_levels, date_posted):
+                return True
+            logger.info("Falling back to applying filters one dropdown at a time")
+
         success = True
 
+        # Each filter is retried once with backoff; selecting an option is
+        # idempotent, so a retry only re-opens the dropdown
         # Apply experience level filter
         if experience_levels:
-            if not await self.apply_experience_level_filter(experience_levels):
+            if not await async_retry(
+                lambda: self.apply_experience_level_filter(experience_levels),
+                attempts=2,
+                retry_if=lambda applied: not applied,
+            ):
                 success = False
 
         # Apply date posted filter
         if date_posted:
-            if not await self.apply_date_posted_filter(date_posted):
+            if not await async_retry(
+                lambda: self.apply_date_posted_filter(date_posted),
+                attempts=2,
+                retry_if=lambda applied: not applied,
+            ):
                 success = False
 
         return success
 
+    async def _apply_filters_in_modal(self, experience_levels: List[str], date_posted: str) -> bool:
+        """
+        Select experience levels and date posted together in the "All filters" modal.
+
+        Args:
+            experience_levels: List of experience levels to filter by
+            date_posted: Date posted filter option
+
+        Returns:
+            bool: True if every option was selected and the modal applied, False otherwise
+        """
+        # Modal input ids carry an "advanced-filter-" prefix over the dropdown ones
+        options = {
+            f"advanced-filter-experience-{value}": (level, value, self._select_checkbox)
+            for level, value in resolve_experience_levels(tuple(experience_levels))[0]
+        }
+        date_value = DATE_POSTED_MAPPING.get(date_posted.lower())
+        if date_value:
+            options[f"advanced-filter-timePostedRange-{date_value}"] = (date_posted, date_value, self._select_radio_button)
+        if not options:
+            return False
+
+        try:
+            button = await self._first_matching("all filters", ALL_FILTERS_BUTTON_SELECTORS)
+            if not button:
+                logger.debug("All filters button not found")
+                return False
+            logger.info("Applying search filters through the all filters modal")
+            await button.click(timeout=5000)
+            modal = await self._first_matching("all filters modal", ALL_FILTERS_MODAL_SELECTORS)
+            if not modal:
+                logger.warning("The all filters modal did not appear")
+                return False
+
+            selected_ids = await self._select_options(modal, list(options))
+            for option_id, (name, value, select) in options.items():
+                if option_id not in selected_ids and not await select(modal, option_id, name, value):
+                    logger.warning(f"Could not select {name} in the all filters modal")
+                    await self._close_dropdown(modal)
+                    return False
+
+            await self._wait_for_checked(modal, list(options))
+            # Without a "Show results" button, success is only reported once
+            # the results URL carries the filters; otherwise the dropdown
+            # path runs
+            confirm_params = self.build_filter_params(experience_levels, date_posted)
+            if await self._apply_filter(modal, len(options), confirm_params):
+                return True
+            await self._close_dropdown(modal)
+            return False
+
+        except Exception as e:
+            logger.warning(f"Failed to apply filters through the all filters modal: {e}")
+            return False
+
     async def apply_experience_level_filter(self, experience_levels: List[str]) -> bool:
         """
         Apply experience level filter with robust error handling and fallback strategies.
@@ -71,55 +365,34 @@ class FilterManager:
             return True
 
         try:
-            logger.info(f"Applying experience level filter: {experience_levels}")            # Find and click the experience level filter button
-            experience_button_selectors = [
-                'button[id="searchFilter_experience"]',
-                'button[aria-label*="Experience level filter"]',
-                EXPERIENCE_FILTER_SELECTOR,
-            ]
-
-            experience_button = None
-            for selector in experience_button_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    experience_button = await self.page.query_selector(selector)
-                    if experience_button:
-                        logger.debug(f"Found experience button with selector: {selector}")
-                        break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if not experience_button:
-                logger.warning("Could not find experience level filter button")
-                return False
+            logger.info(f"Applying experience level filter: {experience_levels}")
 
-            # Click to open the dropdown
-            await experience_button.click()
-            await async_random_sleep(1.0, 2.0)
+            # Map each level to its checkbox id and value
+            levels, invalid = resolve_experience_levels(tuple(experience_levels))
+            for level in invalid:
+                logger.warning(f"Invalid experience level: {level}")
+            options = {f"experience-{value}": (level, value) for level, value in levels}
 
-            # Wait for dropdown and get container
-            dropdown_container = await self._get_dropdown_container()
+            if options and await self._apply_filter_in_page(
+                EXPERIENCE_FILTER_BUTTON_SELECTORS, list(options), "experience level"
+            ):
+                return True
+
+            dropdown_container = await self._open_filter(EXPERIENCE_FILTER_BUTTON_SELECTORS, "experience level")
             if not dropdown_container:
-                logger.warning("Experience level dropdown did not appear")
                 return False
 
-            await async_random_sleep(1.0, 1.5)
-
-            # Select experience levels with robust fallback
+            # Tick all checkboxes found by id at once, with robust fallback for the rest
+            selected_ids = await self._select_options(dropdown_container, list(options))
             selections_made = 0
-            for level in experience_levels:
-                if level.lower() in EXPERIENCE_LEVEL_MAPPING:
-                    value = EXPERIENCE_LEVEL_MAPPING[level.lower()]
-                    checkbox_id = f"experience-{value}"
-
-                    if await self._select_checkbox(dropdown_container, checkbox_id, level, value):
-                        selections_made += 1
-                        logger.debug(f"Selected experience level: {level}")
-                        await async_random_sleep(0.5, 1.0)
-                    else:
-                        logger.warning(f"Could not select experience level: {level}")
+            for checkbox_id, (level, value) in options.items():
+                if checkbox_id in selected_ids or await self._select_checkbox(dropdown_container, checkbox_id, level, value):
+                    selections_made += 1
+                    logger.debug(f"Selected experience level: {level}")
                 else:
-                    logger.warning(f"Invalid experience level: {level}")
+                    logger.warning(f"Could not select experience level: {level}")
+            if selections_made:
+                await self._wait_for_checked(dropdown_container, list(options))
 
             if selections_made == 0:
                 logger.warning("No experience level selections were made")
@@ -149,53 +422,31 @@ class FilterManager:
             return True
 
         try:
-            logger.info(f"Applying date posted filter: {date_posted}")            # Find and click the date posted filter button
-            date_button_selectors = [
-                'button[id="searchFilter_timePostedRange"]',
-                'button[aria-label*="Date posted filter"]',
-                TIME_POSTED_FILTER_SELECTOR,
-            ]
-
-            date_button = None
-            for selector in date_button_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    date_button = await self.page.query_selector(selector)
-                    if date_button:
-                        logger.debug(f"Found date button with selector: {selector}")
-                        break
-                except PlaywrightTimeoutError:
-                    continue
-
-            if not date_button:
-                logger.warning("Could not find date posted filter button")
+            logger.info(f"Applying date posted filter: {date_posted}")
+            value = DATE_POSTED_MAPPING.get(date_posted.lower())
+            if value is None:
+                logger.warning(f"Invalid date posted option: {date_posted}")
                 return False
 
-            # Click to open the dropdown
-            await date_button.click()
-            await async_random_sleep(1.0, 2.0)
+            radio_id = f"timePostedRange-{value}"
+            if await self._apply_filter_in_page(
+                DATE_POSTED_FILTER_BUTTON_SELECTORS, [radio_id], "date posted"
+            ):
+                return True
 
-            # Wait for the dropdown to appear
-            dropdown_container = await self._get_dropdown_container()
+            dropdown_container = await self._open_filter(DATE_POSTED_FILTER_BUTTON_SELECTORS, "date posted")
             if not dropdown_container:
-                logger.warning("Date posted dropdown container did not appear")
                 return False
 
-            await async_random_sleep(1.0, 1.5)
-
             # Select the specified date option
-            if date_posted.lower() in DATE_POSTED_MAPPING:
-                value = DATE_POSTED_MAPPING[date_posted.lower()]
-                radio_id = f"timePostedRange-{value}"
-
-                if await self._select_radio_button(dropdown_container, radio_id, date_posted, value):
-                    logger.info(f"Selected date posted option: {date_posted}")
-                    await async_random_sleep(0.5, 1.0)
-                else:
-                    logger.warning(f"Could not find or select radio button for date: {date_posted}")
-                    return False
+            if (
+                radio_id in await self._select_options(dropdown_container, [radio_id])
+                or await self._select_radio_button(dropdown_container, radio_id, date_posted, value)
+            ):
+                logger.info(f"Selected date posted option: {date_posted}")
+                await self._wait_for_checked(dropdown_container, [radio_id])
             else:
-                logger.warning(f"Invalid date posted option: {date_posted}")
+                logger.warning(f"Could not find or select radio button for date: {date_posted}")
                 return False
 
             # Apply the filter
@@ -205,118 +456,212 @@ class FilterManager:
             logger.error(f"Failed to apply date posted filter: {e}")
             return False
 
-    async def _get_dropdown_container(self) -> Optional[ElementHandle]:
-        """Get the dropdown container element."""
-        dropdown_selectors = [
-            ".artdeco-hoverable-content--visible .reusable-search-filters-trigger-dropdown__container",
-            "fieldset.reusable-search-filters-trigger-dropdown__container",
-            ".artdeco-hoverable-content--visible fieldset",
-        ]
+    async def _apply_filter_in_page(self, button_selectors: List[str], option_ids: List[str], filter_name: str) -> bool:
+        """
+        Open a filter, tick its options and apply it within a single evaluate call.
+
+        Args:
+            button_selectors: Alternative selectors for the filter button
+            option_ids: Input ids of the options to select
+            filter_name: Name of the filter for logging
+
+        Returns:
+            bool: True if the filter was applied; otherwise any opened dropdown
+            is closed again for the step-by-step path
+        """
+        await self.throttle.wait()
+        started = time.monotonic()
+        try:
+            result = await self.page.evaluate(APPLY_FILTER_JS, {
+                "buttonSelectors": button_selectors,
+                "dropdownSelectors": FILTER_DROPDOWN_SELECTORS,
+                "optionIds": option_ids,
+                "applySelectors": APPLY_FILTER_BUTTON_SELECTORS,
+                "timeout": 3000,
+            })
+        except PlaywrightError as e:
+            logger.debug(f"In-page {filter_name} filter failed: {e}")
+            return False
+
+        if not result["applied"]:
+            logger.debug(f"In-page {filter_name} filter incomplete, applying step by step")
+            if result["clicked"]:
+                try:
+                    await self.page.keyboard.press("Escape")
+                except PlaywrightError:
+                    pass
+            return False
+
+        await wait_for_page_ready(self.page)
+        self.throttle.record(time.monotonic() - started)
+        logger.info(f"Applied {filter_name} filter with {len(option_ids)} selections")
+        return True
+
+    async def _get_filter_button(self, button_selectors: List[str], filter_name: str) -> Optional[ElementHandle]:
+        """
+        Find a filter bar button, reusing the handle found earlier on the same results URL.
+
+        Args:
+            button_selectors: Alternative selectors for the button
+            filter_name: Name of the filter, used as cache key and in logs
 
-        for selector in dropdown_selectors:
+        Returns:
+            The button ElementHandle, or None if it did not appear
+        """
+        if self._filter_buttons_url != self.page.url:
+            self._filter_buttons = {}
+            self._filter_buttons_url = self.page.url
+
+        button = self._filter_buttons.get(filter_name)
+        if button is None:
+            button = await self._first_matching(filter_name, button_selectors)
+            if button:
+                logger.debug(f"Found {filter_name} filter button")
+                self._filter_buttons[filter_name] = button
+        return button
+
+    def _resolved_selectors(self) -> Dict[str, str]:
+        """Return the resolved selector cache for the current page's host."""
+        host = urlparse(self.page.url).netloc
+        cache = FilterManager._resolved_selectors_by_host
+        if host in cache:
+            cache.move_to_end(host)
+        else:
+            cache[host] = {}
+            if len(cache) > SELECTOR_CACHE_HOSTS:
+                cache.popitem(last=False)
+        return cache[host]
+
+    async def _first_matching(self, key: str, selectors: List[str], timeout: int = 5000) -> Optional[ElementHandle]:
+        """
+        Wait for the first of several alternative selectors, trying the one that matched last time first.
+
+        Args:
+            key: Cache key for the lookup
+            selectors: Alternative selectors for the element
+            timeout: Timeout in milliseconds when waiting for any alternative
+
+        Returns:
+            The matched ElementHandle, or None if none appeared in time
+        """
+        resolved = self._resolved_selectors()
+        cached = resolved.get(key)
+        if cached:
+            handle = await wait_for_element(self.page, cached, timeout=500)
+            if handle:
+                return handle
+            del resolved[key]
+
+        # One wait for whichever alternative renders first
+        handle = await wait_for_element(self.page, ", ".join(selectors), timeout=timeout)
+        if handle:
             try:
-                await self.page.wait_for_selector(selector, timeout=5000)
-                
-                # Additional wait for the content to be fully rendered
-                await self.page.wait_for_selector(
-                    f"{selector} input[type='checkbox'], {selector} input[type='radio']",
-                    timeout=3000
+                matched = await handle.evaluate(MATCHING_SELECTOR_JS, selectors)
+            except PlaywrightError:
+                matched = None
+            if matched:
+                resolved[key] = matched
+        return handle
+
+    async def _open_filter(self, button_selectors: List[str], filter_name: str) -> Optional[ElementHandle]:
+        """
+        Click a filter bar button and return the dropdown it opens.
+
+        Args:
+            button_selectors: Alternative selectors for the filter button
+            filter_name: Name of the filter for logging
+
+        Returns:
+            The opened dropdown container, or None if it could not be opened
+        """
+        button = await self._get_filter_button(button_selectors, filter_name)
+        if not button:
+            logger.warning(f"Could not find {filter_name} filter button")
+            return None
+
+        # Click to open the dropdown
+        try:
+            await button.click(timeout=5000)
+        except PlaywrightError as e:
+            # The cached handle went stale after a re-render; look it up again
+            logger.debug(f"Cached {filter_name} filter button unusable, re-resolving: {e}")
+            self._filter_buttons.pop(filter_name, None)
+            button = await self._get_filter_button(button_selectors, filter_name)
+            if not button:
+                logger.warning(f"Could not find {filter_name} filter button")
+                return None
+            await button.click(timeout=5000)
+
+        # Wait for dropdown and its options instead of a fixed pause
+        dropdown_container = await self._get_dropdown_container()
+        if not dropdown_container:
+            logger.warning(f"The {filter_name} dropdown did not appear")
+            return None
+
+        return dropdown_container
+
+    async def _get_dropdown_container(self) -> Optional[ElementHandle]:
+        """Get the dropdown container element."""
+        try:
+            # Wait for whichever dropdown variant renders, then for the options
+            # inside that container rather than anywhere on the page
+            dropdown_container = await self._first_matching("dropdown", FILTER_DROPDOWN_SELECTORS)
+            if dropdown_container:
+                await dropdown_container.wait_for_selector(
+                    "input[type='checkbox'], input[type='radio']", timeout=3000
                 )
-                
-                dropdown_container = await self.page.query_selector(selector)
-                if dropdown_container:
-                    logger.debug(f"Dropdown container found with selector: {selector}")
-                    return dropdown_container
-            except PlaywrightTimeoutError:
-                continue
+        except PlaywrightTimeoutError:
+            return None
 
-        return None
+        if dropdown_container:
+            logger.debug("Dropdown container found")
+        return dropdown_container
+
+    async def _select_options(self, dropdown_container: ElementHandle, option_ids: List[str]) -> List[str]:
+        """
+        Select several dropdown options by input id in a single round-trip.
+
+        Args:
+            dropdown_container: The opened filter dropdown
+            option_ids: Input ids of the checkboxes or radio buttons to select
+
+        Returns:
+            Ids of the options that were found and are now selected
+        """
+        if not option_ids:
+            return []
+        try:
+            return await dropdown_container.evaluate(SELECT_OPTIONS_JS, option_ids)
+        except PlaywrightError as e:
+            logger.debug(f"Batch option selection failed, falling back per option: {e}")
+            return []
+
+    async def _wait_for_checked(self, dropdown_container: ElementHandle, option_ids: List[str]) -> None:
+        """
+        Wait until the selected options report checked before applying the filter.
+
+        Options missing from the dropdown are ignored, as the fallback strategies
+        may have ticked a differently named input.
+
+        Args:
+            dropdown_container: The opened filter dropdown
+            option_ids: Input ids of the options that were selected
+        """
+        try:
+            await self.page.wait_for_function(
+                OPTIONS_CHECKED_JS, arg=[dropdown_container, option_ids], polling="raf", timeout=2000
+            )
+        except PlaywrightError as e:
+            logger.debug(f"Selected options not confirmed as checked: {e}")
 
     async def _select_checkbox(self, dropdown_container: ElementHandle, checkbox_id: str, level: str, value: str) -> bool:
         """Select a checkbox in the dropdown with multiple fallback strategies."""
         try:
-            # Strategy 1: Find by exact ID
-            try:
-                checkbox = await dropdown_container.query_selector(f"#{checkbox_id}")
-                if checkbox and await checkbox.is_visible():
-                    if not await checkbox.is_checked():
-                        # Try clicking the associated label first
-                        try:
-                            label = await dropdown_container.query_selector(f'label[for="{checkbox_id}"]')
-                            if label:
-                                await label.click()
-                            else:
-                                await checkbox.click()
-                        except:
-                            # Fallback to clicking checkbox directly
-                            await checkbox.click()
-                    return True
-            except:
-                pass
-
-            # Strategy 2: Find by value attribute with various name patterns
-            name_patterns = [
-                'experience-level-filter-value',
-                'experience',
-                'experienceLevel'
-            ]
-            
-            for name_pattern in name_patterns:
-                try:
-                    checkbox = await dropdown_container.query_selector(f"input[name='{name_pattern}'][value='{value}']")
-                    if checkbox and await checkbox.is_visible() and not await checkbox.is_checked():
-                        await checkbox.click()
-                        return True
-                except:
-                    continue
-
-            # Strategy 3: Find by visible text content (case-insensitive)
-            display_texts = [
-                EXPERIENCE_DISPLAY_TEXT.get(level.lower()),
-                level.title(),
-                level.lower(),
-                level.upper()
-            ]
-            
-            for display_text in display_texts:
-                if display_text:
-                    try:
-                        # Try exact text match
-                        label = await dropdown_container.query_selector(f"text={display_text}")
-                        if label and await label.is_visible():
-                            # Find the parent label element
-                            parent_label = await label.evaluate_handle("el => el.closest('label')")
-                            if parent_label:
-                                await parent_label.click()
-                            else:
-                                await label.click()
-                            return True
-                    except:
-                        try:
-                            # Try contains text match
-                            label = await dropdown_container.query_selector(f"text*={display_text}")
-                            if label and await label.is_visible():
-                                parent_label = await label.evaluate_handle("el => el.closest('label')")
-                                if parent_label:
-                                    await parent_label.click()
-                                else:
-                                    await label.click()
-                                return True
-                        except:
-                            continue
-
-            # Strategy 4: Find any checkbox with similar data attributes
-            try:
-                checkbox = await dropdown_container.query_selector(f"input[type='checkbox'][value*='{value}']")
-                if not checkbox:
-                    checkbox = await dropdown_container.query_selector(f"input[type='checkbox'][id*='{value}']")
-                
-                if checkbox and await checkbox.is_visible() and not await checkbox.is_checked():
-                    await checkbox.click()
-                    return True
-            except:
-                pass
-
+            if await self._select_option(
+                dropdown_container, checkbox_id, value, "checkbox",
+                EXPERIENCE_NAME_PATTERNS, experience_display_variants(level),
+            ):
+                return True
             logger.warning(f"Could not find any suitable checkbox for experience level: {level}")
             return False
 
@@ -327,88 +672,11 @@ class FilterManager:
     async def _select_radio_button(self, dropdown_container: ElementHandle, radio_id: str, date_posted: str, value: str) -> bool:
         """Select a radio button in the dropdown with multiple fallback strategies."""
         try:
-            # Strategy 1: Find by exact ID
-            try:
-                radio_button = await dropdown_container.query_selector(f"#{radio_id}")
-                if radio_button and await radio_button.is_visible():
-                    if not await radio_button.is_checked():
-                        # Try clicking the associated label first
-                        try:
-                            label = await dropdown_container.query_selector(f'label[for="{radio_id}"]')
-                            if label:
-                                await label.click()
-                            else:
-                                await radio_button.click()
-                        except:
-                            # Fallback to clicking radio button directly
-                            await radio_button.click()
-                    return True
-            except:
-                pass
-
-            # Strategy 2: Find by value attribute with various name patterns
-            name_patterns = [
-                'timePostedRange',
-                'date-posted-filter-value',
-                'datePosted',
-                'timePosted'
-            ]
-            
-            for name_pattern in name_patterns:
-                try:
-                    radio_button = await dropdown_container.query_selector(f"input[name='{name_pattern}'][value='{value}']")
-                    if radio_button and await radio_button.is_visible() and not await radio_button.is_checked():
-                        await radio_button.click()
-                        return True
-                except:
-                    continue
-
-            # Strategy 3: Find by visible text content (case-insensitive)
-            display_texts = [
-                DATE_DISPLAY_TEXT.get(date_posted.lower()),
-                date_posted.replace('_', ' ').title(),
-                date_posted.lower(),
-                date_posted.upper()
-            ]
-            
-            for display_text in display_texts:
-                if display_text:
-                    try:
-                        # Try exact text match
-                        label = await dropdown_container.query_selector(f"text={display_text}")
-                        if label and await label.is_visible():
-                            parent_label = await label.evaluate_handle("el => el.closest('label')")
-                            if parent_label:
-                                await parent_label.click()
-                            else:
-                                await label.click()
-                            return True
-                    except:
-                        try:
-                            # Try contains text match
-                            label = await dropdown_container.query_selector(f"text*={display_text}")
-                            if label and await label.is_visible():
-                                parent_label = await label.evaluate_handle("el => el.closest('label')")
-                                if parent_label:
-                                    await parent_label.click()
-                                else:
-                                    await label.click()
-                                return True
-                        except:
-                            continue
-
-            # Strategy 4: Find any radio button with similar data attributes
-            try:
-                radio_button = await dropdown_container.query_selector(f"input[type='radio'][value*='{value}']")
-                if not radio_button:
-                    radio_button = await dropdown_container.query_selector(f"input[type='radio'][id*='{value}']")
-                
-                if radio_button and await radio_button.is_visible() and not await radio_button.is_checked():
-                    await radio_button.click()
-                    return True
-            except:
-                pass
-
+            if await self._select_option(
+                dropdown_container, radio_id, value, "radio",
+                DATE_NAME_PATTERNS, date_display_variants(date_posted),
+            ):
+                return True
             logger.warning(f"Could not find any suitable radio button for date: {date_posted}")
             return False
 
@@ -416,80 +684,168 @@ class FilterManager:
             logger.warning(f"Error selecting date posted option: {e}")
             return False
 
-    async def _close_dropdown(self, dropdown_container: ElementHandle) -> None:
-        """Close the dropdown if no selections were made with multiple strategies."""
+    async def _select_option(
+        self,
+        dropdown_container: ElementHandle,
+        option_id: str,
+        value: str,
+        option_type: str,
+        name_patterns: tuple,
+        display_texts: tuple,
+    ) -> bool:
+        """
+        Select a checkbox or radio option, probing the lookup strategies concurrently.
+
+        The label-text probe only locates an element, so it runs alongside the
+        in-page lookup (exact id, name/value patterns, partial value or id) that
+        finds and ticks the option itself. The text match is clicked only when
+        the in-page lookup finds nothing, and is cancelled otherwise.
+
+        Args:
+            dropdown_container: The opened filter dropdown
+            option_id: Expected input id of the option
+            value: Filter value of the option
+            option_type: "checkbox" or "radio"
+            name_patterns: Input names the option may use
+            display_texts: Label texts the option may show
+
+        Returns:
+            bool: True if the option was found and is now selected
+        """
+        text_probe = asyncio.create_task(self._probe_by_text(dropdown_container, display_texts))
         try:
-            # Strategy 1: Look for specific cancel buttons
-            cancel_selectors = [
-                'button[aria-label*="Cancel Experience level filter"]',
-                'button[aria-label*="Cancel Date posted filter"]',
-                'button[aria-label*="Cancel"]',
-                ".reusable-search-filters-buttons button.artdeco-button--tertiary",
-                'button[class*="artdeco-button--tertiary"]',
-            ]
-            
-            for selector in cancel_selectors:
-                try:
-                    cancel_button = await dropdown_container.query_selector(selector)
-                    if cancel_button and await cancel_button.is_visible() and await cancel_button.is_enabled():
-                        await cancel_button.click()
-                        logger.debug("Successfully closed dropdown with cancel button")
-                        return
-                except:
-                    continue
-
-            # Strategy 2: Click outside the dropdown to close it
             try:
-                # Click on the body element to close dropdown
-                await self.page.click("body", position={"x": 10, "y": 10})
-                logger.debug("Closed dropdown by clicking outside")
-                return
-            except:
-                pass
-
-            # Strategy 3: Press ESC key
+                if await dropdown_container.evaluate(
+                    SELECT_OPTION_JS,
+                    {"id": option_id, "value": value, "patterns": list(name_patterns), "type": option_type},
+                ):
+                    return True
+            except PlaywrightError as e:
+                logger.debug(f"In-page {option_type} lookup failed: {e}")
+
+            label = await text_probe
+        finally:
+            text_probe.cancel()
+
+        if label:
+            await label.click(timeout=2500)
+            return True
+        return False
+
+    async def _probe_by_text(self, dropdown_container: ElementHandle, display_texts: tuple) -> Optional[ElementHandle]:
+        """
+        Find an option's label by its visible text.
+
+        Both :has-text() and an unquoted text= selector match case-insensitive
+        substrings, and the visibility check runs in the selector engine, so
+        each probe is a single round-trip.
+
+        Args:
+            dropdown_container: The opened filter dropdown
+            display_texts: Label texts to look for, in order
+
+        Returns:
+            The visible label containing the text (or the matching element), or None
+        """
+        for display_text in display_texts:
             try:
-                await self.page.keyboard.press("Escape")
-                logger.debug("Closed dropdown with ESC key")
-            except:
-                pass
+                # Prefer the label element, then any element with the text
+                label = await dropdown_container.query_selector(f'label:visible:has-text("{display_text}")')
+                if not label:
+                    label = await dropdown_container.query_selector(f"text={display_text} >> visible=true")
+                if label:
+                    return label
+            except PlaywrightError:
+                continue
+        return None
 
-        except Exception as e:
-            logger.debug(f"Could not close dropdown: {e}")
-            pass
+    async def _find_button(
+        self, container: ElementHandle, selectors: List[str], text_pattern: Optional[str] = None
+    ) -> Optional[ElementHandle]:
+        """
+        Find the first visible, enabled button in a container in a single round-trip.
+
+        Args:
+            container: Element to search within
+            selectors: Button selectors in order of preference
+            text_pattern: Optional case-insensitive regex the button text must match
 
-    async def _apply_filter(self, dropdown_container: ElementHandle, selections_made: int) -> bool:
-        """Apply the selected filter options with robust button detection."""
+        Returns:
+            The button ElementHandle, or None if there is no match
+        """
+        try:
+            handle = await container.evaluate_handle(
+                FIND_BUTTON_JS, {"selectors": selectors, "text": text_pattern}
+            )
+            return handle.as_element()
+        except PlaywrightError as e:
+            logger.debug(f"Button lookup failed: {e}")
+            return None
+
+    async def _close_dropdown(self, dropdown_container: ElementHandle) -> None:
+        """
+        Close the dropdown if no selections were made with multiple strategies.
+
+        Escape comes first, since clicking the page corner can land on the
+        navigation bar and leave the results. The strategy that closed a
+        dropdown last time on this host is tried before the others.
+
+        Args:
+            dropdown_container: The opened filter dropdown
+        """
+        resolved = self._resolved_selectors()
+        strategies = ["escape", "cancel button", "click outside"]
+        if resolved.get("close dropdown") in strategies:
+            strategies.remove(resolved["close dropdown"])
+            strategies.insert(0, resolved["close dropdown"])
+
+        for strategy in strategies:
+            try:
+                if strategy == "escape":
+                    await self.page.keyboard.press("Escape")
+                elif strategy == "cancel button":
+                    cancel_button = await self._find_button(dropdown_container, CANCEL_FILTER_BUTTON_SELECTORS)
+                    if not cancel_button:
+                        continue
+                    await cancel_button.click(timeout=2000)
+                else:
+                    await self.page.click("body", position={"x": 10, "y": 10}, timeout=2000)
+                # A detached dropdown also counts as hidden
+                await dropdown_container.wait_for_element_state("hidden", timeout=1000)
+            except PlaywrightError:
+                continue
+            resolved["close dropdown"] = strategy
+            logger.debug(f"Closed dropdown with {strategy}")
+            return
+
+        logger.debug("Could not close dropdown")
+
+    async def _apply_filter(self, dropdown_container: ElementHandle, selections_made: int,
+                            confirm_params: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Apply the selected filter options with robust button detection.
+
+        Args:
+            dropdown_container: Dropdown or modal holding the selected options
+            selections_made: Number of options selected, for logging
+            confirm_params: Query parameters the results URL must carry when no
+                apply button was found and Enter was pressed instead
+
+        Returns:
+            bool: True if the filter was applied, False otherwise
+        """
         try:
             # Strategy 1: Look for specific apply buttons
-            apply_button_selectors = [
-                'button.artdeco-button--primary[aria-label*="Apply current filter"]',
-                'button.artdeco-button--primary[aria-label*="Show"]',
-                ".reusable-search-filters-buttons button.artdeco-button--primary",
-                'button[class*="artdeco-button--primary"][aria-label*="Show"]',
-                'button[class*="artdeco-button--primary"]',
-                'button[type="submit"]',
-            ]
-
-            apply_button = None
-            for selector in apply_button_selectors:
-                try:
-                    buttons = await dropdown_container.query_selector_all(selector)
-                    for button in buttons:
-                        if await button.is_visible() and await button.is_enabled():
-                            # Check if button text suggests it's an apply button
-                            button_text = await button.text_content()
-                            if button_text and any(keyword in button_text.lower() for keyword in ['show', 'apply', 'done', 'submit']):
-                                apply_button = button
-                                break
-                    if apply_button:
-                        break
-                except:
-                    continue
+            apply_button = await self._find_button(
+                dropdown_container, APPLY_FILTER_BUTTON_SELECTORS, "show|apply|done|submit"
+            )
 
             if apply_button:
-                await apply_button.click()
-                await async_random_sleep(2.0, 4.0)  # Wait for page reload
+                await self.throttle.wait()
+                started = time.monotonic()
+                await apply_button.click(timeout=self.timeout)
+                await wait_for_page_ready(self.page)  # Wait for page reload
+                self.throttle.record(time.monotonic() - started)
                 logger.info(f"Applied filter with {selections_made} selections")
                 return True
             else:
@@ -497,11 +853,17 @@ class FilterManager:
                 
                 # Strategy 2: Try pressing Enter key as fallback
                 try:
+                    await self.throttle.wait()
+                    started = time.monotonic()
                     await self.page.keyboard.press("Enter")
-                    await async_random_sleep(2.0, 4.0)
+                    await wait_for_page_ready(self.page)
+                    self.throttle.record(time.monotonic() - started)
+                    if confirm_params and not self.url_filters_applied(confirm_params):
+                        logger.warning("Pressing Enter did not apply the filters")
+                        return False
                     logger.info(f"Applied filter using Enter key with {selections_made} selections")
                     return True
-                except:
+                except PlaywrightError:
                     pass
                 
                 return False
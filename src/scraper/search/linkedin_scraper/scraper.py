@@ -6,31 +6,57 @@ import os
 import logging
 import dotenv
 import asyncio
+import time
+from collections import OrderedDict
+from copy import deepcopy
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
+from urllib.parse import quote, urlencode
 
 from playwright.async_api import (
     async_playwright,
     TimeoutError as PlaywrightTimeoutError,
 )
 
-from .browser import BrowserManager
+from .browser import BrowserManager, PagePool
 from .auth import AuthManager
 from .filters import FilterManager
 from .extractors import JobLinksExtractor, JobDetailsExtractor
-from .config import DEFAULT_TIMEOUT
-from .utils import async_random_sleep
+from .config import (
+    DEFAULT_TIMEOUT,
+    JOB_DETAILS_CACHE_SIZE,
+    LAZY_CONTENT_TIMEOUT,
+    MAX_CONCURRENT_DETAIL_PAGES,
+    PAGE_READY_TIMEOUT,
+    SORT_BY_MAPPING,
+)
+from .utils import (
+    JOB_ID_URL_RE,
+    AdaptiveThrottle,
+    async_random_sleep,
+    async_retry,
+    is_retryable_response,
+)
 from .extractors.selectors import (
     JOB_DESCRIPTION_SELECTORS,
     ADDITIONAL_POSTED_DATE_SELECTORS,
     JOB_INSIGHTS_SELECTORS,
     ADDITIONAL_JOB_INSIGHTS_SELECTORS,
-    ADDITIONAL_APPLY_BUTTON_SELECTORS,
     ADDITIONAL_LOCATION_SELECTORS,
     APPLICANT_COUNT_SELECTORS,
     CONTACT_INFO_SELECTORS,
     ADDITIONAL_COMPANY_WEBSITE_SELECTORS,
     SKILLS_SECTION_SELECTORS,
+    TOP_CARD_TITLE_SELECTORS,
+    TOP_CARD_COMPANY_SELECTORS,
+    TOP_CARD_DESCRIPTION_SELECTORS,
+    TOP_CARD_LOCATION_SELECTORS,
+    TOP_CARD_DATE_SELECTORS,
+    SIMILAR_JOB_TITLE_SELECTORS,
+    SIMILAR_JOB_COMPANY_SELECTORS,
+    SIMILAR_JOB_LOCATION_SELECTORS,
+    SHOW_MORE_BUTTON_SELECTORS,
+    SHOW_MORE_BUTTON_TEXTS,
 )
 
 # Configure logging
@@ -39,6 +65,391 @@ logging.basicConfig(
 )
 logger = logging.getLogger("linkedin_scraper")
 
+# Selector lists handed to JOB_DETAILS_JS
+JOB_DETAILS_SELECTORS = {
+    "title": TOP_CARD_TITLE_SELECTORS,
+    "company": TOP_CARD_COMPANY_SELECTORS,
+    "description": TOP_CARD_DESCRIPTION_SELECTORS,
+    "location": TOP_CARD_LOCATION_SELECTORS,
+    "date": TOP_CARD_DATE_SELECTORS,
+    "similarTitle": SIMILAR_JOB_TITLE_SELECTORS,
+    "similarCompany": SIMILAR_JOB_COMPANY_SELECTORS,
+    "similarLocation": SIMILAR_JOB_LOCATION_SELECTORS,
+}
+
+# Reads the top card, hiring team and related jobs of a job page in one pass,
+# so a detail page costs one round trip instead of one per element
+JOB_DETAILS_JS = """({ selectors, currentJobId, includeHiringTeam, includeRelatedJobs }) => {
+    const whitespace = /\\s+/g;
+    const needsCollapse = /\\s{2}|[^\\S ]/;
+    // Most texts (names, titles, bullets) have no whitespace runs, so the replace is skipped for them
+    const clean = (text) => {
+        if (!text) return null;
+        const trimmed = text.trim();
+        return (needsCollapse.test(trimmed) ? trimmed.replace(whitespace, " ") : trimmed) || null;
+    };
+    const textOf = (el) => (el ? clean(el.textContent) : null);
+    // Selector that matched for each family, so the caller can try it first next time
+    const winners = {};
+    const firstText = (root, family) => {
+        for (const selector of selectors[family]) {
+            const text = textOf(root.querySelector(selector));
+            if (text) {
+                winners[family] = selector;
+                return text;
+            }
+        }
+        return null;
+    };
+    const titleParts = document.title.includes("|") ? document.title.split("|") : [];
+    const relativeDate = /\\d+\\s+(hour|day|week|month)s?\\s+ago/i;
+    const nameSuffix = /\\s*\\d+\\s+(company\\s+alum|mutual connection).*$/i;
+    const notLocation = /\\d{4}|ago|applicant|visible/i;
+    const notLocationStrict = /\\d{4}|ago|applicant|visible|reviewing|alum/i;
+    // Keyword filters, each one scan instead of a chain of includes() calls
+    const locationHint = /Remote|Hybrid|On-site|,/;
+    const pageLocation = /^[A-Z][a-z]+,\\s*[A-Z]|Germany|Berlin|Remote|Hybrid|United States|London/;
+    const notMemberTitle = /company alum|mutual connection|Message|Follow|^\\d+(st|nd|rd|th)/;
+    const notRelatedTitle = /ago|Easy Apply|€|\\$|linkedin/i;
+    const relatedLocationLine = /Germany|Remote|Berlin|^[A-Z][a-z]+, [A-Z]/;
+    const notRelatedCompany = /€|\\$|ago|Apply/;
+    const notLinkTitle = /apply|see all|show more/i;
+    const cardLocation = /,|remote/i;
+    const descriptionHints = [
+        "responsibilities", "requirements", "experience", "qualifications", "about the role", "about the job",
+        "we are looking", "you will", "your role", "what you", "who you are", "skills", "duties",
+    ];
+    const jobViewId = /\\/jobs\\/view\\/(\\d+)/;
+    // Job id query parameters, read without building a URL object per link
+    const jobIdParams = {
+        originToLandingJobPostings: /[?&]originToLandingJobPostings=(\\d+)/,
+        currentJobId: /[?&]currentJobId=(\\d+)/,
+        referenceJobId: /[?&]referenceJobId=(\\d+)/,
+    };
+
+    // Top card title, falling back to the page title
+    let title = null;
+    for (const selector of selectors.title) {
+        const el = document.querySelector(selector);
+        if (!el) continue;
+        title = textOf(el);
+        if (title && title.length > 3 && !["Home", "Jobs", "LinkedIn"].includes(title)) {
+            winners.title = selector;
+            break;
+        }
+    }
+    if ((!title || ["Home", "Jobs", "LinkedIn"].includes(title)) && titleParts.length) {
+        title = titleParts[0].trim();
+    }
+
+    // Company link outside the navigation, falling back to the page title
+    let company = null;
+    for (const selector of selectors.company) {
+        const el = document.querySelector(selector);
+        if (!el || el.closest("header, nav, aside")) continue;
+        const text = textOf(el);
+        if (text && text.length > 2 && text.length < 100
+            && !["Home", "Jobs", "Network", "Messaging", "Notifications"].includes(text)) {
+            company = text;
+            winners.company = selector;
+            break;
+        }
+    }
+    if (!company && titleParts.length > 1) company = titleParts[1].trim();
+
+    let description = null;
+    for (const selector of selectors.description) {
+        const text = textOf(document.querySelector(selector));
+        if (text && text.length > 100 && text.length < 50000) {
+            description = text;
+            winners.description = selector;
+            break;
+        }
+    }
+    // Fallback: the largest block outside the page chrome that reads like a job description
+    if (!description) {
+        let best = null;
+        for (const el of document.querySelectorAll("div, section")) {
+            const text = el.textContent;
+            if (!text || text.length <= 200 || text.length >= 15000 || (best && text.length <= best.length)) continue;
+            if (el.closest("nav, header, aside, footer")) continue;
+            const lower = text.toLowerCase();
+            if (descriptionHints.some((hint) => lower.includes(hint))) best = text;
+        }
+        if (best) description = clean(best);
+    }
+
+    // Texts of the first spans outside the page chrome, read once and shared
+    // by the location and date fallbacks
+    let spanTexts = null;
+    const pageSpanTexts = () => {
+        if (!spanTexts) {
+            spanTexts = [];
+            for (const span of document.querySelectorAll("span")) {
+                if (spanTexts.length >= 150) break;
+                if (span.closest("header, nav, aside")) continue;
+                const text = textOf(span);
+                if (text) spanTexts.push(text);
+            }
+        }
+        return spanTexts;
+    };
+
+    // Location from the top card bullets, then from the page spans
+    let jobLocation = null;
+    for (const selector of selectors.location) {
+        const text = textOf(document.querySelector(selector));
+        if (text && text.length > 3 && text.length < 100 && !notLocation.test(text)
+            && locationHint.test(text)) {
+            jobLocation = text;
+            winners.location = selector;
+            break;
+        }
+    }
+    if (!jobLocation) {
+        for (const text of pageSpanTexts()) {
+            if (text.length > 3 && text.length < 100
+                && pageLocation.test(text) && !notLocationStrict.test(text)) {
+                jobLocation = text;
+                break;
+            }
+        }
+    }
+
+    // Just the "X days ago" part of the posted date
+    let datePosted = null;
+    for (const selector of selectors.date) {
+        const match = (textOf(document.querySelector(selector)) || "").match(relativeDate);
+        if (match) {
+            datePosted = match[0];
+            winners.date = selector;
+            break;
+        }
+    }
+    if (!datePosted) {
+        for (const text of pageSpanTexts()) {
+            const match = text.match(relativeDate);
+            if (match) {
+                datePosted = match[0];
+                break;
+            }
+        }
+    }
+
+    const memberTitle = (link) => {
+        const container = link.closest('li, div[class*="card"]') || link.parentElement;
+        if (!container) return null;
+        for (const el of container.querySelectorAll("span, div, p")) {
+            const text = el.textContent.trim();
+            if (text && text.length > 5 && text.length < 100 && !notMemberTitle.test(text)) {
+                return clean(text);
+            }
+        }
+        return null;
+    };
+
+    const extractHiringTeam = () => {
+        const team = [];
+        const seen = new Set();
+        const section = [...document.querySelectorAll("section")]
+            .find((el) => (el.textContent || "").toLowerCase().includes("meet the hiring team"));
+        // Profile links in the page chrome (own profile, messaging) never count toward the 20
+        const links = [...(section || document).querySelectorAll('a[href*="/in/"]')]
+            .filter((link) => !link.closest("header, nav, footer, aside"))
+            .slice(0, 20);
+        for (const link of links) {
+            if (team.length >= 5) break;
+            const href = link.getAttribute("href");
+            if (!href || seen.has(href)) continue;
+
+            let name = textOf(link.querySelector("strong, span.t-bold"));
+            if (name) name = name.replace(nameSuffix, "").trim();
+            if (!name) {
+                const linkText = textOf(link);
+                if (linkText && linkText.length > 2 && linkText.length < 80) {
+                    name = linkText.split("•")[0].trim().replace(nameSuffix, "").trim();
+                }
+            }
+            if (!name || name.length <= 2 || name.includes("LinkedIn") || ["Home", "Jobs", "Network"].includes(name)) {
+                continue;
+            }
+
+            const member = { name, linkedin_url: href };
+            const memberTitleText = memberTitle(link);
+            if (memberTitleText && memberTitleText !== name) member.title = memberTitleText;
+            seen.add(href);
+            team.push(member);
+        }
+        return team;
+    };
+
+    const extractRelatedJobs = () => {
+        const jobs = [];
+        const seen = new Set();
+        const viewId = (href) => {
+            const match = href.match(jobViewId);
+            return match ? match[1] : null;
+        };
+        const queryId = (href, names) => {
+            for (const name of names) {
+                const match = href.match(jobIdParams[name]);
+                if (match) return match[1];
+            }
+            return null;
+        };
+        // Each related job is taken once and never the posting itself
+        const claim = (id) => {
+            if (!id || id === currentJobId || seen.has(id)) return false;
+            seen.add(id);
+            return true;
+        };
+
+        // Strategy 1: the similar jobs list
+        let list = document.querySelector('ul[class*="js-similar-jobs-list"]');
+        if (!list) {
+            try {
+                list = document.querySelector('ul[class*="card-list"]:has(.job-card-job-posting-card-wrapper)');
+            } catch (e) {
+                // Engines without :has() support
+                list = [...document.querySelectorAll('ul[class*="card-list"]')]
+                    .find((ul) => ul.querySelector(".job-card-job-posting-card-wrapper"));
+            }
+        }
+        for (const li of list ? list.querySelectorAll("li") : []) {
+            if (jobs.length >= 8) break;
+            const link = li.querySelector("a.job-card-job-posting-card-wrapper__card-link")
+                || li.querySelector('a[href*="jobs"]');
+            const href = link && link.getAttribute("href");
+            if (!href) continue;
+            const id = queryId(href, ["originToLandingJobPostings", "currentJobId", "referenceJobId"]) || viewId(href);
+            if (!claim(id)) continue;
+
+            let jobTitle = firstText(li, "similarTitle");
+            if (!jobTitle) {
+                const linkText = textOf(link);
+                if (linkText && linkText.length > 3 && linkText.length < 200) jobTitle = linkText.split("\\n")[0].trim();
+            }
+            if (!jobTitle || jobTitle.length < 3) continue;
+
+            const job = { title: jobTitle, job_url: href };
+            const jobCompany = firstText(li, "similarCompany");
+            if (jobCompany) job.company = jobCompany;
+            const jobLocationText = firstText(li, "similarLocation");
+            if (jobLocationText) job.location = jobLocationText;
+            jobs.push(job);
+        }
+
+        // Strategy 2: links into the similar jobs collection
+        if (!jobs.length) {
+            for (const link of document.querySelectorAll('a[href*="/jobs/collections/similar-jobs/"]')) {
+                if (jobs.length >= 8) break;
+                const href = link.getAttribute("href");
+                if (!href) continue;
+                const id = queryId(href, ["currentJobId", "originToLandingJobPostings"]);
+                if (!claim(id)) continue;
+
+                let container = link.closest("div[componentkey]") || link.parentElement;
+                for (let i = 0; i < 5 && container; i++) {
+                    if (container.querySelector("p, h3, h4")) break;
+                    container = container.parentElement;
+                }
+                if (!container) continue;
+
+                const card = link.closest("div[componentkey]") || link.parentElement;
+                // Stop at the first acceptable text instead of reading every node
+                let jobTitle = null;
+                for (const el of card.querySelectorAll("p, h3, h4, span")) {
+                    const text = clean(el.textContent);
+                    if (text && text.length > 10 && text.length < 150 && !notRelatedTitle.test(text)) {
+                        jobTitle = text;
+                        break;
+                    }
+                }
+                if (!jobTitle) continue;
+
+                const job = { title: jobTitle, job_url: `https://www.linkedin.com/jobs/view/${id}/` };
+                const lines = (card.textContent || "").split("\\n").map((line) => line.trim()).filter(Boolean);
+                for (const line of lines) {
+                    if (line === jobTitle) continue;
+                    if (relatedLocationLine.test(line)) {
+                        if (!line.includes("ago") && line.length < 100) job.location = line;
+                    } else if (!job.company && line.length > 2 && line.length < 80 && !notRelatedCompany.test(line)) {
+                        job.company = line;
+                    }
+                }
+                jobs.push(job);
+            }
+        }
+
+        // Strategy 3: any other job view link on the page
+        if (!jobs.length) {
+            for (const link of document.querySelectorAll('a[href*="/jobs/view/"]')) {
+                if (jobs.length >= 8) break;
+                const href = link.getAttribute("href");
+                if (!href || !claim(viewId(href))) continue;
+
+                let jobTitle = textOf(link.querySelector("strong"));
+                if (!jobTitle) {
+                    const linkText = textOf(link);
+                    if (linkText && linkText.length > 3 && linkText.length < 150 && !notLinkTitle.test(linkText)) {
+                        jobTitle = linkText;
+                    }
+                }
+                if (!jobTitle || jobTitle.length < 3) continue;
+
+                const job = { title: jobTitle, job_url: href };
+                let container = link.parentElement;
+                for (let i = 0; i < 5 && container; i++) {
+                    if (container.tagName === "LI" || container.tagName === "ARTICLE") break;
+                    container = container.parentElement;
+                }
+                if (!container) container = link.parentElement;
+                const companyLink = container && container.querySelector('a[href*="/company/"]');
+                if (companyLink && companyLink.textContent.trim()) job.company = companyLink.textContent.trim();
+                for (const span of container ? container.querySelectorAll("span") : []) {
+                    const text = span.textContent.trim();
+                    if (text && cardLocation.test(text) && !text.includes("ago") && text.length < 100) {
+                        job.location = text;
+                        break;
+                    }
+                }
+                jobs.push(job);
+            }
+        }
+        return jobs;
+    };
+
+    const result = { title, company, description, location: jobLocation, date_posted: datePosted, winners };
+    if (includeHiringTeam) result.hiring_team = extractHiringTeam();
+    if (includeRelatedJobs) result.related_jobs = extractRelatedJobs();
+    return result;
+}"""
+
+# Scrolls to the bottom of the page and returns the height scrolled to
+SCROLL_TO_BOTTOM_JS = """() => {
+    const height = document.body.scrollHeight;
+    window.scrollTo(0, height);
+    return height;
+}"""
+
+# Clicks the first visible button matching each selector and each text, and
+# returns how many were clicked
+CLICK_SHOW_MORE_JS = """({ selectors, texts }) => {
+    const visible = (el) => el.getClientRects().length > 0;
+    const buttons = [...document.querySelectorAll("button")].filter(visible);
+    const targets = new Set();
+    for (const selector of selectors) {
+        const button = buttons.find((el) => el.matches(selector));
+        if (button) targets.add(button);
+    }
+    for (const text of texts) {
+        const button = buttons.find((el) => (el.textContent || "").includes(text));
+        if (button) targets.add(button);
+    }
+    for (const button of targets) button.click();
+    return targets.size;
+}"""
+
 
 class LinkedInScraper:
     """
@@ -58,6 +469,9 @@ class LinkedInScraper:
         browser: str = "chromium",
         proxy: Optional[str] = None,
         anonymize: bool = True,
+        include_company_info: bool = False,
+        include_hiring_team: bool = True,
+        include_related_jobs: bool = True,
     ):
         """
         Initialize the LinkedIn scraper.
@@ -67,10 +481,14 @@ class LinkedInScraper:
 
         Args:
             headless: Whether to run the browser in headless mode
-            timeout: Wait timeout in milliseconds for page loading
+            timeout: Default timeout in milliseconds for page actions and waits;
+                navigations are additionally capped at NAVIGATION_TIMEOUT
             browser: Browser to use ('chromium', 'firefox', or 'webkit')
             proxy: Proxy string in format "http://host:port" or "socks5://host:port"
             anonymize: Whether to enable anonymization features
+            include_company_info: Whether get_job_details extracts the company info section
+            include_hiring_team: Whether get_job_details extracts the hiring team
+            include_related_jobs: Whether get_job_details extracts related jobs
         """
         self.timeout = timeout
         self.headless = headless
@@ -78,6 +496,9 @@ class LinkedInScraper:
         self.proxy = proxy
         self.anonymize = anonymize
         self.use_login = True  # Always use login - required for LinkedIn scraping
+        self.include_company_info = include_company_info
+        self.include_hiring_team = include_hiring_team
+        self.include_related_jobs = include_related_jobs
 
         # Load environment variables for login (always required)
         dotenv.load_dotenv()
@@ -99,7 +520,16 @@ class LinkedInScraper:
         self.filter_manager = None
         self.job_links_extractor = None
         self.job_details_extractor = None
+        self.page_pool = None
+        self.throttle = None
+        self._pool_extractors: Dict[Any, JobDetailsExtractor] = {}
         self._setup_complete = False
+        # Last selector that matched for each JOB_DETAILS_SELECTORS family
+        self._selector_winners: Dict[str, str] = {}
+        # Scraped details by job id, least recently used first
+        self._details_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Scrapes running in get_jobs_details by job id, awaited by duplicates
+        self._details_in_flight: Dict[str, asyncio.Task] = {}
 
     async def _ensure_setup(self):
         """Ensure all components are set up."""
@@ -114,14 +544,24 @@ class LinkedInScraper:
                 )
                 await self.browser_manager.setup_driver()
 
+                # One throttle paces every navigation, on the search page and
+                # in the detail tabs
+                self.throttle = AdaptiveThrottle()
                 self.auth_manager = AuthManager(self.browser_manager.page, self.timeout)
                 self.filter_manager = FilterManager(
-                    self.browser_manager.page, self.timeout
+                    self.browser_manager.page, self.timeout, self.throttle
+                )
+                self.job_links_extractor = JobLinksExtractor(
+                    self.browser_manager.page, self.throttle
                 )
-                self.job_links_extractor = JobLinksExtractor(self.browser_manager.page)
                 self.job_details_extractor = JobDetailsExtractor(
                     self.browser_manager.page, self.timeout
                 )
+                self.page_pool = PagePool(
+                    self.browser_manager,
+                    on_discard=lambda page: self._pool_extractors.pop(page, None),
+                )
+                self._pool_extractors = {}
 
                 self._setup_complete = True
             except RuntimeError as e:
@@ -170,44 +610,63 @@ class LinkedInScraper:
 
         await self.auth_manager.ensure_login(self.username, self.password)
 
-        search_url = f"https://www.linkedin.com/jobs/search/?keywords={keywords.replace(' ', '%20')}&location={location.replace(' ', '%20')}"
+        search_params = {"keywords": keywords, "location": location}
 
         # Add sort parameter if specified
         if sort_by:
-            if sort_by.lower() == "relevance":
-                search_url += "&sortBy=R"
-            elif sort_by.lower() == "recent":
-                search_url += "&sortBy=DD"
+            if sort_by.lower() in SORT_BY_MAPPING:
+                search_params["sortBy"] = SORT_BY_MAPPING[sort_by.lower()]
             else:
                 logger.warning(
                     f"Invalid sort_by value: {sort_by}. Valid values are 'relevance' or 'recent'"
                 )
 
-        await self.browser_manager.navigate_to(search_url, 3.0, 5.0)
-
-        # Apply search filters if specified
+        # Filters map to query parameters, so they normally load with the search
+        filter_params = {}
         if experience_levels or date_posted:
-            logger.info("Applying search filters...")
-            filter_success = await self.filter_manager.apply_search_filters(
+            filter_params = self.filter_manager.build_filter_params(
                 experience_levels, date_posted
             )
-            if not filter_success:
-                logger.warning("Some filters may not have been applied correctly")
+            search_params.update(filter_params)
 
-        job_links = set()
+        # Encoded in one pass so "&", "+", "/" or non-ASCII in the keywords
+        # cannot break the query; spaces stay %20
+        search_url = "https://www.linkedin.com/jobs/search/?" + urlencode(
+            search_params, quote_via=quote
+        )
+
+        await self.browser_manager.navigate_to(search_url, 3.0, 5.0)
+
+        # Fall back to the filter dropdowns if LinkedIn dropped the parameters
+        if experience_levels or date_posted:
+            if filter_params and self.filter_manager.url_filters_applied(filter_params):
+                logger.info(f"Applied search filters via URL: {filter_params}")
+            else:
+                logger.info("Applying search filters...")
+                filter_success = await self.filter_manager.apply_search_filters(
+                    experience_levels, date_posted
+                )
+                if not filter_success:
+                    logger.warning("Some filters may not have been applied correctly")
+
+        # Keyed by job ID so a job listed again on a later page is fetched once;
+        # insertion order keeps LinkedIn's ranking, most relevant first
+        job_links: Dict[str, str] = {}
         current_page = 1
         while current_page <= max_pages:
             logger.info(f"Collecting links from page {current_page} of {max_pages}")
 
-            # Debug: analyze page structure
-            logger.info("Analyzing page structure...")
-            await self.browser_manager.debug_page_structure()
-
-            # Get total job count for this search
-            total_expected = await self.browser_manager.get_total_job_count()
+            # Debug: analyze page structure (dozens of queries, so debug runs only)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Analyzing page structure...")
+                await self.browser_manager.debug_page_structure()
 
-            # Find the job list container
-            job_list_container = await self.browser_manager.find_job_list_container()
+            # Total job count and job list container are independent reads of
+            # the loaded page, so their round trips overlap
+            total_expected, job_list_container = await asyncio.gather(
+                self.browser_manager.get_total_job_count(),
+                self.browser_manager.find_job_list_container(),
+            )
 
             # Scroll through the job list to load all cards
             await self.browser_manager.scroll_job_list_container(
@@ -220,16 +679,19 @@ class LinkedInScraper:
                 logger.warning("No job cards found on this page.")
                 break
 
-            # Extract job links from all cards
-            page_links = await self.job_links_extractor.extract_job_links_from_cards(
-                job_cards, current_page
+            # Extract job links from all cards while reading whether a next
+            # page exists; both only read the page, which changes on the click
+            page_links, pagination_info = await asyncio.gather(
+                self.job_links_extractor.extract_job_links_from_cards(
+                    job_cards, current_page
+                ),
+                self.job_links_extractor.get_pagination_info(),
             )
-            job_links.update(page_links)
+            for url in page_links:
+                match = JOB_ID_URL_RE.search(url)
+                job_links.setdefault(match[1] if match else url, url)
 
             logger.info(f"Collected {len(job_links)} unique job links so far.")
-
-            # Check if we can go to next page
-            pagination_info = await self.job_links_extractor.get_pagination_info()
             logger.info(f"Pagination status: {pagination_info['page_state']}")
 
             if not pagination_info["has_next"]:
@@ -241,757 +703,294 @@ class LinkedInScraper:
                 break
 
             current_page += 1
-        return list(job_links)
+        return list(job_links.values())
 
-    async def _extract_job_details_python(self, page, job_url: str) -> Dict[str, Any]:
-        """
-        Extract job details using Playwright Python API instead of JS evaluate.
-        Keeps same logic as previous JS implementation.
+    async def _extract_job_details(self, page, job_url: str) -> Dict[str, Any]:
         """
-        import re
-        from urllib.parse import urlparse, parse_qs
-
-        def clean_text(text: Optional[str]) -> Optional[str]:
-            """Helper to clean text"""
-            if not text:
-                return None
-            return re.sub(r"\s+", " ", text.strip())
-
-        result = {}
-
-        # Get title - prioritize specific job title selectors
-        title = None
-        title_selectors = [
-            ".job-details-jobs-unified-top-card__job-title h1",
-            ".jobs-unified-top-card__job-title h1",
-            "h1.t-24",
-            "main h1",
-        ]
-        for selector in title_selectors:
-            h1 = await page.query_selector(selector)
-            if h1:
-                title = clean_text(await h1.text_content())
-                if (
-                    title
-                    and len(title) > 3
-                    and title not in ["Home", "Jobs", "LinkedIn"]
-                ):
-                    break
-
-        if not title or title in ["Home", "Jobs", "LinkedIn"]:
-            page_title = await page.title()
-            if "|" in page_title:
-                title = page_title.split("|")[0].strip()
-        result["title"] = title
-
-        # Get company - avoid navigation links
-        company = None
-        company_selectors = [
-            ".job-details-jobs-unified-top-card__company-name a",
-            ".jobs-unified-top-card__company-name a",
-            'a.ember-view[href*="/company/"]',
-        ]
-
-        for selector in company_selectors:
-            company_link = await page.query_selector(selector)
-            if company_link:
-                # Check if it's in the main job content area, not navigation
-                in_nav = await company_link.evaluate(
-                    'el => !!el.closest("header, nav, aside")'
-                )
-                if not in_nav:
-                    text = clean_text(await company_link.text_content())
-                    if (
-                        text
-                        and 2 < len(text) < 100
-                        and text
-                        not in ["Home", "Jobs", "Network", "Messaging", "Notifications"]
-                    ):
-                        company = text
-                        break
-
-        if not company:
-            page_title = await page.title()
-            if "|" in page_title:
-                parts = page_title.split("|")
-                if len(parts) > 1:
-                    company = parts[1].strip().replace(" | LinkedIn", "")
-        result["company"] = company
-
-        # Get description - use specific job description selectors
-        description = None
-        description_selectors = [
-            ".jobs-description__content",
-            ".jobs-box__html-content",
-            "article.jobs-description",
-            ".job-details-jobs-unified-top-card__job-description",
-            'div[class*="description"] article',
-        ]
-
-        for selector in description_selectors:
-            desc_element = await page.query_selector(selector)
-            if desc_element:
-                desc_text = clean_text(await desc_element.text_content())
-                if desc_text and 100 < len(desc_text) < 50000:
-                    description = desc_text
-                    break
-
-        if not description or len(description) < 100:
-            # Fallback: Look for div with job description keywords
-            keywords = [
-                "responsibilities",
-                "requirements",
-                "experience",
-                "qualifications",
-                "about the role",
-                "about the job",
-                "we are looking",
-                "you will",
-                "your role",
-                "what you",
-                "who you are",
-                "skills",
-                "duties",
-            ]
-            divs = await page.query_selector_all("div, section")
-            candidates = []
-
-            for div in divs:
-                # Skip nav/header/footer
-                parent_tag = await div.evaluate(
-                    'el => el.closest("nav, header, aside, footer") ? true : false'
-                )
-                if parent_tag:
-                    continue
+        Extract job details from the loaded job page in a single evaluate call.
 
-                full_text = await div.text_content()
-                if not full_text:
-                    continue
-
-                has_keywords = any(k in full_text.lower() for k in keywords)
-                if has_keywords and 200 < len(full_text) < 15000:
-                    candidates.append(
-                        {"text": clean_text(full_text), "length": len(full_text)}
-                    )
-        #  - use specific selectors first
-        location = None
-        location_selectors = [
-            ".job-details-jobs-unified-top-card__bullet",
-            ".jobs-unified-top-card__bullet",
-            "span.jobs-unified-top-card__workplace-type",
-        ]
-
-        for selector in location_selectors:
-            loc_element = await page.query_selector(selector)
-            if loc_element:
-                text = clean_text(await loc_element.text_content())
-                if text and 3 < len(text) < 100:
-                    # Exclude date/time patterns
-                    if not re.search(
-                        r"\d{4}|ago|applicant|visible", text, re.IGNORECASE
-                    ):
-                        if (
-                            any(
-                                keyword in text
-                                for keyword in ["Remote", "Hybrid", "On-site"]
-                            )
-                            or "," in text
-                        ):
-                            location = text
-                            break
-
-        if not location:
-            # Fallback to span scanning
-            all_spans = await page.query_selector_all("span.t-black--light, span")
-            for span in all_spans[:100]:  # Limit to first 100 spans
-                in_nav = await span.evaluate('el => !!el.closest("header, nav, aside")')
-                if in_nav:
-                    continue
-                text = clean_text(await span.text_content())
-                if text and 3 < len(text) < 100:
-                    if re.match(r"[A-Z][a-z]+,\s*[A-Z]", text) or any(
-                        loc in text
-                        for loc in [
-                            "Germany",
-                            "Berlin",
-                            "Remote",
-                            "Hybrid",
-                            "United States",
-                            "London",
-                        ]
-                    ):
-                        if not re.search(
-                            r"\d{4}|ago|applicant|visible|reviewing|alum",
-                            text,
-                            re.IGNORECASE,
-                        ):
-                            location = text
-                            break
-        result["location"] = location
-
-        # Get date posted - be more specific
-        date_posted = None
-        date_selectors = [
-            "span.jobs-unified-top-card__posted-date",
-            'span[class*="posted"]',
-        ]
-
-        for selector in date_selectors:
-            date_element = await page.query_selector(selector)
-            if date_element:
-                text = clean_text(await date_element.text_content())
-                if text and re.search(
-                    r"\d+\s+(hour|day|week|month)s?\s+ago", text, re.IGNORECASE
-                ):
-                    # Extract just the "X days ago" part
-                    match = re.search(
-                        r"\d+\s+(hour|day|week|month)s?\s+ago", text, re.IGNORECASE
-                    )
-                    if match:
-                        date_posted = match.group(0)
-                        break
-
-        if not date_posted:
-            # Fallback span search
-            all_spans = await page.query_selector_all("span")
-            # for span in all_s - be more careful with name extraction
-        hiring_team = []
-        seen_urls = set()
+        Args:
+            page: Playwright page showing the job posting
+            job_url: URL of the job posting, used to skip it among related jobs
 
-        # Look specifically in hiring team section
-        hiring_section = await page.query_selector(
-            'section:has-text("Meet the hiring team")'
+        Returns:
+            Dictionary with title, company, description, location and date_posted,
+            plus hiring_team and related_jobs when enabled
+        """
+        result = await page.evaluate(
+            JOB_DETAILS_JS,
+            {
+                "selectors": self._ordered_detail_selectors(),
+                "currentJobId": job_url.rstrip("/").split("/")[-1],
+                "includeHiringTeam": self.include_hiring_team,
+                "includeRelatedJobs": self.include_related_jobs,
+            },
         )
-        if hiring_section:
-            profile_links = await hiring_section.query_selector_all('a[href*="/in/"]')
-        else:
-            profile_links = await page.query_selector_all('a[href*="/in/"]')
-
-        for link in profile_links[:20]:  # Limit to first 20 profile links
-            if len(hiring_team) >= 5:
-                break
-            href = await link.get_attribute("href")
-            if not href or href in seen_urls:
-                continue
-            # Skip header/nav/footer
-            in_nav = await link.evaluate(
-                'el => !!el.closest("header, nav, footer, aside")'
-            )
-            if in_nav:
-                continue
-
-            name = None
-            title_text = None
-
-            # Try to find name in strong tag within the link
-            strong_el = await link.query_selector("strong, span.t-bold")
-            if strong_el:
-                name = clean_text(await strong_el.text_content())
-                # Clean up - remove trailing metadata like "1 company alum"
-                if name:
-                    name = re.sub(
-                        r"\s*\d+\s+(company\s+alum|mutual connection).*$",
-                        "",
-                        name,
-                        flags=re.IGNORECASE,
-                    ).strip()
-
-            if not name:
-                link_text = clean_text(await link.text_content())
-                if link_text and 2 < len(link_text) < 80:
-                    # Split by bullet point or newline
-                    name = link_text.split("•")[0].split("\n")[0].strip()
-                    # Clean up
-                    name = re.sub(
-                        r"\s*\d+\s+(company\s+alum|mutual connection).*$",
-                        "",
-                        name,
-                        flags=re.IGNORECASE,
-                    ).strip()
-
-            # Look for title in parent container
-            if name and len(name) > 2:
-                try:
-                    parent_data = await link.evaluate("""el => {
-                        const container = el.closest('li, div[class*="card"]') || el.parentElement;
-                        if (!container) return null;
-                        
-                        // Look for title in spans/divs
-                        const textElements = Array.from(container.querySelectorAll('span, div, p'));
-                        for (const elem of textElements) {
-                            const text = elem.textContent.trim();
-                            // Skip if it's the name or metadata
-                            if (text && text.length > 5 && text.length < 100 &&
-                                !text.includes('company alum') && 
-                                !text.includes('mutual connection') &&
-                                !text.match(/^\d+(st|nd|rd|th)/) &&
-                                !text.includes('Message') &&
-                                !text.includes('Follow')) {
-                                return text;
-                            }
-                        }
-                        return null;
-                    }""")
-                    if parent_data and parent_data != name:
-                        title_text = clean_text(parent_data)
-                except:
-                    pass
+        self._selector_winners.update(result.pop("winners"))
+        if self.include_related_jobs:
+            logger.info(f"Extracted {len(result['related_jobs'])} related jobs")
+        return result
 
-            if (
-                name
-                and len(name) > 2
-                and "LinkedIn" not in name
-                and name not in ["Home", "Jobs", "Network"]
-            ):
-                seen_urls.add(href)
-                member = {"name": name, "linkedin_url": href}
-                if title_text and title_text != name:
-                    name = clean_text(await strong_el.text_content())
-            elif link_text and 2 < len(link_text) < 80:
-                name = link_text.split("•")[0].strip()
-
-            # Look for title in sibling elements
-            if name:
-                parent = await link.evaluate("el => el.parentElement")
-                if parent:
-                    siblings = await link.evaluate("""el => {
-                        const parent = el.parentElement;
-                        if (!parent) return [];
-                        return Array.from(parent.querySelectorAll('span, div, p')).map(e => e.textContent.trim());
-                    }""")
-                    for text in siblings:
-                        text = clean_text(text)
-                        if (
-                            text
-                            and text != name
-                            and 3 < len(text) < 100
-                            and "•" not in text
-                            and "connection" not in text
-                            and not re.match(r"^(1st|2nd|3rd)", text)
-                            and "Message" not in text
-                        ):
-                            title_text = text
-                            break
-
-            if name and len(name) > 2 and "LinkedIn" not in name:
-                seen_urls.add(href)
-                member = {"name": name, "linkedin_url": href}
-                if title_text:
-                    member["title"] = title_text
-                hiring_team.append(member)
-
-        result["hiring_team"] = hiring_team
-
-        # Extract related jobs
-        related_jobs = []
-        seen_job_urls = set()
-        current_job_id = job_url.rstrip("/").split("/")[-1]
-
-        # Strategy 1: Look for ul.js-similar-jobs-list
-        similar_list = await page.query_selector("ul.js-similar-jobs-list")
-        if not similar_list:
-            similar_list = await page.query_selector(
-                "ul.card-list.js-similar-jobs-list"
-            )
-        if not similar_list:
-            all_uls = await page.query_selector_all("ul")
-            for ul in all_uls:
-                classes = await ul.get_attribute("class")
-                if classes and (
-                    "js-similar-jobs-list" in classes
-                    or (
-                        "card-list" in classes
-                        and await ul.query_selector(
-                            ".job-card-job-posting-card-wrapper"
-                        )
-                    )
-                ):
-                    similar_list = ul
-                    break
+    def _ordered_detail_selectors(self) -> Dict[str, List[str]]:
+        """
+        Selector lists for JOB_DETAILS_JS with each family's last winner first.
 
-        if similar_list:
-            items = await similar_list.query_selector_all("li")
-            logger.info(f"Found similar jobs list with {len(items)} items")
+        Job pages in a session share one layout, so the selector that matched on
+        the previous page usually matches on the next one straight away.
 
-            for li in items:
-                if len(related_jobs) >= 8:
-                    break
+        Returns:
+            Copy of JOB_DETAILS_SELECTORS in try order
+        """
+        ordered = {}
+        for family, selectors in JOB_DETAILS_SELECTORS.items():
+            winner = self._selector_winners.get(family)
+            if winner:
+                selectors = [winner] + [s for s in selectors if s != winner]
+            ordered[family] = selectors
+        return ordered
 
-                link = await li.query_selector(
-                    "a.job-card-job-posting-card-wrapper__card-link"
-                )
-                if not link:
-                    link = await li.query_selector('a[href*="jobs"]')
-                if not link:
-                    continue
+    async def get_job_details(self, job_url: str) -> Dict[str, Any]:
+        """
+        Get detailed information about a specific job posting.
 
-                href = await link.get_attribute("href")
-                if not href:
-                    continue
+        Args:
+            job_url: URL of the job posting
 
-                # Extract job ID from URL params
-                link_job_id = None
-                try:
-                    parsed = urlparse(href)
-                    params = parse_qs(parsed.query)
-                    link_job_id = (
-                        params.get("originToLandingJobPostings", [None])[0]
-                        or params.get("currentJobId", [None])[0]
-                        or params.get("referenceJobId", [None])[0]
-                    )
-                except:
-                    pass
+        Returns:            Dictionary containing detailed job information
+        """
+        await self._ensure_setup()
 
-                if not link_job_id:
-                    match = re.search(r"/jobs/view/(\d+)", href)
-                    if match:
-                        link_job_id = match.group(1)
-
-                if (
-                    not link_job_id
-                    or link_job_id == current_job_id
-                    or link_job_id in seen_job_urls
-                ):
-                    continue
-                seen_job_urls.add(link_job_id)
-
-                # Get title
-                job_title = None
-                title_selectors = [
-                    ".artdeco-entity-lockup__title strong",
-                    ".job-card-job-posting-card-wrapper__title strong",
-                    ".artdeco-entity-lockup__title",
-                    ".job-card-job-posting-card-wrapper__title",
-                ]
-                for sel in title_selectors:
-                    title_el = await li.query_selector(sel)
-                    if title_el:
-                        job_title = clean_text(await title_el.text_content())
-                        if job_title:
-                            break
-
-                if not job_title:
-                    link_text = clean_text(await link.text_content())
-                    if link_text and 3 < len(link_text) < 200:
-                        job_title = link_text.split("\n")[0].strip()
-
-                if not job_title or len(job_title) < 3:
-                    continue
-
-                job = {"title": job_title, "job_url": href}
-
-                # Get company
-                company_selectors = [
-                    ".artdeco-entity-lockup__subtitle",
-                    ".job-card-job-posting-card-wrapper__subtitle",
-                ]
-                for sel in company_selectors:
-                    company_el = await li.query_selector(sel)
-                    if company_el:
-                        company_text = clean_text(await company_el.text_content())
-                        if company_text:
-                            job["company"] = company_text
-                            break
-
-                # Get location
-                loc_selectors = [
-                    ".artdeco-entity-lockup__caption",
-                    ".job-card-job-posting-card-wrapper__caption",
-                ]
-                for sel in loc_selectors:
-                    loc_el = await li.query_selector(sel)
-                    if loc_el:
-                        loc_text = clean_text(await loc_el.text_content())
-                        if loc_text:
-                            job["location"] = loc_text
-                            break
-
-                related_jobs.append(job)
-
-            logger.info(
-                f"Extracted {len(related_jobs)} related jobs from similar jobs list"
-            )
-        else:
-            logger.info(
-                "Similar jobs list (ul) not found, trying link-based extraction"
-            )
+        # Ensure we're logged in (same as collect_job_links method)
+        await self.auth_manager.ensure_login(self.username, self.password)
 
-        # Strategy 2: Find links to /jobs/collections/similar-jobs/
-        if len(related_jobs) == 0:
-            similar_job_links = await page.query_selector_all(
-                'a[href*="/jobs/collections/similar-jobs/"]'
-            )
-            logger.info(f"Found {len(similar_job_links)} similar job collection links")
+        return await self._get_job_details_on_page(
+            self.browser_manager.page, self.job_details_extractor, job_url
+        )
 
-            for link in similar_job_links:
-                if len(related_jobs) >= 8:
-                    break
+    async def get_jobs_details(
+        self,
+        job_urls: List[str],
+        max_concurrency: int = MAX_CONCURRENT_DETAIL_PAGES,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get detailed information for several job postings concurrently.
 
-                try:
-                    href = await link.get_attribute("href")
-                    if not href:
-                        continue
-
-                    parsed = urlparse(href)
-                    params = parse_qs(parsed.query)
-                    link_job_id = (
-                        params.get("currentJobId", [None])[0]
-                        or params.get("originToLandingJobPostings", [None])[0]
-                    )
+        Jobs are spread over the scraper's pool of tabs in the logged-in browser
+        context, so they share the session cookies and one tab's network waits
+        overlap with the others' extraction. The tabs stay open for later calls.
 
-                    if (
-                        not link_job_id
-                        or link_job_id == current_job_id
-                        or link_job_id in seen_job_urls
-                    ):
-                        continue
-                    seen_job_urls.add(link_job_id)
-
-                    # Find container
-                    container = await link.evaluate("""el => {
-                        let c = el.closest('div[componentkey]') || el.parentElement;
-                        for (let i = 0; i < 5 && c; i++) {
-                            if (c.querySelector('p, h3, h4')) break;
-                            c = c.parentElement;
-                        }
-                        return c;
-                    }""")
-
-                    if not container:
-                        continue
-
-                    # Find title
-                    job_title = None
-                    container_text = await link.evaluate(
-                        'el => el.closest("div[componentkey]")?.textContent || el.parentElement?.textContent || ""'
-                    )
-                    possible_titles = await link.evaluate("""el => {
-                        const c = el.closest('div[componentkey]') || el.parentElement;
-                        if (!c) return [];
-                        return Array.from(c.querySelectorAll('p, h3, h4, span')).map(e => e.textContent.trim());
-                    }""")
-
-                    for text in possible_titles:
-                        text = clean_text(text)
-                        if (
-                            text
-                            and 10 < len(text) < 150
-                            and "ago" not in text
-                            and "Easy Apply" not in text
-                            and "€" not in text
-                            and "$" not in text
-                            and "linkedin" not in text.lower()
-                        ):
-                            job_title = text
-                            break
-
-                    if not job_title:
-                        continue
-
-                    job = {
-                        "title": job_title,
-                        "job_url": f"https://www.linkedin.com/jobs/view/{link_job_id}/",
-                    }
+        Args:
+            job_urls: URLs of the job postings
+            max_concurrency: Maximum number of tabs used at the same time, up to
+                the page pool size
+            on_result: Called with the URL and details of each job as soon as it
+                completes, e.g. to persist results incrementally
 
-                    # Find company and location from container text
-                    if container_text:
-                        lines = [
-                            l.strip() for l in container_text.split("\n") if l.strip()
-                        ]
-                        for line in lines:
-                            if line == job_title:
-                                continue
-                            # Location
-                            if (
-                                "Germany" in line
-                                or "Remote" in line
-                                or "Berlin" in line
-                                or re.match(r"[A-Z][a-z]+, [A-Z]", line)
-                            ):
-                                if "ago" not in line and len(line) < 100:
-                                    job["location"] = line
-                            # Company
-                            elif (
-                                "company" not in job
-                                and 2 < len(line) < 80
-                                and "€" not in line
-                                and "$" not in line
-                                and "ago" not in line
-                                and "Apply" not in line
-                            ):
-                                job["company"] = line
+        Returns:
+            List of job detail dictionaries in the same order as job_urls
+        """
+        await self._ensure_setup()
+        await self.auth_manager.ensure_login(self.username, self.password)
 
-                    related_jobs.append(job)
-                except Exception as e:
-                    logger.debug(f"Error processing similar job link: {e}")
+        if not job_urls:
+            return []
 
-            logger.info(
-                f"Extracted {len(related_jobs)} related jobs from collection links"
-            )
+        concurrency = max(
+            1, min(max_concurrency, len(job_urls), self.page_pool.max_size)
+        )
+        semaphore = asyncio.Semaphore(concurrency)
 
-        # Strategy 3: Fallback - scan all /jobs/view/ links
-        if len(related_jobs) == 0:
-            job_view_links = await page.query_selector_all('a[href*="/jobs/view/"]')
-            for link in job_view_links:
-                if len(related_jobs) >= 8:
-                    break
-
-                href = await link.get_attribute("href")
-                if not href:
-                    continue
-
-                match = re.search(r"/jobs/view/(\d+)", href)
-                if not match:
-                    continue
-                link_job_id = match.group(1)
-
-                if link_job_id == current_job_id or link_job_id in seen_job_urls:
-                    continue
-                seen_job_urls.add(link_job_id)
-
-                # Get title
-                job_title = None
-                strong_in_link = await link.query_selector("strong")
-                if strong_in_link:
-                    job_title = clean_text(await strong_in_link.text_content())
-
-                if not job_title:
-                    link_text = clean_text(await link.text_content())
-                    if (
-                        link_text
-                        and 3 < len(link_text) < 150
-                        and "apply" not in link_text.lower()
-                        and "see all" not in link_text.lower()
-                        and "show more" not in link_text.lower()
-                    ):
-                        job_title = link_text
+        async def scrape(cache_key: str, job_url: str) -> Dict[str, Any]:
+            try:
+                async with semaphore:
+                    try:
+                        page = await self.page_pool.acquire()
+                    except Exception as e:
+                        # One job failing must not abort the rest of the batch
+                        logger.error(f"Could not open a tab for {job_url}: {e}")
+                        return self._error_job_details(job_url, e)
+                    try:
+                        extractor = self._pool_extractors.get(page)
+                        if extractor is None:
+                            extractor = JobDetailsExtractor(page, self.timeout)
+                            self._pool_extractors[page] = extractor
+                        return await self._get_job_details_on_page(
+                            page, extractor, job_url
+                        )
+                    finally:
+                        self.page_pool.release(page)
+            finally:
+                del self._details_in_flight[cache_key]
+
+        async def extract(job_url: str) -> Dict[str, Any]:
+            # Cache hits take neither a slot nor a tab, and a job already being
+            # scraped (under another URL variant, say) is awaited, not reloaded
+            cache_key = self._details_cache_key(job_url)
+            job_details = self._cached_job_details(cache_key, job_url)
+            if job_details is None:
+                task = self._details_in_flight.get(cache_key)
+                if task is None:
+                    task = asyncio.create_task(scrape(cache_key, job_url))
+                    self._details_in_flight[cache_key] = task
+                job_details = deepcopy(await task)
+            if on_result:
+                on_result(job_url, job_details)
+            return job_details
 
-                if not job_title or len(job_title) < 3:
-                    continue
+        logger.info(
+            f"Extracting details for {len(job_urls)} jobs using {concurrency} tabs"
+        )
+        return await asyncio.gather(*(extract(url) for url in job_urls))
 
-                job = {"title": job_title, "job_url": href}
+    async def _get_job_details_on_page(
+        self, page, extractor: JobDetailsExtractor, job_url: str
+    ) -> Dict[str, Any]:
+        """
+        Get the details of a job posting, loading it in the given tab unless
+        the same job was already scraped in this session.
 
-                # Try to find company and location in parent container
-                try:
-                    parent_info = await link.evaluate("""el => {
-                        let container = el.parentElement;
-                        for (let i = 0; i < 5 && container; i++) {
-                            if (container.tagName === 'LI' || container.tagName === 'ARTICLE') break;
-                            container = container.parentElement;
-                        }
-                        if (!container) container = el.parentElement;
-                        
-                        const companyLink = container?.querySelector('a[href*="/company/"]');
-                        const company = companyLink ? companyLink.textContent.trim() : null;
-                        
-                        const spans = container ? Array.from(container.querySelectorAll('span')) : [];
-                        let location = null;
-                        for (const span of spans) {
-                            const text = span.textContent.trim();
-                            if (text && (text.includes(',') || text.toLowerCase().includes('remote')) &&
-                                !text.includes('ago') && text.length < 100) {
-                                location = text;
-                                break;
-                            }
-                        }
-                        
-                        return {company, location};
-                    }""")
-
-                    if parent_info.get("company"):
-                        job["company"] = parent_info["company"]
-                    if parent_info.get("location"):
-                        job["location"] = parent_info["location"]
-                except:
-                    pass
+        URL variants of one job (tracking parameters, search vs. view URLs)
+        share a cache entry keyed on the job id. Failed extractions are not
+        cached.
 
-                related_jobs.append(job)
+        Args:
+            page: Page to navigate and extract from
+            extractor: JobDetailsExtractor bound to page
+            job_url: URL of the job posting
 
-        result["related_jobs"] = related_jobs
+        Returns:
+            Dictionary containing detailed job information
+        """
+        cache_key = self._details_cache_key(job_url)
+        cached = self._cached_job_details(cache_key, job_url)
+        if cached is not None:
+            return cached
+
+        job_details = await self._scrape_job_details_on_page(page, extractor, job_url)
+        if "error" not in job_details:
+            self._details_cache[cache_key] = deepcopy(job_details)
+            if len(self._details_cache) > JOB_DETAILS_CACHE_SIZE:
+                self._details_cache.popitem(last=False)
+        return job_details
+
+    @staticmethod
+    def _details_cache_key(job_url: str) -> str:
+        """Return the job id of a job URL, or the URL itself if it has none."""
+        match = JOB_ID_URL_RE.search(job_url)
+        return match.group(1) if match else job_url
+
+    def _cached_job_details(
+        self, cache_key: str, job_url: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the cached details of a job, if any.
 
-        return result
+        Args:
+            cache_key: Job id from _details_cache_key
+            job_url: URL of the job posting, for logging
 
-    async def get_job_details(self, job_url: str) -> Dict[str, Any]:
+        Returns:
+            Copy of the cached details, or None on a cache miss
         """
-        Get detailed information about a specific job posting.
+        cached = self._details_cache.get(cache_key)
+        if cached is None:
+            return None
+        self._details_cache.move_to_end(cache_key)
+        logger.info(f"Using cached details for {job_url}")
+        return deepcopy(cached)
+
+    async def _goto_job_page(self, page, job_url: str) -> None:
+        """
+        Load a job posting in the given tab, retrying transient failures.
+
+        The navigation is paced by the shared throttle, so concurrent tabs do
+        not hit LinkedIn all at once.
 
         Args:
+            page: Page to navigate
             job_url: URL of the job posting
+        """
+        await self.throttle.wait()
+        started = time.monotonic()
+        await async_retry(
+            lambda: page.goto(job_url, wait_until="domcontentloaded"),
+            retry_if=is_retryable_response,
+        )
+        self.throttle.record(time.monotonic() - started)
 
-        Returns:            Dictionary containing detailed job information
+    async def _scrape_job_details_on_page(
+        self, page, extractor: JobDetailsExtractor, job_url: str
+    ) -> Dict[str, Any]:
         """
-        await self._ensure_setup()
+        Extract the details of a job posting using the given tab.
 
-        # Ensure we're logged in (same as collect_job_links method)
-        await self.auth_manager.ensure_login(self.username, self.password)
+        Args:
+            page: Page to navigate and extract from
+            extractor: JobDetailsExtractor bound to page
+            job_url: URL of the job posting
 
+        Returns:
+            Dictionary containing detailed job information
+        """
         try:
-            # Navigate to job page and wait for DOM to be ready
-            await self.browser_manager.page.goto(
-                job_url, wait_until="domcontentloaded", timeout=self.timeout
-            )
+            # Login generation the tab navigates with, to tell on a redirect
+            # whether another tab has already logged in again
+            login_generation = self.auth_manager.login_generation
+            await self._goto_job_page(page, job_url)
             logger.info(f"Navigated to {job_url}")
 
-            # Small wait for JS to hydrate the page
-            await asyncio.sleep(3)
+            # Wait for the page to hydrate rather than for a fixed time
+            try:
+                await page.wait_for_selector(
+                    "h1, article, main", state="attached", timeout=PAGE_READY_TIMEOUT
+                )
+            except PlaywrightTimeoutError:
+                logger.debug("Job page not hydrated yet, scrolling anyway")
 
-            # Scroll multiple times to load all lazy content (hiring team, related jobs)
+            # Scroll to load all lazy content (hiring team, related jobs)
             try:
-                # Scroll down in stages to trigger lazy loading
+                # Scroll down until the page stops growing, waiting for new
+                # content to arrive instead of pausing after every scroll
                 for _ in range(5):
-                    await self.browser_manager.page.evaluate(
-                        "window.scrollTo(0, document.body.scrollHeight)"
-                    )
-                    await asyncio.sleep(1.5)
+                    height = await page.evaluate(SCROLL_TO_BOTTOM_JS)
+                    try:
+                        await page.wait_for_function(
+                            "height => document.body.scrollHeight > height",
+                            arg=height,
+                            timeout=LAZY_CONTENT_TIMEOUT,
+                        )
+                    except PlaywrightTimeoutError:
+                        break
 
                 # Scroll back up to ensure all sections are visible
-                await self.browser_manager.page.evaluate("window.scrollTo(0, 0)")
-                await asyncio.sleep(1)
-
-                # Try to click any "show more" or "see more jobs" buttons - be very specific to avoid navigation
-                # Only click buttons, not links, and check we stay on the same page
-                show_more_selectors = [
-                    'button:has-text("Show more")',
-                    'button:has-text("See more")',
-                    'button[aria-label*="Show more"]',
-                    "button.jobs-description__footer-button",
-                ]
-                for selector in show_more_selectors:
-                    try:
-                        # Store current URL to verify we don't navigate away
-                        current_url = self.browser_manager.page.url
-
-                        btn = await self.browser_manager.page.query_selector(selector)
-                        if btn and await btn.is_visible():
-                            # Only click if it's actually a button element, not a link
-                            tag_name = await btn.evaluate(
-                                "el => el.tagName.toLowerCase()"
+                await page.evaluate("window.scrollTo(0, 0)")
+
+                # Click the "show more" buttons in one evaluate; only buttons,
+                # not links, and check we stay on the same page
+                try:
+                    current_url = page.url
+                    clicked = await page.evaluate(
+                        CLICK_SHOW_MORE_JS,
+                        {
+                            "selectors": SHOW_MORE_BUTTON_SELECTORS,
+                            "texts": SHOW_MORE_BUTTON_TEXTS,
+                        },
+                    )
+                    if clicked:
+                        await page.wait_for_load_state("domcontentloaded")
+                        # Check if we got redirected
+                        if page.url != current_url and "/company/" in page.url:
+                            logger.warning(
+                                "Accidentally navigated to company page, going back"
                             )
-                            if tag_name == "button":
-                                await btn.click()
-                                await asyncio.sleep(2)
-
-                                # Check if we got redirected
-                                if (
-                                    self.browser_manager.page.url != current_url
-                                    and "/company/" in self.browser_manager.page.url
-                                ):
-                                    logger.warning(
-                                        "Accidentally navigated to company page, going back"
-                                    )
-                                    await self.browser_manager.page.goto(
-                                        current_url,
-                                        wait_until="domcontentloaded",
-                                        timeout=self.timeout,
-                                    )
-                                    await asyncio.sleep(2)
-                    except Exception as e:
-                        logger.debug(f"Show more button interaction: {e}")
-                        pass
+                            await page.goto(current_url, wait_until="domcontentloaded")
+                except Exception as e:
+                    logger.debug(f"Show more button interaction: {e}")
 
                 # Wait specifically for similar jobs section to appear (if it exists)
                 try:
-                    await self.browser_manager.page.wait_for_selector(
+                    await page.wait_for_selector(
                         'ul.js-similar-jobs-list, section:has-text("Similar jobs")',
                         state="attached",
                         timeout=3000,
@@ -1003,22 +1002,19 @@ class LinkedInScraper:
                 logger.debug(f"Scrolling/waiting error: {e}")
 
             # Check if we're on the right page
-            if (
-                "login" in self.browser_manager.page.url.lower()
-                or "checkpoint" in self.browser_manager.page.url.lower()
-            ):
+            if "login" in page.url.lower() or "checkpoint" in page.url.lower():
                 logger.warning("Redirected to login/checkpoint page!")
-                # Try logging in again
-                await self.auth_manager.ensure_login(self.username, self.password)
-                await self.browser_manager.page.goto(
-                    job_url, wait_until="domcontentloaded", timeout=self.timeout
+                # The session expired; log in again on the main page unless
+                # another tab did so since this one started navigating
+                await self.auth_manager.relogin(
+                    self.username, self.password, login_generation
                 )
-                await asyncio.sleep(3)
+                await self._goto_job_page(page, job_url)
 
             # Wait for structural elements to be attached to DOM
             try:
                 # Wait for standard structural elements instead of specific classes which may be evaluated
-                await self.browser_manager.page.wait_for_selector(
+                await page.wait_for_selector(
                     "h1, article, main", state="attached", timeout=5000
                 )
             except PlaywrightTimeoutError:
@@ -1044,11 +1040,9 @@ class LinkedInScraper:
                 "related_jobs": "NA",
             }
 
-            # Try direct extraction using Playwright Python API
+            # Read the top card, hiring team and related jobs in one evaluate
             try:
-                js_data = await self._extract_job_details_python(
-                    self.browser_manager.page, job_url
-                )
+                js_data = await self._extract_job_details(page, job_url)
 
                 if js_data:
                     logger.info(
@@ -1079,11 +1073,7 @@ class LinkedInScraper:
                 job_details.get(k) == "NA" for k in ["title", "company", "location"]
             ):
                 try:
-                    basic_info = (
-                        await self.job_details_extractor.extract_job_basic_info(
-                            self.browser_manager.page
-                        )
-                    )
+                    basic_info = await extractor.extract_job_basic_info(page)
                     for key in ["title", "company", "location"]:
                         if job_details.get(key) == "NA" and basic_info.get(key):
                             job_details[key] = basic_info[key]
@@ -1097,17 +1087,15 @@ class LinkedInScraper:
 
             # 2. Description Fallback
             if job_details["description"] == "NA":
-                job_details[
-                    "description"
-                ] = await self.job_details_extractor.extract_complete_job_description()
+                job_details["description"] = (
+                    await extractor.extract_complete_job_description()
+                )
 
             # 3. Date Posted Fallback
             if job_details["date_posted"] == "NA":
                 try:
                     for selector in ADDITIONAL_POSTED_DATE_SELECTORS:
-                        element = await self.browser_manager.page.query_selector(
-                            selector
-                        )
+                        element = await page.query_selector(selector)
                         if element and await element.is_visible():
                             text = await element.text_content()
                             if text and any(
@@ -1123,7 +1111,7 @@ class LinkedInScraper:
             try:
                 insights = []
                 # Work prefs
-                elements = await self.browser_manager.page.query_selector_all(
+                elements = await page.query_selector_all(
                     ".job-details-fit-level-preferences .tvm__text--low-emphasis strong"
                 )
                 for el in elements:
@@ -1133,7 +1121,7 @@ class LinkedInScraper:
                             insights.append(t.strip())
 
                 # Metadata / Additional insights
-                metadata = await self.job_details_extractor.extract_job_metadata()
+                metadata = await extractor.extract_job_metadata()
                 job_details.update({k: v for k, v in metadata.items() if v != "NA"})
 
                 if insights:
@@ -1148,28 +1136,21 @@ class LinkedInScraper:
 
             # 5. Apply info
             if job_details["apply_info"] == "NA":
+                apply_button = await extractor.extract_apply_button_info()
+                if apply_button and apply_button.get("easy_apply"):
+                    job_details["easy_apply"] = True
+
                 if job_details["easy_apply"]:
                     job_details["apply_info"] = "Easy Apply"
-                else:
-                    # Try to find external link
-                    try:
-                        for selector in ADDITIONAL_APPLY_BUTTON_SELECTORS:
-                            btn = await self.browser_manager.page.query_selector(
-                                selector
-                            )
-                            if btn and await btn.is_visible():
-                                href = await btn.get_attribute("href")
-                                if href and "linkedin.com" not in href:
-                                    job_details["apply_info"] = href
-                                    break
-                    except Exception:
-                        pass
+                elif apply_button:
+                    # Try to use the external link
+                    href = apply_button.get("href")
+                    if href and "linkedin.com" not in href:
+                        job_details["apply_info"] = href
 
             # 6. Skills
             try:
-                skills_section = await self.browser_manager.page.query_selector(
-                    SKILLS_SECTION_SELECTORS[0]
-                )
+                skills_section = await page.query_selector(SKILLS_SECTION_SELECTORS[0])
                 if skills_section:
                     skill_elements = await skills_section.query_selector_all("li")
                     skills = [await el.text_content() for el in skill_elements]
@@ -1180,50 +1161,80 @@ class LinkedInScraper:
                 pass
 
             # 7. Hiring Team Fallback (if JS extraction missed it)
-            if job_details["hiring_team"] == "NA" or job_details["hiring_team"] == []:
+            if self.include_hiring_team and (
+                job_details["hiring_team"] == "NA" or job_details["hiring_team"] == []
+            ):
                 try:
-                    hiring_team = await self.job_details_extractor.extract_hiring_team()
+                    hiring_team = await extractor.extract_hiring_team()
                     if hiring_team and len(hiring_team) > 0:
                         job_details["hiring_team"] = hiring_team
                 except Exception as e:
                     logger.debug(f"Hiring team extraction error: {e}")
 
             # 8. Related Jobs Fallback (if JS extraction missed it)
-            if job_details["related_jobs"] == "NA" or job_details["related_jobs"] == []:
+            if self.include_related_jobs and (
+                job_details["related_jobs"] == "NA" or job_details["related_jobs"] == []
+            ):
                 try:
-                    related_jobs = (
-                        await self.job_details_extractor.extract_related_jobs()
-                    )
+                    related_jobs = await extractor.extract_related_jobs()
                     if related_jobs and len(related_jobs) > 0:
                         job_details["related_jobs"] = related_jobs
                 except Exception as e:
                     logger.debug(f"Related jobs extraction error: {e}")
 
+            # 9. Company Info (opt-in)
+            if self.include_company_info:
+                try:
+                    job_details["company_info"] = await extractor.extract_company_info()
+                except Exception as e:
+                    logger.debug(f"Company info extraction error: {e}")
+
             return job_details
 
         except Exception as e:
             logger.error(f"Error extracting job details: {str(e)}")
-            # Return a minimal job details object if extraction fails
-            return {
-                "url": job_url,
-                "source": "linkedin",
-                "scraped_at": datetime.now().isoformat(),
-                "error": str(e),
-                "title": "Error extracting job",
-                "company": "Unknown",
-                "location": "Unknown",
-                "description": "Error extracting job details",
-                "date_posted": "NA",
-                "job_insights": "NA",
-                "easy_apply": False,
-                "apply_info": "NA",
-                "company_info": "NA",
-                "hiring_team": "NA",
-                "related_jobs": "NA",
-            }
+            return self._error_job_details(job_url, e)
+
+    @staticmethod
+    def _error_job_details(job_url: str, error: Exception) -> Dict[str, Any]:
+        """
+        Minimal job details object returned when extraction fails.
+
+        Args:
+            job_url: URL of the job posting
+            error: Exception that stopped the extraction
+
+        Returns:
+            Dictionary with the usual fields and the error message under "error"
+        """
+        return {
+            "url": job_url,
+            "source": "linkedin",
+            "scraped_at": datetime.now().isoformat(),
+            "error": str(error),
+            "title": "Error extracting job",
+            "company": "Unknown",
+            "location": "Unknown",
+            "description": "Error extracting job details",
+            "date_posted": "NA",
+            "job_insights": "NA",
+            "easy_apply": False,
+            "apply_info": "NA",
+            "company_info": "NA",
+            "hiring_team": "NA",
+            "related_jobs": "NA",
+        }
+
+    def force_reauth(self) -> None:
+        """Make the next call check the LinkedIn login again instead of assuming it."""
+        if self.auth_manager:
+            self.auth_manager.invalidate()
 
     async def close(self) -> None:
         """Close the browser session."""
+        if self.page_pool:
+            await self.page_pool.close()
+            self._pool_extractors = {}
         if self.browser_manager:
             await self.browser_manager.close()
 
@@ -1248,8 +1259,20 @@ class LinkedInScraperSync:
         browser: str = "chromium",
         proxy: Optional[str] = None,
         anonymize: bool = True,
+        include_company_info: bool = False,
+        include_hiring_team: bool = True,
+        include_related_jobs: bool = True,
     ):
-        self.scraper = LinkedInScraper(headless, timeout, browser, proxy, anonymize)
+        self.scraper = LinkedInScraper(
+            headless,
+            timeout,
+            browser,
+            proxy,
+            anonymize,
+            include_company_info,
+            include_hiring_team,
+            include_related_jobs,
+        )
         self._loop = None
 
     def _run_async(self, coro):
@@ -1302,6 +1325,21 @@ class LinkedInScraperSync:
         """Synchronous version of get_job_details."""
         return self._run_async(self.scraper.get_job_details(job_url))
 
+    def get_jobs_details(
+        self,
+        job_urls: List[str],
+        max_concurrency: int = MAX_CONCURRENT_DETAIL_PAGES,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Synchronous version of get_jobs_details."""
+        return self._run_async(
+            self.scraper.get_jobs_details(job_urls, max_concurrency, on_result)
+        )
+
+    def force_reauth(self) -> None:
+        """Make the next call check the LinkedIn login again instead of assuming it."""
+        self.scraper.force_reauth()
+
     def close(self) -> None:
         """Close the scraper session."""
         if self._loop:
@@ -5,13 +5,108 @@ Utility functions for LinkedIn scraper using Playwright.
 import asyncio
 import random
 import os
+import re
+import time
 import logging
 from datetime import datetime
-from typing import List, Optional, Union
-from playwright.async_api import Page, ElementHandle
+from typing import Awaitable, Callable, List, Optional, TypeVar, Union
+from playwright.async_api import Page, ElementHandle, Response, Error as PlaywrightError
+
+from .config import (
+    SCREENSHOT_QUALITY, PAGE_READY_TIMEOUT, READY_MIN_SLEEP, READY_MAX_SLEEP,
+    RETRY_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY,
+    THROTTLE_TARGET_DELAY, THROTTLE_SMOOTHING, THROTTLE_JITTER
+)
 
 logger = logging.getLogger("linkedin_scraper")
 
+T = TypeVar("T")
+
+# Dedicated generator for the human-like pauses, kept apart from the global one
+SLEEP_RNG = random.Random()
+
+# Job id in either a /jobs/view/<id> path or a ?currentJobId=<id> search pane
+# URL; the one key for deduplicating links and caching job details
+JOB_ID_URL_RE = re.compile(r"(?:/jobs/view/|[?&]currentJobId=)(\d+)")
+
+# Plain "#id" and ".class" selectors can bypass the CSS selector engine
+ID_SELECTOR_RE = re.compile(r"^#[\w-]+$")
+CLASS_SELECTOR_RE = re.compile(r"^\.[\w-]+$")
+
+FAST_LOOKUP_JS = """([kind, name]) => {
+    let el;
+    if (kind === "id") {
+        el = document.getElementById(name);
+    } else if (kind === "class") {
+        el = document.getElementsByClassName(name)[0];
+    } else {
+        el = document.querySelector(name);
+    }
+    if (!el || !el.getClientRects().length) return null;
+    return el.textContent;
+}"""
+
+# The functions below take the search root (document or an element) as their
+# first argument so the same script serves both Page and ElementHandle lookups.
+
+# First visible element matching any of the selectors, tried in order
+QUERY_FIRST_VISIBLE_JS = """(root, selectors) => {
+    for (const selector of selectors) {
+        let elements;
+        try {
+            elements = root.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        for (const el of elements) {
+            if (el.getClientRects().length) return el;
+        }
+    }
+    return null;
+}"""
+
+# [selector, text] of the first visible element with non-empty text, tried in order
+FIRST_VISIBLE_TEXT_JS = """(root, selectors) => {
+    for (const selector of selectors) {
+        let elements;
+        try {
+            elements = root.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        for (const el of elements) {
+            if (!el.getClientRects().length) continue;
+            const text = (el.textContent || "").trim();
+            if (text) return [selector, text];
+        }
+    }
+    return null;
+}"""
+
+# Resolves with the first visible element matching the selector, re-checking on
+# DOM mutations rather than on a polling interval; null after the timeout
+ELEMENT_APPEARED_JS = """([selector, timeout]) => new Promise((resolve) => {
+    const find = () => [...document.querySelectorAll(selector)].find((el) => el.getClientRects().length) || null;
+    const found = find();
+    if (found) return resolve(found);
+    const finish = (el) => {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(el);
+    };
+    const observer = new MutationObserver(() => {
+        const el = find();
+        if (el) finish(el);
+    });
+    const timer = setTimeout(() => finish(find()), timeout);
+    observer.observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeFilter: ["class", "style", "hidden"],
+    });
+})"""
+
 
 def random_sleep(min_seconds: float = 2.0, max_seconds: float = 5.0) -> None:
     """
@@ -21,8 +116,7 @@ def random_sleep(min_seconds: float = 2.0, max_seconds: float = 5.0) -> None:
         min_seconds: Minimum sleep time in seconds
         max_seconds: Maximum sleep time in seconds
     """
-    import time
-    time.sleep(random.uniform(min_seconds, max_seconds))
+    time.sleep(min_seconds + (max_seconds - min_seconds) * SLEEP_RNG.random())
 
 
 async def async_random_sleep(min_seconds: float = 2.0, max_seconds: float = 5.0) -> None:
@@ -33,7 +127,127 @@ async def async_random_sleep(min_seconds: float = 2.0, max_seconds: float = 5.0)
         min_seconds: Minimum sleep time in seconds
         max_seconds: Maximum sleep time in seconds
     """
-    await asyncio.sleep(random.uniform(min_seconds, max_seconds))
+    await asyncio.sleep(min_seconds + (max_seconds - min_seconds) * SLEEP_RNG.random())
+
+
+class AdaptiveThrottle:
+    """
+    Paces navigations from their observed latency instead of fixed sleeps.
+
+    Keeps an exponentially weighted moving average (EWMA) of how long recent
+    navigations took to settle. Before the next navigation it only sleeps for
+    what is left of the target interval, so slow responses are not padded with
+    further waits while fast ones still look human.
+    """
+
+    def __init__(
+        self,
+        target_delay: float = THROTTLE_TARGET_DELAY,
+        smoothing: float = THROTTLE_SMOOTHING,
+        jitter: float = THROTTLE_JITTER,
+    ):
+        """
+        Initialize the throttle.
+
+        Args:
+            target_delay: Seconds aimed for between consecutive navigations
+            smoothing: Weight of the newest latency sample in the EWMA
+            jitter: Fraction by which each wait is randomly stretched or shrunk
+        """
+        self.target_delay = target_delay
+        self.smoothing = smoothing
+        self.jitter = jitter
+        self.ewma_latency: Optional[float] = None
+        # Callers sharing the throttle (e.g. detail tabs) wait in turn
+        self._lock = asyncio.Lock()
+
+    def record(self, latency: float) -> None:
+        """
+        Feed the time a navigation took to settle into the average.
+
+        Args:
+            latency: Observed latency in seconds
+        """
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = self.smoothing * latency + (1 - self.smoothing) * self.ewma_latency
+
+    async def wait(self) -> None:
+        """
+        Sleep for the remainder of the target interval, with jitter.
+
+        Concurrent callers wait one after another, so tabs sharing the throttle
+        start their navigations spaced out instead of all at once.
+        """
+        async with self._lock:
+            delay = max(0.0, self.target_delay - (self.ewma_latency or 0.0))
+            delay *= SLEEP_RNG.uniform(1 - self.jitter, 1 + self.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+
+async def async_retry(
+    fn: Callable[[], Awaitable[T]],
+    attempts: int = RETRY_ATTEMPTS,
+    base: float = RETRY_BASE_DELAY,
+    cap: float = RETRY_MAX_DELAY,
+    jitter: bool = True,
+    retry_if: Optional[Callable[[T], bool]] = None,
+) -> T:
+    """
+    Await fn, retrying transient failures with capped exponential backoff.
+
+    Playwright errors (timeouts, closed targets, network failures) are retried,
+    as are results for which retry_if returns True. The delay before retry i is
+    min(cap, base * 2**i), scaled by a random factor in [0.5, 1.5) when jitter
+    is enabled.
+
+    Args:
+        fn: Zero-argument coroutine function to call
+        attempts: Maximum number of calls
+        base: Delay before the first retry in seconds
+        cap: Upper bound for a single delay in seconds
+        jitter: Whether to randomise the delays
+        retry_if: Predicate marking a returned result as a failure to retry
+
+    Returns:
+        The result of the last call
+
+    Raises:
+        PlaywrightError: If the last attempt raised one
+    """
+    for attempt in range(attempts):
+        last_attempt = attempt == attempts - 1
+        try:
+            result = await fn()
+        except PlaywrightError as e:
+            if last_attempt:
+                raise
+            reason = str(e).splitlines()[0] if str(e) else type(e).__name__
+        else:
+            if last_attempt or retry_if is None or not retry_if(result):
+                return result
+            reason = "unsuccessful result"
+
+        delay = min(cap, base * 2 ** attempt)
+        if jitter:
+            delay *= SLEEP_RNG.random() + 0.5
+        logger.debug(f"Attempt {attempt + 1}/{attempts} failed ({reason}), retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+
+def is_retryable_response(response: Optional[Response]) -> bool:
+    """
+    Check whether a navigation response signals a transient server failure.
+
+    Args:
+        response: Response returned by page.goto, if any
+
+    Returns:
+        True for 429 Too Many Requests and 5xx responses
+    """
+    return response is not None and (response.status == 429 or response.status >= 500)
 
 
 async def save_screenshot(page: Page, label: str, subfolder: str = "linkedin") -> str:
@@ -51,10 +265,12 @@ async def save_screenshot(page: Page, label: str, subfolder: str = "linkedin") -
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     screenshot_dir = os.path.join("output", subfolder)
     os.makedirs(screenshot_dir, exist_ok=True)
-    screenshot_path = os.path.join(screenshot_dir, f"{label}_{timestamp}.png")
+    screenshot_path = os.path.join(screenshot_dir, f"{label}_{timestamp}.jpg")
 
     try:
-        await page.screenshot(path=screenshot_path)
+        await page.screenshot(
+            path=screenshot_path, type="jpeg", quality=SCREENSHOT_QUALITY
+        )
         logger.info(f"Saved screenshot to {screenshot_path}")
         return screenshot_path
     except Exception as e:
@@ -62,6 +278,35 @@ async def save_screenshot(page: Page, label: str, subfolder: str = "linkedin") -
         return ""
 
 
+async def fast_text_lookup(page: Page, selector: str) -> Optional[str]:
+    """
+    Read the text of the first visible element matching a selector in one round-trip.
+
+    Pure id and class selectors are dispatched to getElementById /
+    getElementsByClassName; anything else falls back to querySelector.
+
+    Args:
+        page: Playwright Page instance
+        selector: CSS selector to look up
+
+    Returns:
+        Text content of the element, or None if missing or hidden
+    """
+    if ID_SELECTOR_RE.match(selector):
+        lookup = ["id", selector[1:]]
+    elif CLASS_SELECTOR_RE.match(selector):
+        lookup = ["class", selector[1:]]
+    else:
+        lookup = ["css", selector]
+
+    try:
+        return await page.evaluate(FAST_LOOKUP_JS, lookup)
+    except PlaywrightError as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Error looking up '{selector}': {e}")
+        return None
+
+
 async def extract_text_by_selectors(
     page_or_element: Union[Page, ElementHandle], 
     selectors: List[str], 
@@ -78,30 +323,74 @@ async def extract_text_by_selectors(
     Returns:
         First non-empty text found, or None if nothing found
     """
-    for selector in selectors:
-        try:
-            elements = await page_or_element.query_selector_all(selector)
-            for element in elements:
-                if await element.is_visible():
-                    text = await element.text_content()
-                    if text and text.strip():
-                        text = text.strip()
-                        logger.debug(
-                            f"Extracted {element_name} using selector '{selector}': {text}"
-                        )
-                        return text
-        except Exception as e:
-            logger.debug(
-                f"Error with selector '{selector}' for {element_name}: {e}"
-            )
-            continue
-
-    logger.debug(
-        f"Could not extract {element_name} with any of the provided selectors"
-    )
+    try:
+        match = await _evaluate_in_root(page_or_element, FIRST_VISIBLE_TEXT_JS, selectors)
+        if match:
+            selector, text = match
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Extracted {element_name} using selector '{selector}': {text}"
+                )
+            return text
+    except PlaywrightError as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Error extracting {element_name}: {e}")
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Could not extract {element_name} with any of the provided selectors"
+        )
     return None
 
 
+async def query_first_visible(
+    page_or_element: Union[Page, ElementHandle], selectors: List[str]
+) -> Optional[ElementHandle]:
+    """
+    Find the first visible element matching any of the selectors in one round-trip.
+
+    Args:
+        page_or_element: Page or ElementHandle to search within
+        selectors: List of CSS selectors to try, in priority order
+
+    Returns:
+        The matching ElementHandle, or None if nothing visible matched
+    """
+    try:
+        handle = await _evaluate_in_root(
+            page_or_element, QUERY_FIRST_VISIBLE_JS, selectors, as_handle=True
+        )
+        element = handle.as_element()
+        if element is None:
+            await handle.dispose()
+        return element
+    except PlaywrightError as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Error querying selectors {selectors}: {e}")
+        return None
+
+
+async def _evaluate_in_root(
+    page_or_element: Union[Page, ElementHandle], script: str, arg, as_handle: bool = False
+):
+    """
+    Evaluate a (root, arg) script with the document or the element as its root.
+
+    Args:
+        page_or_element: Page (root is document) or ElementHandle (root is the element)
+        script: JavaScript function taking the root and arg
+        arg: Serializable argument passed to the script
+        as_handle: Return a JSHandle instead of the deserialized value
+
+    Returns:
+        The script result
+    """
+    if isinstance(page_or_element, Page):
+        script = f"(arg) => ({script})(document, arg)"
+    evaluate = page_or_element.evaluate_handle if as_handle else page_or_element.evaluate
+    return await evaluate(script, arg)
+
+
 async def wait_for_any_selector(page: Page, selectors: List[str], timeout: int = 20000) -> Optional[str]:
     """
     Wait for any of the provided selectors to appear on the page.
@@ -136,3 +425,56 @@ async def wait_for_any_selector(page: Page, selectors: List[str], timeout: int =
     except Exception as e:
         logger.debug(f"Error waiting for selectors: {e}")
         return None
+
+
+async def wait_for_element(page: Page, selector: str, timeout: int = 5000) -> Optional[ElementHandle]:
+    """
+    Wait for a visible element matching the selector using an in-page MutationObserver.
+
+    Reacts to the DOM change that renders the element instead of waiting for
+    the next poll. Only CSS selectors are supported.
+
+    Args:
+        page: Playwright Page instance
+        selector: CSS selector, may be a comma-joined union
+        timeout: Timeout in milliseconds
+
+    Returns:
+        The matched ElementHandle, or None if it did not appear in time
+    """
+    try:
+        handle = await page.evaluate_handle(ELEMENT_APPEARED_JS, [selector, timeout])
+    except PlaywrightError as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Waiting for {selector} failed: {e}")
+        return None
+    return handle.as_element()
+
+
+async def wait_for_page_ready(page: Page, timeout: int = PAGE_READY_TIMEOUT) -> bool:
+    """
+    Wait until the document has loaded, then pause briefly with jitter.
+
+    Returns as soon as the page is ready rather than sleeping for a worst-case
+    duration. Network idle is not waited for: LinkedIn keeps background
+    connections open, so it would usually run into the timeout.
+
+    Args:
+        page: Playwright Page instance
+        timeout: Timeout in milliseconds for the readyState poll
+
+    Returns:
+        True if the document finished loading, False if the wait timed out
+    """
+    try:
+        await page.wait_for_function(
+            "document.readyState === 'complete'", polling=100, timeout=timeout
+        )
+        ready = True
+    except PlaywrightError as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Page not ready within {timeout}ms: {e}")
+        ready = False
+    # A short human-like pause instead of the worst-case sleep it replaces
+    await async_random_sleep(READY_MIN_SLEEP, READY_MAX_SLEEP)
+    return ready
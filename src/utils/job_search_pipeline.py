@@ -124,6 +124,43 @@ class JobSearchPipeline:
                 print(f"[ERROR] Failed to initialize LinkedIn scraper: {e}")
                 self.linkedin_scraper = None
     
+    def _store_job_details(self, job_url: str, job_details: Dict[str, Any], location_results: List[Dict[str, Any]]) -> bool:
+        """
+        Save one scraped job to the database, or keep it for the JSON output.
+        
+        Args:
+            job_url: URL the job was scraped from
+            job_details: Details returned by the scraper
+            location_results: Results of the current location, used without a database
+            
+        Returns:
+            True if the job was saved or kept, False if scraping or saving failed
+        """
+        if not job_details or job_details.get("error"):
+            print(f"    ❌ Failed to get job details for {job_url}")
+            return False
+        
+        # Add metadata
+        job_details['source'] = 'linkedin'
+        job_details['source_url'] = job_url
+        job_details['scraped_at'] = time.strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Save to database immediately with detailed feedback
+        if self.db:
+            feedback = self.db.add_job_with_immediate_feedback(job_details)
+            if not feedback["success"]:
+                print(f"    ⚠️  {feedback['message']} ({feedback['duration_ms']}ms)")
+                return False
+            print(f"    💾 {feedback['message']} ({feedback['duration_ms']}ms)")
+        else:
+            # If no database, add to results for JSON output
+            location_results.append(job_details)
+        
+        job_title = job_details.get('job_title', job_details.get('title', 'N/A'))
+        company_name = job_details.get('company_name', job_details.get('company', 'N/A'))
+        print(f"    ✅ {job_title} at {company_name}")
+        return True
+    
     def search_jobs(self) -> List[Dict[str, Any]]:
         """
         Execute the complete job search pipeline using direct scrapers.
@@ -172,47 +209,39 @@ class JobSearchPipeline:
                     skipped_existing = 0
                     failed_scrapes = 0
                     
-                    for i, job_url in enumerate(job_links):
-                        print(f"  [SCRAPE] Processing job {i+1}/{len(job_links)}: {job_url}")
-                        
-                        # Check if job already exists in database
+                    # Skip jobs already in the database before fetching any details
+                    new_links = []
+                    for job_url in job_links:
                         if self.db and self.db.job_exists(source_url=job_url):
-                            print(f"    ⏭️  Job already exists in database, skipping...")
+                            print(f"    ⏭️  Job already exists in database, skipping: {job_url}")
                             skipped_existing += 1
-                            continue
-                        
+                        else:
+                            new_links.append(job_url)
+                    
+                    finished = 0
+                    
+                    def on_result(job_url, job_details):
+                        nonlocal successful_saves, failed_scrapes, finished
+                        finished += 1
                         try:
-                            job_details = self.linkedin_scraper.get_job_details(job_url)
-                            if job_details:
-                                # Add metadata
-                                job_details['source'] = 'linkedin'
-                                job_details['source_url'] = job_url
-                                job_details['scraped_at'] = time.strftime("%Y-%m-%d %H:%M:%S")
-                                  # Save to database immediately with detailed feedback
-                                if self.db:
-                                    feedback = self.db.add_job_with_immediate_feedback(job_details)
-                                    if feedback["success"]:
-                                        successful_saves += 1
-                                        print(f"    💾 {feedback['message']} ({feedback['duration_ms']}ms)")
-                                    else:
-                                        print(f"    ⚠️  {feedback['message']} ({feedback['duration_ms']}ms)")
-                                        failed_scrapes += 1
-                                else:
-                                    # If no database, add to results for JSON output
-                                    location_results.append(job_details)
-                                
-                                job_title = job_details.get('job_title', job_details.get('title', 'N/A'))
-                                company_name = job_details.get('company_name', job_details.get('company', 'N/A'))
-                                print(f"    ✅ {job_title} at {company_name}")
-                            else:
-                                print(f"    ❌ Failed to get job details")
-                                failed_scrapes += 1
+                            stored = self._store_job_details(job_url, job_details, location_results)
                         except Exception as e:
-                            print(f"    ❌ Error getting job details: {str(e)}")
+                            print(f"    ❌ Error storing job details: {str(e)}")
+                            stored = False
+                        if not stored:
                             failed_scrapes += 1
-                        
-                        # Small delay between requests to avoid rate limiting
-                        time.sleep(2)
+                        elif self.db:
+                            successful_saves += 1
+                    
+                    # Details are fetched concurrently over the scraper's pool of tabs
+                    # and each job is stored as soon as it completes
+                    print(f"  [SCRAPE] Fetching details for {len(new_links)} jobs")
+                    try:
+                        self.linkedin_scraper.get_jobs_details(new_links, on_result=on_result)
+                    except Exception as e:
+                        # Jobs stored so far are kept; the rest count as failed
+                        print(f"    ❌ Error getting job details: {str(e)}")
+                        failed_scrapes += len(new_links) - finished
                     
                     # Print summary for this location
                     print(f"  [SUMMARY] Location {location}: {successful_saves} saved, {skipped_existing} skipped, {failed_scrapes} failed")
@@ -339,58 +368,42 @@ class JobSearchPipeline:
                     skipped_existing = 0
                     failed_scrapes = 0
                     
-                    for i, job_url in enumerate(job_links):
-                        print(f"  [SCRAPE] Processing job {i+1}/{len(job_links)}: {job_url}")
-                        
-                        # Check if job already exists in database
+                    # Skip jobs already in the database before fetching any details
+                    new_links = []
+                    for job_url in job_links:
                         if self.db and self.db.job_exists(source_url=job_url):
-                            print(f"    ⏭️  Job already exists in database, skipping...")
+                            print(f"    ⏭️  Job already exists in database, skipping: {job_url}")
                             skipped_existing += 1
-                            continue
-                        
+                        else:
+                            new_links.append(job_url)
+                    
+                    finished = 0
+                    
+                    def on_result(job_url, job_details):
+                        nonlocal successful_saves, failed_scrapes, finished
+                        finished += 1
                         try:
-                            # Use appropriate method based on scraper type
-                            if self.async_mode and hasattr(self.linkedin_scraper, 'collect_job_links'):
-                                # Async scraper
-                                job_details = await self.linkedin_scraper.get_job_details(job_url)
-                            else:
-                                # Sync scraper fallback
-                                job_details = self.linkedin_scraper.get_job_details(job_url)
-                                
-                            if job_details:
-                                # Add metadata
-                                job_details['source'] = 'linkedin'
-                                job_details['source_url'] = job_url
-                                job_details['scraped_at'] = time.strftime("%Y-%m-%d %H:%M:%S")
-                                
-                                # Save to database immediately with detailed feedback
-                                if self.db:
-                                    feedback = self.db.add_job_with_immediate_feedback(job_details)
-                                    if feedback["success"]:
-                                        successful_saves += 1
-                                        print(f"    💾 {feedback['message']} ({feedback['duration_ms']}ms)")
-                                    else:
-                                        print(f"    ⚠️  {feedback['message']} ({feedback['duration_ms']}ms)")
-                                        failed_scrapes += 1
-                                else:
-                                    # If no database, add to results for JSON output
-                                    location_results.append(job_details)
-                                
-                                job_title = job_details.get('job_title', job_details.get('title', 'N/A'))
-                                company_name = job_details.get('company_name', job_details.get('company', 'N/A'))
-                                print(f"    ✅ {job_title} at {company_name}")
-                            else:
-                                print(f"    ❌ Failed to get job details")
-                                failed_scrapes += 1
+                            stored = self._store_job_details(job_url, job_details, location_results)
                         except Exception as e:
-                            print(f"    ❌ Error getting job details: {str(e)}")
+                            print(f"    ❌ Error storing job details: {str(e)}")
+                            stored = False
+                        if not stored:
                             failed_scrapes += 1
-                        
-                        # Small delay between requests to avoid rate limiting
+                        elif self.db:
+                            successful_saves += 1
+                    
+                    # Details are fetched concurrently over the scraper's pool of tabs
+                    # and each job is stored as soon as it completes
+                    print(f"  [SCRAPE] Fetching details for {len(new_links)} jobs")
+                    try:
                         if self.async_mode:
-                            await asyncio.sleep(2)
+                            await self.linkedin_scraper.get_jobs_details(new_links, on_result=on_result)
                         else:
-                            time.sleep(2)
+                            self.linkedin_scraper.get_jobs_details(new_links, on_result=on_result)
+                    except Exception as e:
+                        # Jobs stored so far are kept; the rest count as failed
+                        print(f"    ❌ Error getting job details: {str(e)}")
+                        failed_scrapes += len(new_links) - finished
                     
                     # Print summary for this location
                     print(f"  [SUMMARY] Location {location}: {successful_saves} saved, {skipped_existing} skipped, {failed_scrapes} failed")
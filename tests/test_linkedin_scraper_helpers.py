@@ -0,0 +1,350 @@
+"""
+Unit tests for the pure helpers of the LinkedIn scraper.
+
+Covers filter parameter building, retry and throttling helpers, the regexes
+used to read LinkedIn pages and the in-memory caches. No browser is started.
+
+Run with: python -m pytest tests/test_linkedin_scraper_helpers.py
+"""
+
+import asyncio
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+
+from src.scraper.search.linkedin_scraper import config, filters, scraper, utils
+from src.scraper.search.linkedin_scraper.browser import NON_DIGIT_RE, RESULTS_COUNT_RE, PagePool
+from src.scraper.search.linkedin_scraper.cli import UNSAFE_FILENAME_CHARS_RE
+from src.scraper.search.linkedin_scraper.extractors.job_links import PAGE_STATE_RE
+from src.scraper.search.linkedin_scraper.filters import FilterManager, resolve_experience_levels
+from src.scraper.search.linkedin_scraper.utils import (
+    JOB_ID_URL_RE,
+    AdaptiveThrottle,
+    async_retry,
+    is_retryable_response,
+)
+
+
+@pytest.fixture
+def recorded_sleeps(monkeypatch):
+    """Replace asyncio.sleep in utils with one that only records the delays."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(utils.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+# --- Filters ---
+
+def test_resolve_experience_levels_drops_duplicates_and_reports_invalid():
+    levels, invalid = resolve_experience_levels(("Entry_Level", "mid_senior", "mid_senior_level", "guru"))
+    assert levels == (("Entry_Level", "2"), ("mid_senior", "4"))
+    assert invalid == ("guru",)
+
+
+def test_build_filter_params():
+    manager = FilterManager(SimpleNamespace(url=""))
+    assert manager.build_filter_params(["entry_level", "associate"], "past_week") == {
+        "f_E": "2,3",
+        "f_TPR": "r604800",
+    }
+    assert manager.build_filter_params(["guru"], "any_time") == {}
+    assert manager.build_filter_params(None, "yesterday") == {}
+
+
+def test_url_filters_applied():
+    params = {"f_E": "2,3", "f_TPR": "r604800"}
+    kept = FilterManager(SimpleNamespace(url="https://www.linkedin.com/jobs/search/?keywords=x&f_E=2%2C3&f_TPR=r604800"))
+    dropped = FilterManager(SimpleNamespace(url="https://www.linkedin.com/jobs/search/?keywords=x&f_E=2%2C3"))
+    assert kept.url_filters_applied(params)
+    assert not dropped.url_filters_applied(params)
+
+
+def test_resolved_selector_cache_evicts_least_recent_host(monkeypatch):
+    monkeypatch.setattr(FilterManager, "_resolved_selectors_by_host", OrderedDict())
+    monkeypatch.setattr(filters, "SELECTOR_CACHE_HOSTS", 2)
+    page = SimpleNamespace(url="https://a.example/")
+    manager = FilterManager(page)
+
+    manager._resolved_selectors()["button"] = "#a"
+    page.url = "https://b.example/"
+    manager._resolved_selectors()
+    page.url = "https://a.example/jobs"
+    assert manager._resolved_selectors() == {"button": "#a"}
+    page.url = "https://c.example/"
+    manager._resolved_selectors()
+
+    assert list(FilterManager._resolved_selectors_by_host) == ["a.example", "c.example"]
+
+
+# --- Retry and throttling ---
+
+def test_async_retry_retries_playwright_errors(recorded_sleeps):
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise PlaywrightError("net::ERR_CONNECTION_RESET")
+        return "done"
+
+    assert asyncio.run(async_retry(flaky, attempts=4, base=1.0, cap=1.5, jitter=False)) == "done"
+    assert len(calls) == 3
+    assert recorded_sleeps == [1.0, 1.5]
+
+
+def test_async_retry_raises_after_last_attempt(recorded_sleeps):
+    async def broken():
+        raise PlaywrightError("Timeout 15000ms exceeded")
+
+    with pytest.raises(PlaywrightError):
+        asyncio.run(async_retry(broken, attempts=2, base=0.5, jitter=False))
+    assert recorded_sleeps == [0.5]
+
+
+def test_async_retry_returns_last_result_when_retry_if_keeps_failing(recorded_sleeps):
+    responses = iter([SimpleNamespace(status=503), SimpleNamespace(status=429)])
+
+    async def goto():
+        return next(responses)
+
+    result = asyncio.run(async_retry(goto, attempts=2, jitter=False, retry_if=is_retryable_response))
+    assert result.status == 429
+    assert len(recorded_sleeps) == 1
+
+
+def test_is_retryable_response():
+    assert is_retryable_response(SimpleNamespace(status=429))
+    assert is_retryable_response(SimpleNamespace(status=502))
+    assert not is_retryable_response(SimpleNamespace(status=200))
+    assert not is_retryable_response(SimpleNamespace(status=404))
+    assert not is_retryable_response(None)
+
+
+def test_adaptive_throttle_ewma():
+    throttle = AdaptiveThrottle(target_delay=4.0, smoothing=0.5, jitter=0.0)
+    throttle.record(2.0)
+    assert throttle.ewma_latency == 2.0
+    throttle.record(4.0)
+    assert throttle.ewma_latency == 3.0
+
+
+def test_adaptive_throttle_waits_for_the_rest_of_the_interval(recorded_sleeps):
+    throttle = AdaptiveThrottle(target_delay=4.0, smoothing=0.5, jitter=0.0)
+    asyncio.run(throttle.wait())
+    throttle.record(3.0)
+    asyncio.run(throttle.wait())
+    throttle.record(10.0)
+    asyncio.run(throttle.wait())
+    assert recorded_sleeps == [4.0, 1.0]
+
+
+def test_adaptive_throttle_jitter_stays_in_bounds(recorded_sleeps):
+    throttle = AdaptiveThrottle(target_delay=2.0, jitter=0.2)
+    for _ in range(20):
+        asyncio.run(throttle.wait())
+    assert all(1.6 <= delay <= 2.4 for delay in recorded_sleeps)
+
+
+# --- Page pool ---
+
+def test_env_int_falls_back_on_invalid_values(monkeypatch):
+    monkeypatch.setenv("LINKEDIN_TEST_SIZE", "3")
+    assert config._env_int("LINKEDIN_TEST_SIZE", 1) == 3
+    monkeypatch.setenv("LINKEDIN_TEST_SIZE", "three")
+    assert config._env_int("LINKEDIN_TEST_SIZE", 1) == 1
+    monkeypatch.delenv("LINKEDIN_TEST_SIZE")
+    assert config._env_int("LINKEDIN_TEST_SIZE", 1) == 1
+
+
+class FakeTab:
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowserManager:
+    def __init__(self):
+        self.opened = []
+
+    async def new_page(self):
+        self.opened.append(FakeTab(len(self.opened)))
+        return self.opened[-1]
+
+
+def test_page_pool_reuses_tabs_up_to_max_size():
+    async def run():
+        manager = FakeBrowserManager()
+        pool = PagePool(manager, min_size=1, max_size=2)
+        first, second = await pool.acquire(), await pool.acquire()
+        pool.release(first)
+        third = await pool.acquire()
+        return manager, first, second, third
+
+    manager, first, second, third = asyncio.run(run())
+    assert len(manager.opened) == 2
+    assert third is first and second is not first
+
+
+def test_page_pool_replaces_closed_tabs():
+    discarded = []
+
+    async def run():
+        manager = FakeBrowserManager()
+        pool = PagePool(manager, min_size=1, max_size=1, on_discard=discarded.append)
+        first = await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        first.closed = True
+        pool.release(first)
+        replacement = await waiter
+        # A tab closed while idle on the free list is skipped as well
+        pool.release(replacement)
+        replacement.closed = True
+        return pool, first, replacement, await pool.acquire()
+
+    pool, first, replacement, last = asyncio.run(run())
+    assert discarded == [first, replacement]
+    assert replacement is not first and not last.is_closed()
+    assert pool._opened == [last] and pool._size == 1
+
+
+# --- Regexes ---
+
+@pytest.mark.parametrize("url, job_id", [
+    ("https://www.linkedin.com/jobs/view/4243594281/", "4243594281"),
+    ("https://www.linkedin.com/jobs/view/4243594281/?refId=abc&trackingId=x", "4243594281"),
+    ("https://www.linkedin.com/jobs/search/?keywords=python&currentJobId=4243594281", "4243594281"),
+    ("https://www.linkedin.com/jobs/collections/similar-jobs/?currentJobId=42", "42"),
+])
+def test_job_id_url_re(url, job_id):
+    assert JOB_ID_URL_RE.search(url)[1] == job_id
+
+
+def test_job_id_url_re_ignores_other_ids():
+    assert JOB_ID_URL_RE.search("https://www.linkedin.com/jobs/search/?referenceJobId=42") is None
+
+
+@pytest.mark.parametrize("text, current, total", [
+    ("Page 1 of 30", "1", "30"),
+    ("Page 2 of 40 · 1,000 results", "2", "40"),
+    ("page  3  of  3", "3", "3"),
+])
+def test_page_state_re(text, current, total):
+    match = PAGE_STATE_RE.search(text)
+    assert (match["current"], match["total"]) == (current, total)
+
+
+@pytest.mark.parametrize("text, count", [
+    ("1,234 results", 1234),
+    ("1.234 Results", 1234),
+    ("Python Developer in Berlin 87 results", 87),
+])
+def test_results_count_re(text, count):
+    assert int(NON_DIGIT_RE.sub("", RESULTS_COUNT_RE.search(text)[1])) == count
+
+
+def test_unsafe_filename_chars_re():
+    assert UNSAFE_FILENAME_CHARS_RE.sub("", "C++ / Rust: Dev-Ops_Lead?") == "C  Rust Dev-Ops_Lead"
+    assert UNSAFE_FILENAME_CHARS_RE.sub("", "München, Deutschland") == "München Deutschland"
+
+
+# --- Job details cache ---
+
+@pytest.fixture
+def details_scraper(monkeypatch):
+    """LinkedInScraper whose page scraping is replaced by a counter."""
+    monkeypatch.setenv("LINKEDIN_USERNAME", "user@example.com")
+    monkeypatch.setenv("LINKEDIN_PASSWORD", "secret")
+    instance = scraper.LinkedInScraper(headless=True)
+    instance.scraped = []
+
+    async def fake_scrape(page, extractor, job_url):
+        instance.scraped.append(job_url)
+        if "fail" in job_url:
+            return {"url": job_url, "error": "boom"}
+        return {"url": job_url, "related_jobs": [{"title": "Data Engineer"}]}
+
+    monkeypatch.setattr(instance, "_scrape_job_details_on_page", fake_scrape)
+    return instance
+
+
+def get_details(instance, job_url):
+    return asyncio.run(instance._get_job_details_on_page(None, None, job_url))
+
+
+def test_details_cache_shares_entries_between_url_variants(details_scraper):
+    get_details(details_scraper, "https://www.linkedin.com/jobs/view/1/")
+    get_details(details_scraper, "https://www.linkedin.com/jobs/view/1/?trackingId=x")
+    get_details(details_scraper, "https://www.linkedin.com/jobs/search/?currentJobId=1")
+    assert details_scraper.scraped == ["https://www.linkedin.com/jobs/view/1/"]
+
+
+def test_details_cache_returns_copies(details_scraper):
+    first = get_details(details_scraper, "https://www.linkedin.com/jobs/view/1/")
+    first["related_jobs"][0]["title"] = "changed"
+    second = get_details(details_scraper, "https://www.linkedin.com/jobs/view/1/")
+    second["related_jobs"].clear()
+    third = get_details(details_scraper, "https://www.linkedin.com/jobs/view/1/")
+    assert third["related_jobs"] == [{"title": "Data Engineer"}]
+
+
+def test_details_cache_skips_errors(details_scraper):
+    get_details(details_scraper, "https://www.linkedin.com/jobs/view/9/?fail")
+    get_details(details_scraper, "https://www.linkedin.com/jobs/view/9/?fail")
+    assert len(details_scraper.scraped) == 2
+
+
+def test_details_cache_evicts_least_recently_used(details_scraper, monkeypatch):
+    monkeypatch.setattr(scraper, "JOB_DETAILS_CACHE_SIZE", 2)
+    for job_id in ("1", "2", "1", "3"):
+        get_details(details_scraper, f"https://www.linkedin.com/jobs/view/{job_id}/")
+    assert list(details_scraper._details_cache) == ["1", "3"]
+
+    get_details(details_scraper, "https://www.linkedin.com/jobs/view/2/")
+    assert details_scraper.scraped[-1] == "https://www.linkedin.com/jobs/view/2/"
+    assert list(details_scraper._details_cache) == ["3", "2"]
+
+
+def test_jobs_details_dedupes_jobs_and_skips_tabs_on_cache_hits(
+    details_scraper, monkeypatch
+):
+    acquired = []
+
+    async def fake_acquire():
+        acquired.append(object())
+        return acquired[-1]
+
+    async def noop(*args):
+        return None
+
+    details_scraper.page_pool = SimpleNamespace(
+        max_size=4, acquire=fake_acquire, release=lambda page: None
+    )
+    details_scraper.auth_manager = SimpleNamespace(ensure_login=noop)
+    monkeypatch.setattr(details_scraper, "_ensure_setup", noop)
+    monkeypatch.setattr(scraper, "JobDetailsExtractor", lambda page, timeout: None)
+
+    urls = [
+        "https://www.linkedin.com/jobs/view/1/",
+        "https://www.linkedin.com/jobs/view/1/?trackingId=x",
+        "https://www.linkedin.com/jobs/view/2/",
+    ]
+    first = asyncio.run(details_scraper.get_jobs_details(urls))
+    assert details_scraper.scraped == [urls[0], urls[2]]
+    assert first[0] == first[1] and first[0] is not first[1]
+    assert details_scraper._details_in_flight == {}
+
+    asyncio.run(details_scraper.get_jobs_details(urls[:1]))
+    assert len(acquired) == 2